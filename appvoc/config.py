@@ -19,22 +19,73 @@
 """Configuration File Classes."""
 from abc import ABC, abstractmethod
 import os
+import threading
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+from appvoc.infrastructure.file.io import IOService
+
 # ------------------------------------------------------------------------------------------------ #
 load_dotenv()
 
 
+# ------------------------------------------------------------------------------------------------ #
+class ConfigCache:
+    """Process-wide cache of parsed configuration files.
+
+    Each file is parsed once and shared by all configuration objects reading it. The file's
+    modification time is checked on each read, and the file is parsed again if it has changed.
+    """
+
+    __files = {}  # Maps filepath to a (mtime, content) tuple.
+    __lock = threading.Lock()
+
+    @classmethod
+    def read(cls, filepath: str) -> dict:
+        """Returns the parsed content of a configuration file.
+
+        Args:
+            filepath (str): Path to the configuration file.
+        """
+        mtime = os.stat(filepath).st_mtime_ns
+        entry = cls.__files.get(filepath)
+        if entry is None or entry[0] != mtime:
+            with cls.__lock:
+                entry = cls.__files.get(filepath)
+                if entry is None or entry[0] != mtime:
+                    entry = (mtime, IOService.read(filepath))
+                    cls.__files[filepath] = entry
+        return entry[1]
+
+    @classmethod
+    def clear(cls) -> None:
+        """Empties the cache, so that each file is parsed again on its next read."""
+        with cls.__lock:
+            cls.__files.clear()
+
+
 # ------------------------------------------------------------------------------------------------ #
 class Config(ABC):
+    """Base class for configurations read from a section of the persistence configuration file.
+
+    Subclasses designate the section. Its content is served from the ConfigCache, so
+    instantiating a configuration does not parse the file.
+    """
+
+    _section: str = None
+
     def __init__(self) -> None:
         self._mode = os.getenv("MODE")
+        self._config_file = os.getenv("PERSISTENCE_CONFIG")
 
     @property
     def mode(self) -> str:
         return self._mode
 
+    @property
+    def _config(self) -> dict:
+        return ConfigCache.read(self._config_file)[self._section]
+
     @abstractmethod
     def get_config(self, key: str) -> str:
         """Returns the configuration for the given key
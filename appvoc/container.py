@@ -31,6 +31,7 @@ from appvoc.data.repo.project import AppDataProjectRepo
 from appvoc.data.repo.rating import RatingRepo
 from appvoc.data.repo.request import ReviewRequestRepo
 from appvoc.data.repo.review import ReviewRepo
+from appvoc.data.repo.schema import init_schema
 from appvoc.data.repo.uow import UoW
 from appvoc.infrastructure.cloud.amazon import AWS
 from appvoc.infrastructure.cloud.config import CloudConfig
@@ -41,8 +42,9 @@ from appvoc.infrastructure.file.config import FileConfig
 from appvoc.infrastructure.file.io import IOService
 from appvoc.infrastructure.web.adapter import TimeoutHTTPAdapter
 from appvoc.infrastructure.web.asession import ASessionHandler
-from appvoc.infrastructure.web.base import PROXY_SERVERS
 from appvoc.infrastructure.web.headers import AppleStoreFrontHeader, BrowserHeader
+from appvoc.infrastructure.web.limiter import AIMDLimiter
+from appvoc.infrastructure.web.proxy import ProxyPool
 from appvoc.infrastructure.web.session import SessionHandler
 from appvoc.infrastructure.web.throttle import AThrottle, LatencyThrottle
 
@@ -73,6 +75,8 @@ class FileContainer(containers.DeclarativeContainer):
 class PersistenceContainer(containers.DeclarativeContainer):
     db = providers.Singleton(MySQLDatabase, config=DatabaseConfig)
 
+    schema = providers.Resource(init_schema, database=db)
+
     app_repo = providers.Singleton(AppDataRepo, database=db, config=FileConfig)
     review_repo = providers.Singleton(ReviewRepo, database=db, config=FileConfig)
     rating_repo = providers.Singleton(RatingRepo, database=db, config=FileConfig)
@@ -131,6 +135,9 @@ class WebSessionContainer(containers.DeclarativeContainer):
         TimeoutHTTPAdapter,
         timeout=config.web.session.timeout,
         max_retries=retry,
+        pool_connections=config.web.session.pool.connections,
+        pool_maxsize=config.web.session.pool.maxsize,
+        pool_block=config.web.session.pool.block,
     )
 
     throttle = providers.Resource(
@@ -139,6 +146,7 @@ class WebSessionContainer(containers.DeclarativeContainer):
         min_delay=config.web.session.throttle.min_delay,
         max_delay=config.web.session.throttle.max_delay,
         verbose=config.web.session.throttle.verbose,
+        latency_buffer_size=config.web.session.throttle.latency_buffer_size,
     )
     athrottle = providers.Resource(
         AThrottle,
@@ -152,6 +160,33 @@ class WebSessionContainer(containers.DeclarativeContainer):
         tolerance=config.web.async_session.athrottle.tolerance,
         rate=config.web.async_session.athrottle.rate,
         verbose=config.web.async_session.athrottle.verbose,
+        latency_buffer_size=config.web.async_session.athrottle.latency_buffer_size,
+    )
+
+    limiter = providers.Resource(
+        AIMDLimiter,
+        initial=config.web.async_session.limiter.initial,
+        min_limit=config.web.async_session.limiter.min_limit,
+        max_limit=config.web.async_session.concurrency,
+        increase=config.web.async_session.limiter.increase,
+        decrease=config.web.async_session.limiter.decrease,
+        latency_tolerance=config.web.async_session.limiter.latency_tolerance,
+        window=config.web.async_session.limiter.window,
+        latency_buffer_size=config.web.async_session.limiter.latency_buffer_size,
+        verbose=config.web.async_session.limiter.verbose,
+    )
+
+    proxies = providers.Resource(
+        ProxyPool,
+        rate=config.web.proxy.rate,
+        burst=config.web.proxy.burst,
+        failure_threshold=config.web.proxy.failure_threshold,
+        max_error_rate=config.web.proxy.max_error_rate,
+        min_requests=config.web.proxy.min_requests,
+        ejection_period=config.web.proxy.ejection_period,
+        max_ejection_period=config.web.proxy.max_ejection_period,
+        alpha=config.web.proxy.alpha,
+        verbose=config.web.proxy.verbose,
     )
 
     browser_headers = providers.Resource(BrowserHeader)
@@ -164,6 +199,8 @@ class WebSessionContainer(containers.DeclarativeContainer):
         throttle=throttle,
         headers=browser_headers,
         session_retries=config.web.session.retries,
+        persistent=config.web.session.persistent,
+        proxies=proxies,
     )
 
     asession = providers.Resource(
@@ -173,7 +210,13 @@ class WebSessionContainer(containers.DeclarativeContainer):
         max_concurrency=config.web.async_session.concurrency,
         retries=config.web.async_session.retries,
         timeout=config.web.async_session.timeout,
-        proxies=PROXY_SERVERS,
+        proxies=proxies,
+        limit=config.web.async_session.connector.limit,
+        limit_per_host=config.web.async_session.connector.limit_per_host,
+        ttl_dns_cache=config.web.async_session.connector.ttl_dns_cache,
+        keepalive_timeout=config.web.async_session.connector.keepalive_timeout,
+        transport=config.web.async_session.transport,
+        limiter=limiter,
     )
 
 
@@ -178,9 +178,6 @@ class AppDataController:
         self._uow.app_project_repo.update(data=project)
         self._uow.save()
 
-        # Run dedup
-        self._uow.app_repo.dedup()
-
         # If backing up,  save the repo to archive.
         if self._backup_to_file:
             self._uow.app_repo.export()
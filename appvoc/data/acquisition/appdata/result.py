@@ -18,12 +18,28 @@
 # ================================================================================================ #
 """Defines the Response Object for AppData Requests"""
 from dataclasses import dataclass
-from datetime import datetime
 
 import pandas as pd
 import requests
 
 from appvoc.data.acquisition.base import Response
+from appvoc.data.acquisition.builder import ColumnarBuilder
+from appvoc.infrastructure.web.decode import decode
+
+# ------------------------------------------------------------------------------------------------ #
+COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "category_id",
+    "category",
+    "price",
+    "developer_id",
+    "developer",
+    "rating",
+    "ratings",
+    "released",
+)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -37,26 +53,29 @@ class AppDataResponse(Response):
 
     def add_response(self, response: requests.Response, page: int, pages: int) -> None:
         """Adds result content to the instance"""
-        result_list = []
-        results = response.json()["results"]
-        for result in results:
+        builder = ColumnarBuilder(
+            columns=COLUMNS,
+            dtypes={"category_id": "category", "category": "category"},
+            dates=("released",),
+        )
+        for result in decode(response)["results"]:
             self.results += 1
-            app = {}
-            app["id"] = result["trackId"]
-            app["name"] = result["trackName"]
-            app["description"] = result["description"].strip()
-            app["category_id"] = result["primaryGenreId"]
-            app["category"] = result["primaryGenreName"]
-            app["price"] = result.get("price", 0)
-            app["developer_id"] = result["artistId"]
-            app["developer"] = result["artistName"]
-            app["rating"] = result["averageUserRating"]
-            app["ratings"] = result["userRatingCount"]
-            app["released"] = datetime.strptime(
-                result["releaseDate"], "%Y-%m-%dT%H:%M:%f%z"
+            builder.append(
+                (
+                    result["trackId"],
+                    result["trackName"],
+                    result["description"].strip(),
+                    result["primaryGenreId"],
+                    result["primaryGenreName"],
+                    result.get("price", 0),
+                    result["artistId"],
+                    result["artistName"],
+                    result["averageUserRating"],
+                    result["userRatingCount"],
+                    result["releaseDate"],
+                )
             )
-            result_list.append(app)
-        self.content = pd.DataFrame(data=result_list)
-        self.size = self.content.memory_usage(deep=True)
+        self.content = builder.to_frame()
+        self.size = int(self.content.memory_usage(deep=True).sum())
         self.page = page
         self.pages = pages
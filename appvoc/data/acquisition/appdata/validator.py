@@ -69,17 +69,18 @@ class AppDataValidator(Validator):
 
     def _validate_response_content(self) -> bool:  # pragma: no cover
         try:
-            if not isinstance(self.response.json(), dict):
+            content = self._json()
+            if not isinstance(content, dict):
                 self.data_error = True
-                self.msg = f"Invalid Response: Response json is of type {type(self.response.json())}."
+                self.msg = f"Invalid Response: Response json is of type {type(content)}."
                 self._logger.debug(msg=self.msg)
                 self.valid = False
-            elif len(self.response.json()["results"]) == 0:
+            elif len(content["results"]) == 0:
                 self.data_error = True
                 self.msg = "Invalid Response: Response json 'results' has zero length."
                 self._logger.debug(msg=self.msg)
                 self.valid = False
-        except requests.JSONDecodeError:
+        except ValueError:  # Raised by the decoder on invalid JSON
             self.valid = False
 
         return self.valid
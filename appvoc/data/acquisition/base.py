@@ -20,6 +20,8 @@ from __future__ import annotations
 
 import logging
 import os
+import socket
+import time
 from abc import ABC, abstractclassmethod, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
@@ -31,20 +33,102 @@ from dotenv import load_dotenv
 
 from appvoc.data.repo.uow import UoW
 from appvoc.domain.entity import Entity
+from appvoc.infrastructure.web.decode import decode
 
 
 # ------------------------------------------------------------------------------------------------ #
 class Director(ABC):
-    """Iterator serving jobs to the controller."""
+    """Iterator serving jobs to the controller.
 
-    def __init__(self, uow: UoW) -> None:
+    Jobs are leased to this worker, identified by host and process id, so that directors in
+    other processes or on other hosts do not serve the same job. The lease is renewed by
+    heartbeats while the job runs, and lapses if the worker dies, freeing the job to be
+    claimed again. Once a heartbeat finds the lease lost, 'lost' is True until the next
+    claim, and the controller abandons the job run rather than ending the job.
+
+    Args:
+        uow (UoW): Unit of Work containing the job repository.
+        lease (int): Duration of a job lease in seconds. Default = 600
+    """
+
+    def __init__(self, uow: UoW, lease: int = 600) -> None:
         self._uow = uow
+        self._lease = lease
+        self._worker = f"{socket.gethostname()}:{os.getpid()}"
+        self._job = None
+        self._renewed = None
+        self._lost = False
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
+    @property
+    def lost(self) -> bool:
+        """Returns True if the lease on the current job was lost."""
+        return self._lost
+
     @abstractmethod
     def next(self) -> JobRun:  # noqa
         """Sets the next job and returns an instance of this iterator"""
 
+    def claim(self, controller: str) -> Job:
+        """Leases the next available job for the controller to this worker.
+
+        Args:
+            controller (str): Name of the controller whose jobs are served.
+        """
+        self._job = self._uow.job_repo.claim(
+            controller=controller, worker=self._worker, lease=self._lease
+        )
+        self._renewed = time.monotonic()
+        self._lost = False
+        return self._job
+
+    def end_job(self, completed: datetime) -> bool:
+        """Completes the current job, provided its lease is still held.
+
+        Args:
+            completed (datetime): Time at which the job was completed.
+
+        Returns: False if the lease was lost, leaving the job to the worker now holding it.
+        """
+        if self._job is None:
+            return False
+        ended = self._uow.job_repo.complete(job=self._job, completed=completed)
+        if ended:
+            self._job = None
+        else:
+            msg = f"Lease on job {self._job.id} was lost. The job was not completed."
+            self._logger.warning(msg)
+            self._lost = True
+        return ended
+
+    def release(self) -> None:
+        """Releases the lease on the current job, if held, e.g. when the worker is stopped."""
+        if self._job is not None and self._uow.job_repo.release(job=self._job):
+            msg = f"Lease on job {self._job.id} released by {self._worker}."
+            self._logger.info(msg)
+        self._job = None
+
+    def heartbeat(self) -> bool:
+        """Renews the lease on the current job once a third of the lease has elapsed.
+
+        Called by the controller for every result, valid or not, so a streak of failed
+        requests does not let the lease lapse unnoticed. Buffered rows that have reached the
+        age threshold are written first, so rows are not held while no more arrive.
+
+        Returns False if the lease was lost, i.e. it expired and the job was claimed by
+        another worker, or the job was completed elsewhere.
+        """
+        self._uow.flush_due()
+        if self._job is None or time.monotonic() - self._renewed < self._lease / 3:
+            return True
+        renewed = self._uow.job_repo.renew(job=self._job, lease=self._lease)
+        self._renewed = time.monotonic()
+        if not renewed:
+            msg = f"Lease on job {self._job.id} held by {self._job.leased_by} was lost."
+            self._logger.warning(msg)
+            self._lost = True
+        return renewed
+
 
 # ------------------------------------------------------------------------------------------------ #
 class Controller(ABC):
@@ -72,6 +156,30 @@ class Controller(ABC):
     def end_jobrun(self, jobrun: JobRun) -> None:
         """Ends a job run"""
 
+    def abandon_jobrun(self, jobrun: JobRun) -> None:
+        """Stops a job run whose lease was lost, leaving the job to the worker now holding it.
+
+        Results acquired so far and the incomplete job run are written, but the job is
+        neither ended nor released.
+
+        Args:
+            jobrun (JobRun): The current job run.
+        """
+        msg = f"Abandoning the job run for job {jobrun.jobid}, whose lease was lost."
+        self._logger.warning(msg)
+        self._director.update_jobrun(jobrun=jobrun)
+        self.release()
+
+    def release(self) -> None:
+        """Writes buffered results and releases the job in progress, for controllers served
+        by a Director, so that other workers may claim it."""
+        uow = getattr(self, "_uow", None)
+        if uow is not None:
+            uow.flush()
+        director = getattr(self, "_director", None)
+        if director is not None:
+            director.release()
+
 
 # ------------------------------------------------------------------------------------------------ #
 class Scraper(ABC):
@@ -105,6 +213,8 @@ class Job(Entity):
     category: str = None
     complete: bool = False
     completed: datetime = None
+    leased_by: str = None
+    lease_expires: datetime = None
 
     def __post_init__(self) -> None:
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
@@ -112,18 +222,29 @@ class Job(Entity):
     @classmethod
     def from_df(cls, df: pd.DataFrame) -> Job:
         df = df.iloc[0].T
+        completed = df["completed"]
+        if not pd.isnull(completed):
+            completed = datetime.strftime(completed, "%Y-%m-%d %H:%M:%S")
+        else:
+            completed = None
         return cls(
             id=df["id"],
             controller=df["controller"],
             category_id=df["category_id"],
             category=df["category"],
             complete=df["complete"],
-            completed=datetime.strftime(df["completed"], "%Y-%m-%d %H:%M:%S"),
+            completed=completed,
+            leased_by=None if pd.isnull(df.get("leased_by")) else df["leased_by"],
+            lease_expires=(
+                None if pd.isnull(df.get("lease_expires")) else df["lease_expires"]
+            ),
         )
 
     def end(self, completed: datetime) -> None:
         self.completed = completed
         self.complete = True
+        self.leased_by = None
+        self.lease_expires = None
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -210,6 +331,14 @@ class Validator(Entity):
     def is_valid(self, response: Any) -> bool:
         """Validates the response object"""
 
+    def _json(self) -> Any:
+        """Returns the decoded response body, shared with the response parsers.
+
+        The body is decoded on first access and cached on the response, so validation
+        and parsing decode each response once.
+        """
+        return decode(self.response)
+
     def _validate_status_code(self) -> bool:
         """Validates the response return code"""
         self.status_code = int(self.response.status_code)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/data/acquisition/builder.py                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 07:52:18 pm                                              #
+# Modified   : Saturday October 17th 2026 07:52:18 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Columnar Result Builder Module"""
+from __future__ import annotations
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# ------------------------------------------------------------------------------------------------ #
+# Timestamps in the App Store feeds are ISO 8601 with a UTC designator or offset. The local date
+# and time are parsed, as stored in the DATETIME columns of the database.
+ISO_DATETIME = "%Y-%m-%dT%H:%M:%S"
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ColumnarBuilder:
+    """Accumulates records into per-column lists and emits a typed DataFrame.
+
+    Records are appended as tuples of field values, in column order, avoiding a dictionary per
+    record. Values common to all records, such as the app to which a page of reviews belongs,
+    are supplied once when the DataFrame is built and stored as single-category categoricals.
+
+    Args:
+        columns (tuple): Names of the columns whose values are appended, in record order.
+        dtypes (dict): Data type by column, applied when the DataFrame is built. Optional.
+        dates (tuple): Columns containing ISO 8601 timestamps, converted when the DataFrame
+            is built. Unparseable timestamps become NaT. Optional.
+    """
+
+    def __init__(self, columns: tuple, dtypes: dict = None, dates: tuple = ()) -> None:
+        self._columns = tuple(columns)
+        self._dtypes = dtypes or {}
+        self._dates = tuple(dates)
+        self._values = tuple([] for _ in self._columns)
+
+    def __len__(self) -> int:
+        return len(self._values[0]) if self._values else 0
+
+    @property
+    def columns(self) -> tuple:
+        return self._columns
+
+    def append(self, record: tuple) -> None:
+        """Appends a record.
+
+        Args:
+            record (tuple): Field values in column order.
+        """
+        for values, value in zip(self._values, record):
+            values.append(value)
+
+    def to_frame(self, constants: dict = None) -> pd.DataFrame:
+        """Returns the records as a DataFrame.
+
+        Args:
+            constants (dict): Columns whose value is the same for every record, mapped to
+                the value. They precede the appended columns in the order given. Optional.
+        """
+        n = len(self)
+        data = {}
+        for column, value in (constants or {}).items():
+            data[column] = constant(value=value, n=n)
+        for column, values in zip(self._columns, self._values):
+            if column in self._dates:
+                data[column] = to_datetime(values)
+            elif column in self._dtypes:
+                data[column] = pd.Series(values, dtype=self._dtypes[column])
+            else:
+                data[column] = pd.Series(values)
+        return pd.DataFrame(data)
+
+    def clear(self) -> None:
+        """Empties the builder."""
+        self._values = tuple([] for _ in self._columns)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def constant(value: Any, n: int) -> pd.Categorical:
+    """Returns a categorical of length n holding a single value, stored once.
+
+    Args:
+        value (Any): The value. None yields a categorical of missing values.
+        n (int): Length of the categorical.
+    """
+    if value is None:
+        return pd.Categorical.from_codes(np.full(n, -1, dtype=np.int8), categories=[])
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[value])
+
+
+def to_datetime(values: list) -> pd.Series:
+    """Converts ISO 8601 timestamps to datetimes in a single vectorized operation.
+
+    Args:
+        values (list): ISO 8601 timestamp strings.
+    """
+    return pd.to_datetime(
+        pd.Series(values, dtype=object).str.slice(0, 19),
+        format=ISO_DATETIME,
+        errors="coerce",
+    )
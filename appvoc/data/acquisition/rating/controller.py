@@ -17,7 +17,9 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Rating Controller"""
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from dependency_injector.wiring import Provide, inject
@@ -28,8 +30,12 @@ from appvoc.data.acquisition.rating.director import RatingDirector
 from appvoc.data.acquisition.rating.job import RatingJobRun
 from appvoc.data.acquisition.rating.result import RatingResponse
 from appvoc.data.acquisition.rating.scraper import RatingScraper
+from appvoc.data.repo.predicate import Eq
 from appvoc.data.repo.uow import UoW
 
+# ------------------------------------------------------------------------------------------------ #
+APP_COLUMNS = ["id", "name", "category_id", "category"]
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                            APPSTORE APP RATING CONTROLLER                                        #
@@ -41,6 +47,11 @@ class RatingController(Controller):
         scraper (ReviewScraper): A scraper object that returns data from the target urls.
         uow (UnitofWork): Unit of Work class containing the app repo
         io (IOService): A file IO object.
+        pipelined (bool): If True, fetching, parsing and persisting run as concurrent stages
+            connected by bounded queues, and database writes are made from a worker thread.
+            Default is False.
+        queue_size (int): Maximum number of batches held between pipeline stages. When a
+            queue is full, the upstream stage waits. Default is 4.
 
     """
 
@@ -53,6 +64,8 @@ class RatingController(Controller):
         failure_threshold: int = 10,
         batchsize: int = 100,
         verbose: int = 10,
+        pipelined: bool = False,
+        queue_size: int = 4,
     ) -> None:
         super().__init__()
         self._scraper = scraper
@@ -61,6 +74,8 @@ class RatingController(Controller):
         self._director = director(uow=uow)
         self._batchsize = batchsize
         self._verbose = verbose
+        self._pipelined = pipelined
+        self._queue_size = queue_size
         self._batch = 0
         self._failures = 0
 
@@ -69,7 +84,10 @@ class RatingController(Controller):
     async def scrape(self) -> None:
         """Entry point for scraping operation"""
         if not super().is_locked():
-            await self._scrape()
+            if self._pipelined:
+                await self._scrape_pipelined()
+            else:
+                await self._scrape()
         else:  # pragma: no cover
             msg = f"Running {self.__class__.__name__} is not authorized at this time."
             self._logger.info(msg)
@@ -95,19 +113,145 @@ class RatingController(Controller):
                         msg = f"\nFailures exceeded the failure threshold. Ending job run for job {jobrun.jobid}.\n"
                         self._logger.exception(msg)
                         break
-            self.end_jobrun(jobrun=jobrun)
+                if not self._director.heartbeat():
+                    break
+            self._finish_jobrun(jobrun=jobrun)
+            jobrun = self._director.next()
+
+    async def _scrape_pipelined(self) -> None:
+        """Driver for the pipelined scraping operation.
+
+        Each job run is processed by three stages connected by bounded queues: the fetch
+        stage requests batches from the session handler, the parse stage converts them into
+        RatingResponse objects, and the write stage persists them in a worker thread. The
+        network is kept busy while the database write for the prior batch is in progress.
+        If a stage fails, the others are cancelled and the job is released.
+        """
+        jobrun = self._director.next()
+        while jobrun is not None:
+            jobrun = self.start_jobrun(jobrun=jobrun)
+            apps = self._get_apps(category_id=jobrun.category_id)
+            scraper = self._scraper(apps=apps, batch_size=self._batchsize)
+
+            fetched = asyncio.Queue(maxsize=self._queue_size)
+            parsed = asyncio.Queue(maxsize=self._queue_size)
+            stop = asyncio.Event()
+
+            # A single worker serializes writes on the database connection.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                stages = [
+                    asyncio.create_task(
+                        self._fetch_stage(scraper=scraper, fetched=fetched, stop=stop)
+                    ),
+                    asyncio.create_task(
+                        self._parse_stage(
+                            scraper=scraper, fetched=fetched, parsed=parsed
+                        )
+                    ),
+                    asyncio.create_task(
+                        self._write_stage(
+                            jobrun=jobrun, parsed=parsed, stop=stop, executor=executor
+                        )
+                    ),
+                ]
+                try:
+                    await asyncio.gather(*stages)
+                except BaseException:
+                    # The surviving stages would block forever on the queues.
+                    for stage in stages:
+                        stage.cancel()
+                    await asyncio.gather(*stages, return_exceptions=True)
+                    self.release()
+                    raise
+                finally:
+                    # Returns the worker thread's connection to the pool before it exits.
+                    await asyncio.get_running_loop().run_in_executor(
+                        executor, self._uow.database.close
+                    )
+            self._finish_jobrun(jobrun=jobrun)
             jobrun = self._director.next()
 
+    async def _fetch_stage(
+        self, scraper: RatingScraper, fetched: asyncio.Queue, stop: asyncio.Event
+    ) -> None:
+        """Requests batches and places the raw responses on the fetched queue."""
+        batches = scraper.fetch()
+        try:
+            async for batch, responses in batches:
+                if stop.is_set():
+                    break
+                await fetched.put((batch, responses))
+        finally:
+            await batches.aclose()
+        await fetched.put(None)
+
+    async def _parse_stage(
+        self, scraper: RatingScraper, fetched: asyncio.Queue, parsed: asyncio.Queue
+    ) -> None:
+        """Parses raw responses from the fetched queue into results on the parsed queue."""
+        while True:
+            item = await fetched.get()
+            if item is None:
+                break
+            batch, responses = item
+            await parsed.put(scraper.parse(batch=batch, responses=responses))
+        await parsed.put(None)
+
+    async def _write_stage(
+        self,
+        jobrun: RatingJobRun,
+        parsed: asyncio.Queue,
+        stop: asyncio.Event,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        """Persists results from the parsed queue in the worker thread.
+
+        Once the failure threshold is exceeded, or the lease on the job is lost, the fetch
+        stage is signalled to stop and the remaining results are drained without being
+        persisted.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            result = await parsed.get()
+            if result is None:
+                break
+            if stop.is_set():
+                continue
+            if result.is_valid():
+                self._failures = 0
+                self._batch += 1
+                await loop.run_in_executor(executor, self._write, jobrun, result)
+            else:
+                self._failures += 1
+                if self._failures > self._failure_threshold:
+                    msg = f"\nFailures exceeded the failure threshold. Ending job run for job {jobrun.jobid}.\n"
+                    self._logger.exception(msg)
+                    stop.set()
+            if not await loop.run_in_executor(executor, self._director.heartbeat):
+                stop.set()
+
+    def _write(self, jobrun: RatingJobRun, result: RatingResponse) -> None:
+        """Persists the result and updates the job run. Runs in the worker thread."""
+        self.persist(result)
+        self.update_jobrun(jobrun=jobrun, result=result)
+        if self._batch % self._verbose == 0:
+            jobrun.announce()
+
     def _get_apps(self, category_id: int) -> pd.DataFrame:
         """Obtains apps for the category, removing any apps for which ratings exist."""
 
-        # Obtain all apps for the category from the app repo.
-        apps = self._uow.app_repo.get_by_category(category_id=category_id)
+        # Obtain all apps for the category from the app repo, selecting only the columns
+        # carried into the rating results.
+        apps = self._uow.app_repo.find(
+            columns=APP_COLUMNS, filters=[Eq("category_id", category_id)]
+        )
         msg = f"\n\nA total of {len(apps)} apps in category {category_id}."
 
         # Obtain apps which we have already processed
         try:
-            ratings = self._uow.rating_repo.get_by_category(category_id=category_id)
+            ratings = self._uow.rating_repo.find(
+                columns=["id"], filters=[Eq("category_id", category_id)]
+            )
             apps_processed = ratings["id"].values
             msg += f"\nThere are {len(apps_processed)} apps in category {category_id} which have already been processed."
         except Exception as e:  # pragma: no cover
@@ -135,8 +279,7 @@ class RatingController(Controller):
         data = result.get_result()
         if len(data) > 0:
             try:
-                self._uow.rating_repo.load(data=data)
-                self._uow.save()
+                self._uow.buffer(repo="rating_repo", data=data)
             except Exception as e:  # pragma: no cover
                 msg = f"{type(e)} exception occurred in persist. Rolling back. \n{e}"
                 self._logger.exception(msg)
@@ -167,6 +310,13 @@ class RatingController(Controller):
         self._director.update_jobrun(jobrun=jobrun)
         return jobrun
 
+    def _finish_jobrun(self, jobrun: RatingJobRun) -> None:
+        """Ends the job run, or abandons it if the lease on its job was lost."""
+        if self._director.lost:
+            self.abandon_jobrun(jobrun=jobrun)
+        else:
+            self.end_jobrun(jobrun=jobrun)
+
     def end_jobrun(self, jobrun: RatingJobRun) -> None:
         """Persists job to the Database
 
@@ -174,11 +324,9 @@ class RatingController(Controller):
             result (ReviewResponse) -> Parsed result object
         """
         jobrun.end()
-        # Get the associated job and end it.
-        job = self._uow.job_repo.get(id=jobrun.jobid)
-        job.end(completed=jobrun.completed)
-        # Persist the jobrun and the job.
-        self._director.update_job(job=job)
+        # Persist the jobrun with the buffered ratings, then end the job if still leased.
         self._director.update_jobrun(jobrun=jobrun)
+        self._uow.flush()
+        self._director.end_job(completed=jobrun.completed)
         # Archive the ratings
         self._uow.rating_repo.export()
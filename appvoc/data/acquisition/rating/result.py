@@ -20,12 +20,31 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+
+import pandas as pd
 
 from appvoc.data.acquisition.base import Response
+from appvoc.data.acquisition.builder import ColumnarBuilder
 from appvoc.infrastructure.web.utils import getsize
 
 
+# ------------------------------------------------------------------------------------------------ #
+COLUMNS = (
+    "id",
+    "name",
+    "category_id",
+    "category",
+    "rating",
+    "reviews",
+    "ratings",
+    "onestar",
+    "twostar",
+    "threestar",
+    "fourstar",
+    "fivestar",
+)
+
+
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class RatingResponse(Response):
@@ -36,37 +55,55 @@ class RatingResponse(Response):
     client_errors: int = 0
     server_errors: int = 0
 
-
+    Ratings are accumulated in columns, and apps looked up in the batch by id.
     """
 
-    content: List = field(default_factory=lambda: [])
+    content: ColumnarBuilder = field(
+        default_factory=lambda: ColumnarBuilder(
+            columns=COLUMNS, dtypes={"category_id": "category", "category": "category"}
+        )
+    )
 
     apps: int = 0
 
-    def add_response(self, response: dict, batch: dict) -> None:
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._batch = None
+        self._index = {}
+
+    def add_response(self, response: dict, batch: list) -> None:
         """Adds a rating to the result content
 
         Args:
-           review (dict): Dictionary containing review data
+           response (dict): Decoded rating response for an app.
+           batch (list): The app dictionaries in the batch to which the app belongs.
         """
 
         self.size += getsize(response)
         self.apps += 1
 
-        id = str(response["adamId"])  # noqa
-        page = {}
-        page["id"] = [app["id"] for app in batch if app["id"] == id][0]
-        page["name"] = [app["name"] for app in batch if app["id"] == id][0]
-        page["category_id"] = [
-            str(app["category_id"]) for app in batch if app["id"] == id
-        ][0]
-        page["category"] = [app["category"] for app in batch if app["id"] == id][0]
-        page["rating"] = response["ratingAverage"]
-        page["reviews"] = response["totalNumberOfReviews"]
-        page["ratings"] = response["ratingCount"]
-        page["onestar"] = response["ratingCountList"][0]
-        page["twostar"] = response["ratingCountList"][1]
-        page["threestar"] = response["ratingCountList"][2]
-        page["fourstar"] = response["ratingCountList"][3]
-        page["fivestar"] = response["ratingCountList"][4]
-        self.content.append(page)
+        if batch is not self._batch:
+            self._batch = batch
+            self._index = {app["id"]: app for app in batch}
+        app = self._index[str(response["adamId"])]
+        histogram = response["ratingCountList"]
+        self.content.append(
+            (
+                app["id"],
+                app["name"],
+                str(app["category_id"]),
+                app["category"],
+                response["ratingAverage"],
+                response["totalNumberOfReviews"],
+                response["ratingCount"],
+                histogram[0],
+                histogram[1],
+                histogram[2],
+                histogram[3],
+                histogram[4],
+            )
+        )
+
+    def get_result(self) -> pd.DataFrame:
+        """Returns the ratings in DataFrame format"""
+        return self.content.to_frame()
@@ -77,23 +77,40 @@ class RatingScraper:
 
         Return: RatingResponse object, containing projects and results in DataFrame format.
         """
-        for batch_idx in range(self._num_batches):
-            validator = RatingValidator()
-            result = RatingResponse()
+        async for batch, responses in self.fetch():
+            yield self.parse(batch=batch, responses=responses)
+
+    async def fetch(self) -> tuple:
+        """Sends each batch of urls to the session handler.
 
+        Return: Tuple containing the batch of apps and the list of raw responses.
+        """
+        for batch_idx in range(self._num_batches):
             responses = await self._session_handler.get(
                 urls=self._batches[batch_idx]["urls"], headers=self._header
             )
+            yield self._batches[batch_idx]["apps"], responses
 
-            batch = self._batches[batch_idx]["apps"]
-            for response in responses:
-                if validator.is_valid(response=response):
-                    result.add_response(response=response, batch=batch)
-                else:
-                    result.data_errors += validator.data_error
-                    result.client_errors += validator.client_error
-                    result.server_errors += validator.server_error
-            yield result
+    def parse(self, batch: list, responses: list) -> RatingResponse:
+        """Validates and parses the responses for a batch of apps.
+
+        Args:
+            batch (list): List of app dictionaries for the batch.
+            responses (list): Responses returned by the session handler for the batch.
+
+        Return: RatingResponse object, containing projects and results in DataFrame format.
+        """
+        validator = RatingValidator()
+        result = RatingResponse()
+
+        for response in responses:
+            if validator.is_valid(response=response):
+                result.add_response(response=response, batch=batch)
+            else:
+                result.data_errors += validator.data_error
+                result.client_errors += validator.client_error
+                result.server_errors += validator.server_error
+        return result
 
     def _create_batches(self) -> list:
         """Creates batches of URLs from a list of app ids"""
@@ -17,8 +17,10 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """AppVoC Scraper Controller Module"""
+import asyncio
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from dependency_injector.wiring import Provide, inject
@@ -28,10 +30,14 @@ from appvoc.data.acquisition.base import App, Controller
 from appvoc.data.acquisition.review.director import ReviewDirector
 from appvoc.data.acquisition.review.job import ReviewJobRun
 from appvoc.data.acquisition.review.result import ReviewResponse
-from appvoc.data.acquisition.review.scraper import ReviewScraper
+from appvoc.data.acquisition.review.scraper import AReviewScraper, ReviewScraper
+from appvoc.data.repo.predicate import Eq, Range
 from appvoc.data.repo.uow import UoW
 from appvoc.domain.review.request import ReviewRequest
 
+# ------------------------------------------------------------------------------------------------ #
+APP_COLUMNS = ["id", "name", "category_id", "category"]
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                            APPSTORE REVIEW CONTROLLER                                            #
@@ -49,6 +55,12 @@ class ReviewController(Controller):
         max_results_per_page (int): This is the limit of results to return on each request.
         verbose (int): An indicator of the level of progress reporting verbosity. Progress
             will be printed to stdout for each 'verbose' number of apps processed.
+        ascraper (AReviewScraper): Asynchronous scraper used by the concurrent 'ascrape' mode.
+        concurrency (int): The number of apps kept in flight at once in 'ascrape' mode.
+            Defaults to the configured async_session concurrency.
+        flush_interval (int): Number of apps whose request logs are held in memory before
+            being written to the database in a single upsert. Logs are also written at the
+            end of each job run. Default is 100.
 
     """
 
@@ -63,9 +75,16 @@ class ReviewController(Controller):
         max_pages: int = sys.maxsize,
         max_results_per_page: int = 400,
         verbose: int = 10,
+        ascraper: type[AReviewScraper] = AReviewScraper,
+        concurrency: int = Provide[
+            AppVoCContainer.config.web.async_session.concurrency
+        ],
+        flush_interval: int = 100,
     ) -> None:
         super().__init__()
         self._scraper = scraper
+        self._ascraper = ascraper
+        self._concurrency = concurrency
         self._director = director(uow=uow)
         self._uow = uow
         self._failure_threshold = failure_threshold
@@ -73,7 +92,12 @@ class ReviewController(Controller):
         self._max_pages = max_pages
         self._max_results_per_page = max_results_per_page
         self._verbose = verbose
+        self._flush_interval = flush_interval
         self._failures = 0
+        # Request logs for the category of the current job run, keyed by app id, and those
+        # changed since they were last written.
+        self._requests = {}
+        self._changed = {}
 
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
@@ -118,14 +142,130 @@ class ReviewController(Controller):
                             self._failures = 0
                             break
 
-                    self._uow.review_request_repo.update(request=request)
+                        if not self._director.heartbeat():
+                            break
+
+                    self._update_request_log(request=request)
 
                     if app_idx % self._verbose == 0:
                         jobrun.announce()
 
-            self.end_jobrun(jobrun=jobrun)
+                    if self._director.lost:
+                        break
+
+            self._finish_jobrun(jobrun=jobrun)
+            jobrun = self._director.next()
+
+    async def ascrape(self) -> None:
+        """Entry point for the concurrent scraping operation.
+
+        Keeps up to 'concurrency' apps in flight at once. Each app's pages are requested
+        in order, so the request log for each app advances exactly as in 'scrape'.
+        """
+        if not super().is_locked():
+            await self._ascrape()
+        else:  # pragma: no cover
+            msg = f"Running {self.__class__.__name__} is not authorized at this time."
+            self._logger.info(msg)
+
+    async def _ascrape(self) -> None:
+        """Driver for the concurrent scraping operation.
+
+        Database writes are made in a worker thread, so the event loop keeps the requests of
+        the other apps in flight while results are persisted. If a worker fails, the others
+        are cancelled and the job is released.
+        """
+        jobrun = self._director.next()
+        while jobrun is not None:
+            jobrun = self.start_jobrun(jobrun=jobrun)
+            apps = self._get_apps(category_id=jobrun.category_id)
+
+            if len(apps) > 0:
+                queue = asyncio.Queue()
+                for _, row in apps.iterrows():
+                    queue.put_nowait(self._get_app(row=row))
+
+                # A single worker serializes writes on the database connection.
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    workers = [
+                        asyncio.create_task(
+                            self._harvest(
+                                queue=queue, jobrun=jobrun, executor=executor
+                            )
+                        )
+                        for _ in range(min(self._concurrency, len(apps)))
+                    ]
+                    try:
+                        await asyncio.gather(*workers)
+                    except BaseException:
+                        for worker in workers:
+                            worker.cancel()
+                        await asyncio.gather(*workers, return_exceptions=True)
+                        self.release()
+                        raise
+                    finally:
+                        # Returns the worker thread's connection to the pool before it exits.
+                        await asyncio.get_running_loop().run_in_executor(
+                            executor, self._uow.database.close
+                        )
+
+            self._finish_jobrun(jobrun=jobrun)
             jobrun = self._director.next()
 
+    async def _harvest(
+        self, queue: asyncio.Queue, jobrun: ReviewJobRun, executor: ThreadPoolExecutor
+    ) -> None:
+        """Worker that takes apps from the queue and pages through their reviews in order.
+
+        Results, request logs and lease renewals are written in the executor's thread.
+
+        Args:
+            queue (asyncio.Queue): Queue of App objects remaining in the job run.
+            jobrun (ReviewJobRun): The current job run.
+            executor (ThreadPoolExecutor): Single thread executor making the database writes.
+        """
+        loop = asyncio.get_running_loop()
+        while not queue.empty() and not self._director.lost:
+            app = queue.get_nowait()
+            request = await loop.run_in_executor(
+                executor, self._get_or_create_request_log, app
+            )
+            jobrun.apps += 1
+            failures = 0
+
+            async for result in self._ascraper(
+                app=app,
+                max_pages=self._max_pages,
+                max_results_per_page=self._max_results_per_page,
+                start=request.last_index,
+            ):
+                if result.is_valid():
+                    failures = 0
+                    await loop.run_in_executor(
+                        executor, self._write, jobrun, result, request
+                    )
+                else:
+                    failures += 1
+
+                if failures >= self._failure_threshold:  # pragma: no cover
+                    break
+
+                if not await loop.run_in_executor(executor, self._director.heartbeat):
+                    break
+
+            await loop.run_in_executor(executor, self._update_request_log, request)
+
+            if jobrun.apps % self._verbose == 0:
+                jobrun.announce()
+
+    def _write(
+        self, jobrun: ReviewJobRun, result: ReviewResponse, request: ReviewRequest
+    ) -> None:
+        """Persists the result, updates the job run and request log. Runs in the worker thread."""
+        self.persist(result)
+        self.update_jobrun(jobrun=jobrun, result=result)
+        request.last_index = result.index
+
     def _get_app(self, row: pd.Series) -> App:
         return App(
             id=row["id"],
@@ -135,14 +275,18 @@ class ReviewController(Controller):
         )
 
     def _get_apps(self, category_id: int) -> pd.DataFrame:
-        # Obtain all apps for the category from the repository.
-        apps = self._uow.app_repo.get_by_category(category_id=category_id)
+        # Obtain the apps for the category that have greater than 'min_ratings' ratings,
+        # a proxy for the number of potential reviews. Only the columns used to create
+        # App objects are selected.
+        apps = self._uow.app_repo.find(
+            columns=APP_COLUMNS,
+            filters=[
+                Eq("category_id", category_id),
+                Range("ratings", lower=self._min_ratings, inclusive="neither"),
+            ],
+        )
         msg = f"\n\nA total of {len(apps)} apps in category {category_id}."
 
-        # Filter the apps that have greater than 'min_ratings'
-        # This is a proxy for number of potential reviews.
-        apps = apps.loc[apps["ratings"] > self._min_ratings]
-
         if len(apps) > 0:
             msg += f"\nApps to process: {len(apps)}"
             self._logger.info(msg)
@@ -153,31 +297,62 @@ class ReviewController(Controller):
 
     def _get_or_create_request_log(self, app: App) -> ReviewRequest:
         """Gets existing or creates new review request object."""
-        try:
-            request = self._get_request_log(app=app)
-            if request is not None:
-                return request
-            else:
-                return self._create_request_log(app=app)
-        except Exception:
-            return self._create_request_log(app=app)
-
-    def _get_request_log(self, app: App) -> ReviewRequest:
-        return self._uow.review_request_repo.get(id=app.id)
+        request = self._requests.get(app.id)
+        if request is None:
+            request = self._create_request_log(app=app)
+        return request
 
     def _create_request_log(self, app: App) -> ReviewRequest:
         request = ReviewRequest(id=app.id, category_id=app.category_id)
-        self._uow.review_request_repo.add(request=request)
+        self._requests[app.id] = request
+        self._changed[app.id] = request
         return request
 
+    def _load_request_logs(self, category_id: str) -> None:
+        """Preloads the request logs for the category of the job run in a single query."""
+        self._flush_request_logs()
+        try:
+            self._requests = self._uow.review_request_repo.get_requests(
+                category_id=category_id
+            )
+        except Exception as e:  # pragma: no cover
+            # The request log table does not exist until the first logs are written.
+            msg = f"Request logs for category {category_id} not loaded.\n{e}"
+            self._logger.info(msg)
+            self._requests = {}
+
+    def _update_request_log(self, request: ReviewRequest) -> None:
+        """Records the request log as changed, writing changes once 'flush_interval' accrue."""
+        self._changed[request.id] = request
+        if len(self._changed) >= self._flush_interval:
+            self._flush_request_logs()
+
+    def _flush_request_logs(self) -> None:
+        """Writes the changed request logs to the database in a single upsert.
+
+        Buffered reviews are flushed first, so a request log never records an index beyond
+        the reviews written to the database.
+        """
+        self._uow.flush()
+        if len(self._changed) > 0:
+            self._uow.review_request_repo.upsert_requests(
+                requests=list(self._changed.values())
+            )
+            self._uow.save()
+            self._changed = {}
+
+    def release(self) -> None:
+        """Writes pending request logs and releases the job in progress."""
+        self._flush_request_logs()
+        super().release()
+
     def persist(self, result: ReviewResponse) -> None:
         """Persists results to Database
 
         Args:
             result (ReviewResponse) -> Parsed result object
         """
-        self._uow.review_repo.load(data=result.get_result())
-        self._uow.save()
+        self._uow.buffer(repo="review_repo", data=result.get_result())
 
     def start_jobrun(self, jobrun: ReviewJobRun) -> ReviewJobRun:
         """Starts a jobrun and adds a jobrun to the repository.
@@ -188,6 +363,7 @@ class ReviewController(Controller):
         """
         jobrun.start()
         self._director.add_jobrun(jobrun=jobrun)
+        self._load_request_logs(category_id=jobrun.category_id)
         return jobrun
 
     def update_jobrun(
@@ -204,6 +380,13 @@ class ReviewController(Controller):
         self._director.update_jobrun(jobrun=jobrun)
         return jobrun
 
+    def _finish_jobrun(self, jobrun: ReviewJobRun) -> None:
+        """Ends the job run, or abandons it if the lease on its job was lost."""
+        if self._director.lost:
+            self.abandon_jobrun(jobrun=jobrun)
+        else:
+            self.end_jobrun(jobrun=jobrun)
+
     def end_jobrun(self, jobrun: ReviewJobRun) -> None:
         """Persists job to the Database
 
@@ -211,11 +394,9 @@ class ReviewController(Controller):
             result (ReviewResponse) -> Parsed result object
         """
         jobrun.end()
-        # Get the associated job and end it.
-        job = self._uow.job_repo.get(id=jobrun.jobid)
-        job.end(completed=jobrun.completed)
-        # Persist the jobrun and the job.
-        self._director.update_job(job=job)
+        # Persist the jobrun with the buffered reviews, then end the job if still leased.
         self._director.update_jobrun(jobrun=jobrun)
+        self._flush_request_logs()
+        self._director.end_job(completed=jobrun.completed)
         # Archive the ratings
         self._uow.rating_repo.export()
@@ -27,8 +27,8 @@ from appvoc.data.repo.uow import UoW
 class ReviewDirector(Director):
     """Iterator serving jobs to the controller."""
 
-    def __init__(self, uow: UoW) -> None:
-        super().__init__(uow=uow)
+    def __init__(self, uow: UoW, lease: int = 600) -> None:
+        super().__init__(uow=uow, lease=lease)
 
     def add_jobrun(self, jobrun: ReviewJobRun) -> None:
         """Adds a job run to the repository.
@@ -40,13 +40,12 @@ class ReviewDirector(Director):
         self._uow.save()
 
     def update_jobrun(self, jobrun: ReviewJobRun) -> None:
-        """Updates the jobrun repository
+        """Updates the jobrun repository when the unit of work next flushes its buffered rows.
 
         Args:
             jobrun (ReviewJobRun): Job run object
         """
-        self._uow.review_jobrun_repo.update(jobrun=jobrun)
-        self._uow.save()
+        self._uow.defer(repo="review_jobrun_repo", key=jobrun.id, jobrun=jobrun)
 
     def update_job(self, job: Job) -> None:
         """Updates a job in the repository.
@@ -60,7 +59,7 @@ class ReviewDirector(Director):
     def next(self) -> ReviewJobRun:
         """Sets the next job and returns an instance of this iterator"""
 
-        job = self._uow.job_repo.next(controller="ReviewController")
+        job = self.claim(controller="ReviewController")
         if job is not None:
             return ReviewJobRun.from_job(job=job)
         else:
@@ -20,20 +20,50 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Union
 
 import pandas as pd
 import requests
 
 from appvoc.data.acquisition.base import App, Response
+from appvoc.data.acquisition.builder import ColumnarBuilder
+from appvoc.infrastructure.web.decode import decode
 from appvoc.infrastructure.web.utils import getsize
 
 
+# ------------------------------------------------------------------------------------------------ #
+# Columns of the review result, and the fields parsed from each review with their json keys.
+COLUMNS = (
+    "id",
+    "app_id",
+    "app_name",
+    "category_id",
+    "category",
+    "author",
+    "rating",
+    "title",
+    "content",
+    "vote_sum",
+    "vote_count",
+    "date",
+)
+FIELDS = {
+    "id": "userReviewId",
+    "author": "name",
+    "rating": "rating",
+    "title": "title",
+    "content": "body",
+    "vote_sum": "voteSum",
+    "vote_count": "voteCount",
+    "date": "date",
+}
+
+
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class ReviewResponse(Response):
     """Encapsulates the review results. Inherits the following from Response base class:
-    content (list): List of dictionaries containing the response content
+    content (pd.DataFrame): The reviews parsed from the response.
     size: (int): Total size of response in bytes
     requests (int): Number of requests. This will be one for syncronous requests,
         async requests vary.
@@ -42,50 +72,60 @@ class ReviewResponse(Response):
 
     """
 
-    content: List = field(default_factory=lambda: [])
+    content: pd.DataFrame = field(default_factory=pd.DataFrame)
     app: App = None
     reviews: int = 0
     index: int = 0
 
     def add_response(
-        self, response: requests.Response, app: App, index: int = 0
+        self, response: Union[requests.Response, dict], app: App, index: int = 0
     ) -> None:
         """Adds a response to the instance
 
+        Reviews are parsed into columns. The app, common to all reviews on the page, is added
+        as categorical columns, and dates are converted once for the page.
+
         Args:
-           response (requests.Response): HTTP Response
+           response (Union[requests.Response, dict]): HTTP Response, or the decoded json
+                returned by the asynchronous session handler.
+           app (App): The app to which the reviews belong.
+           index (int): The start index of the page of reviews.
         """
         self.app = app
         self.index = index
 
         self.size += getsize(response=response)
 
-        for data in response.json()["userReviewList"]:
-            review = self._parse_review(data=data)
-            if review is not None:
-                self.content.append(review)
-
-    def _parse_review(self, data: dict) -> dict:
-        try:
-            review = {}
-            review["id"] = data["userReviewId"]
-            review["app_id"] = self.app.id
-            review["app_name"] = self.app.name
-            review["category_id"] = self.app.category_id
-            review["category"] = self.app.category
-            review["author"] = data["name"]
-            review["rating"] = data["rating"]
-            review["title"] = data["title"]
-            review["content"] = data["body"]
-            review["vote_sum"] = data["voteSum"]
-            review["vote_count"] = data["voteCount"]
-            review["date"] = pd.to_datetime(data["date"])
-
-        except Exception as e:
-            msg = f"Exception of type {type(e)} occurred.\n{e}"
-            self._logger.debug(msg)
-            self.data_errors += 1
-            return None
+        builder = ColumnarBuilder(columns=tuple(FIELDS.keys()), dates=("date",))
+        keys = tuple(FIELDS.values())
+        for data in decode(response)["userReviewList"]:
+            try:
+                builder.append(tuple([data[key] for key in keys]))
+            except (KeyError, TypeError) as e:
+                msg = f"Exception of type {type(e)} occurred.\n{e}"
+                self._logger.debug(msg)
+                self.data_errors += 1
+
+        reviews = builder.to_frame(
+            constants={
+                "app_id": app.id,
+                "app_name": app.name,
+                "category_id": app.category_id,
+                "category": app.category,
+            }
+        )[list(COLUMNS)]
+        # Reviews with unparseable dates are data errors, as are those missing fields.
+        invalid = reviews["date"].isna()
+        if invalid.any():
+            self.data_errors += int(invalid.sum())
+            reviews = reviews.loc[~invalid].reset_index(drop=True)
+        self.reviews += len(reviews)
+
+        if len(self.content) == 0:
+            self.content = reviews
         else:
-            self.reviews += 1
-            return review
+            self.content = pd.concat([self.content, reviews], ignore_index=True)
+
+    def get_result(self) -> pd.DataFrame:
+        """Returns the reviews in DataFrame format"""
+        return self.content
@@ -28,6 +28,7 @@ from appvoc.container import AppVoCContainer
 from appvoc.data.acquisition.base import App, Scraper
 from appvoc.data.acquisition.review.result import ReviewResponse
 from appvoc.data.acquisition.review.validator import ReviewValidator
+from appvoc.infrastructure.web.asession import ASessionHandler
 from appvoc.infrastructure.web.headers import STOREFRONT
 from appvoc.infrastructure.web.session import SessionHandler
 
@@ -67,25 +68,30 @@ class ReviewScraper(Scraper):
         if self._page < self._max_pages:
             url = self._setup_url()
 
-            validator = ReviewValidator()
-            result = ReviewResponse()
-
             response = self._session_handler.get(url=url, header=self._header)
 
-            if validator.is_valid(response=response):
-                result.add_response(
-                    response=response, app=self._app, index=self._start_index
-                )
-            else:  # pragma: no cover
-                result.app = self._app
-                result.data_errors += validator.data_error
-                result.client_errors += validator.client_error
-                result.server_errors += validator.server_error
+            result = self._process_response(response=response)
             self._paginate_url()
             return result
         else:
             raise StopIteration
 
+    def _process_response(self, response) -> ReviewResponse:
+        """Validates the response and parses it into a ReviewResponse object."""
+        validator = ReviewValidator()
+        result = ReviewResponse()
+
+        if validator.is_valid(response=response):
+            result.add_response(
+                response=response, app=self._app, index=self._start_index
+            )
+        else:  # pragma: no cover
+            result.app = self._app
+            result.data_errors += validator.data_error
+            result.client_errors += validator.client_error
+            result.server_errors += validator.server_error
+        return result
+
     def _setup_url(self) -> None:
         """Sets the request url"""
         return f"https://itunes.apple.com/WebObjects/MZStore.woa/wa/userReviewsRow?id={self._app.id}&displayable-kind=11&startIndex={self._start_index}&endIndex={self._end_index}&sort=1"
@@ -95,3 +101,56 @@ class ReviewScraper(Scraper):
         self._start_index += self._max_results_per_page
         self._end_index += self._max_results_per_page
         self._setup_url()
+
+
+# ------------------------------------------------------------------------------------------------ #
+class AReviewScraper(ReviewScraper):
+    """Asynchronous App Store Review Scraper
+
+    Pages through the reviews for a single app in order, submitting each page request through
+    the asynchronous session handler. Many instances may be awaited concurrently, allowing
+    the controller to keep several apps in flight at once.
+
+    Args:
+        app (App): The app for which reviews are requested.
+        session_handler (ASessionHandler): Asynchronous session handler shared by all scrapers.
+        start (int): The index of the first review to request.
+        max_results_per_page (int): The number of reviews requested per page.
+        max_pages (int): Maximum number of pages to request.
+    """
+
+    @inject
+    def __init__(
+        self,
+        app: App,
+        session_handler: ASessionHandler = Provide[AppVoCContainer.web.asession],
+        start: int = 0,
+        max_results_per_page: int = 400,
+        max_pages: int = sys.maxsize,
+    ) -> None:
+        super().__init__(
+            app=app,
+            session_handler=session_handler,
+            start=start,
+            max_results_per_page=max_results_per_page,
+            max_pages=max_pages,
+        )
+
+    def __aiter__(self) -> AReviewScraper:
+        return self
+
+    async def __anext__(self) -> ReviewResponse:
+        """Requests the next page of reviews for the app"""
+
+        if self._page < self._max_pages:
+            url = self._setup_url()
+
+            responses = await self._session_handler.get(
+                urls=[url], headers=self._header
+            )
+
+            result = self._process_response(response=responses[0])
+            self._paginate_url()
+            return result
+        else:
+            raise StopAsyncIteration
@@ -41,9 +41,12 @@ class ReviewValidator(Validator):
         self.response = response
         self.valid = True
 
-        self._validate_status_code()
+        self._validate_response_type()
         if self.valid:
-            self._validate_response_type()
+            # Decoded json from the asynchronous session handler carries no status code.
+            # Non-2xx responses are raised and retried by the handler itself.
+            if isinstance(self.response, requests.Response):
+                self._validate_status_code()
             if self.valid:
                 self._validate_response_content()
         return self.valid
@@ -56,7 +59,7 @@ class ReviewValidator(Validator):
             self.msg = "No response"
             self._logger.debug(self.msg)
 
-        elif not isinstance(self.response, requests.Response):
+        elif not isinstance(self.response, (requests.Response, dict)):
             self.valid = False
             self.server_error = True
             self.msg = (
@@ -67,22 +70,23 @@ class ReviewValidator(Validator):
         return self.valid
 
     def _validate_response_content(self) -> bool:  # pragma: no cover
-        if not isinstance(self.response.json(), dict):
+        content = self._json()
+        if not isinstance(content, dict):
             self.data_error = True
-            self.msg = f"Invalid Response: Response json is of type {type(self.response.json())}."
+            self.msg = f"Invalid Response: Response json is of type {type(content)}."
             self._logger.debug(msg=self.msg)
             self.valid = False
-        elif "userReviewList" not in self.response.json():
+        elif "userReviewList" not in content:
             self.data_error = True
             self.msg = "Invalid Response: Response json has no 'userReviewList' key."
             self._logger.debug(msg=self.msg)
             self.valid = False
-        elif not isinstance(self.response.json()["userReviewList"], list):
+        elif not isinstance(content["userReviewList"], list):
             self.data_error = True
-            self.msg = f"Invalid Response: Response json 'userReviewList' is of type {type(self.response.json()['userReviewList'])}, not a list."
+            self.msg = f"Invalid Response: Response json 'userReviewList' is of type {type(content['userReviewList'])}, not a list."
             self._logger.debug(msg=self.msg)
             self.valid = False
-        elif len(self.response.json()["userReviewList"]) == 0:
+        elif len(content["userReviewList"]) == 0:
             self.data_error = True
             self.msg = (
                 "Invalid Response: Response json 'userReviewList' has zero length."
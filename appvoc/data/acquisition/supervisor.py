@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/data/acquisition/supervisor.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 04:26:31 pm                                              #
+# Modified   : Saturday October 17th 2026 04:26:31 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Acquisition Supervisor Module
+
+Runs acquisition controllers in a pool of worker processes on one host. For example:
+
+    python -m appvoc.data.acquisition.supervisor review --workers 8
+
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import logging
+import multiprocessing as mp
+import os
+import signal
+import time
+
+# ------------------------------------------------------------------------------------------------ #
+CONTROLLERS = {
+    "rating": "RatingController",
+    "review": "ReviewController",
+}
+
+
+# ------------------------------------------------------------------------------------------------ #
+def work(controller: str, stop: mp.Event, options: dict) -> None:
+    """Worker process entry point. Runs a controller until its jobs are exhausted or stopped.
+
+    Each worker builds its own container, and hence its own database connection and session
+    handlers, and claims jobs from the job table through the controller's director. The
+    schema is migrated once by the supervisor before the workers are spawned, so workers
+    initialize every resource but the schema.
+
+    Args:
+        controller (str): Key of the controller in CONTROLLERS.
+        stop (mp.Event): Set by the supervisor to request a clean shutdown.
+        options (dict): Keyword arguments for the controller.
+    """
+    # The supervisor handles interrupts and signals the workers through the stop event.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logger = logging.getLogger(f"Worker-{os.getpid()}")
+
+    # Imported in the worker, which builds its own container once spawned.
+    from dependency_injector import providers
+
+    from appvoc.container import AppVoCContainer
+
+    container = AppVoCContainer()
+    for resource in container.traverse(types=[providers.Resource]):
+        if resource is not container.data.schema:
+            resource.init()
+    container.wire(packages=["appvoc.data.acquisition"])
+
+    if controller == "rating":
+        from appvoc.data.acquisition.rating.controller import RatingController
+
+        ctrl = RatingController(**options)
+        scrape = ctrl.scrape
+    else:
+        from appvoc.data.acquisition.review.controller import ReviewController
+
+        ctrl = ReviewController(**options)
+        scrape = ctrl.ascrape
+
+    async def run() -> None:
+        task = asyncio.create_task(scrape())
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=1)
+                if stop.is_set() and not task.done():
+                    msg = "Stop requested. Cancelling the job in progress."
+                    logger.info(msg)
+                    task.cancel()
+            if not task.cancelled():
+                task.result()
+        finally:
+            # Connections are closed in the event loop that owns them, before it is closed.
+            await container.web.asession().close()
+
+    try:
+        asyncio.run(run())
+    except asyncio.CancelledError:
+        pass
+    finally:
+        # Jobs cut short are released for other workers rather than left to lease expiry.
+        ctrl.release()
+        container.shutdown_resources()
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Supervisor:
+    """Spawns and supervises acquisition worker processes.
+
+    Workers share no state; they coordinate through job leases in the database. The
+    supervisor reports progress from the job table, and on SIGINT or SIGTERM asks the
+    workers to stop, releasing the jobs in progress, before terminating any that do not
+    exit within the grace period.
+
+    Args:
+        controller (str): Controller to run: 'rating' or 'review'.
+        workers (int): Number of worker processes. Defaults to the number of CPUs.
+        interval (float): Seconds between progress reports. Default = 60
+        grace (float): Seconds workers are given to stop before being terminated. Default = 30
+        options (dict): Keyword arguments passed to each controller. Optional.
+    """
+
+    def __init__(
+        self,
+        controller: str,
+        workers: int = None,
+        interval: float = 60,
+        grace: float = 30,
+        options: dict = None,
+    ) -> None:
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        if controller not in CONTROLLERS:
+            msg = f"Controller {controller} is invalid. Valid values are {list(CONTROLLERS)}."
+            self._logger.exception(msg)
+            raise ValueError(msg)
+        self._controller = controller
+        self._workers = workers or os.cpu_count()
+        self._interval = interval
+        self._grace = grace
+        self._options = options or {}
+        # Spawned, not forked, so no database connections or sockets are inherited.
+        self._context = mp.get_context("spawn")
+        self._stop = self._context.Event()
+        self._processes = []
+        self._job_repo = None
+
+    @property
+    def processes(self) -> list:
+        return self._processes
+
+    def run(self) -> int:
+        """Starts the workers and supervises them until all have exited.
+
+        Returns: The number of workers that exited with an error.
+        """
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        self.migrate()
+        self.start()
+        reported = time.monotonic()
+        while any(process.is_alive() for process in self._processes):
+            time.sleep(1)
+            if self._stop.is_set():
+                self._shutdown()
+            elif time.monotonic() - reported >= self._interval:
+                self.report()
+                reported = time.monotonic()
+        self.report()
+        failures = [p for p in self._processes if p.exitcode not in (0, None)]
+        for process in failures:
+            msg = f"Worker {process.name} exited with code {process.exitcode}."
+            self._logger.error(msg)
+        return len(failures)
+
+    def migrate(self) -> None:
+        """Migrates the schema, once, before the workers that depend upon it are spawned."""
+        from appvoc.container import AppVoCContainer
+
+        schema = AppVoCContainer().data.schema
+        schema.init()
+        schema.shutdown()
+
+    def start(self) -> None:
+        """Spawns the worker processes."""
+        for i in range(self._workers):
+            process = self._context.Process(
+                target=work,
+                name=f"{CONTROLLERS[self._controller]}-{i}",
+                args=(self._controller, self._stop, self._options),
+            )
+            process.start()
+            self._processes.append(process)
+        msg = f"Started {self._workers} {CONTROLLERS[self._controller]} workers."
+        self._logger.info(msg)
+
+    def stop(self) -> None:
+        """Requests a clean shutdown of the workers."""
+        self._stop.set()
+
+    def report(self) -> dict:
+        """Logs and returns job progress for the controller and the number of live workers."""
+        if self._job_repo is None:
+            from appvoc.container import AppVoCContainer
+
+            self._job_repo = AppVoCContainer().data.job_repo()
+        progress = self._job_repo.progress(controller=CONTROLLERS[self._controller])
+        progress["workers"] = sum(p.is_alive() for p in self._processes)
+        msg = (
+            f"{CONTROLLERS[self._controller]}: {progress['complete']} of "
+            f"{progress['jobs']} jobs complete, {progress['leased']} in progress, "
+            f"{progress['pending']} pending; {progress['workers']} workers alive."
+        )
+        self._logger.info(msg)
+        return progress
+
+    def _shutdown(self) -> None:
+        """Waits for the workers to stop, terminating those that outlast the grace period."""
+        deadline = time.monotonic() + self._grace
+        for process in self._processes:
+            process.join(timeout=max(deadline - time.monotonic(), 0))
+        for process in self._processes:
+            if process.is_alive():
+                msg = f"Worker {process.name} did not stop in time. Terminating."
+                self._logger.warning(msg)
+                process.terminate()
+                process.join()
+
+    def _handle_signal(self, signum, frame) -> None:  # pragma: no cover
+        msg = f"Received signal {signal.Signals(signum).name}. Stopping workers."
+        self._logger.info(msg)
+        self.stop()
+
+
+# ------------------------------------------------------------------------------------------------ #
+def main(args: list = None) -> int:  # pragma: no cover
+    parser = argparse.ArgumentParser(
+        description="Runs an AppVoC acquisition controller in a pool of worker processes."
+    )
+    parser.add_argument("controller", choices=list(CONTROLLERS))
+    parser.add_argument(
+        "-w", "--workers", type=int, default=os.cpu_count(), help="Worker processes."
+    )
+    parser.add_argument(
+        "-i", "--interval", type=float, default=60, help="Seconds between reports."
+    )
+    parser.add_argument(
+        "-g", "--grace", type=float, default=30, help="Seconds allowed for shutdown."
+    )
+    parser.add_argument(
+        "-v", "--verbose", type=int, default=10, help="Controller verbosity."
+    )
+    parsed = parser.parse_args(args)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(processName)s %(name)s %(levelname)s %(message)s",
+    )
+    supervisor = Supervisor(
+        controller=parsed.controller,
+        workers=parsed.workers,
+        interval=parsed.interval,
+        grace=parsed.grace,
+        options={"verbose": parsed.verbose},
+    )
+    return supervisor.run()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
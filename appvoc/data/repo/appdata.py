@@ -18,6 +18,7 @@
 # ================================================================================================ #
 """Repository Implementation Module"""
 import logging
+from typing import Iterator
 
 import numpy as np
 import pandas as pd
@@ -92,36 +93,34 @@ class AppDataRepo(Repo):
     @property
     def summary(self) -> None:
         """Summarizes the data"""
-        df = self.getall()
-
-        summary = df["category"].value_counts().reset_index()
-        summary.columns = ["category", "Examples"]
-        df2 = df.groupby(by="category")["id"].nunique().to_frame()
-        df3 = df.groupby(by="category")["rating"].mean().to_frame()
-        df4 = df.groupby(by="category")["ratings"].sum().to_frame()
-
-        summary = summary.join(df2, on="category")
-        summary = summary.join(df3, on="category")
-        summary = summary.join(df4, on="category")
-        summary.columns = [
-            "Category",
-            "Examples",
-            "Apps",
-            "Average Rating",
-            "Rating Count",
-        ]
-        return summary
+        query = f"""SELECT category AS Category,
+            COUNT(*) AS Examples,
+            COUNT(DISTINCT id) AS Apps,
+            AVG(rating) AS `Average Rating`,
+            COALESCE(SUM(ratings), 0) AS `Rating Count`
+            FROM {self._name}
+            WHERE category IS NOT NULL
+            GROUP BY category
+            ORDER BY Examples DESC;"""
+        return self._database.query(
+            query=query,
+            dtypes={
+                "Examples": "int64",
+                "Apps": "int64",
+                "Average Rating": "float64",
+                "Rating Count": "int64",
+            },
+        )
 
     def load(self, data: pd.DataFrame) -> None:
         """Adds the dataframe rows to the designated table.
 
+        Rows are upserted by id, so reloading an entity replaces rather than duplicates it.
+
         Args:
             data (pd.DataFrame): DataFrame containing rows to add to the table.
         """
-        self._database.insert(
-            data=data, tablename=self._name, dtype=DATABASE_DTYPES, if_exists="append"
-        )
-        self.save()
+        self._database.upsert(data=data, tablename=self._name, dtype=DATABASE_DTYPES)
         msg = f"Added {data.shape[0]} rows to the {self._name} repository."
         self._logger.debug(msg)
 
@@ -149,6 +148,37 @@ class AppDataRepo(Repo):
 
         return super().getall(dtypes=DATAFRAME_DTYPES, parse_dates=PARSE_DATES)
 
+    def find(self, columns: list = None, filters: list = None) -> pd.DataFrame:
+        """Returns the selected columns of the rows matching all filters.
+
+        Args:
+            columns (list): Columns to return. Returns all columns if None.
+            filters (list): Eq, Range and In predicates the rows must satisfy.
+        """
+        return super().find(
+            columns=columns,
+            filters=filters,
+            dtypes=DATAFRAME_DTYPES,
+            parse_dates=PARSE_DATES,
+        )
+
+    def iter_all(self, chunksize: int = 10000) -> Iterator[pd.DataFrame]:
+        """Streams all data in the repository in DataFrames of 'chunksize' rows."""
+        return super().iter_all(
+            chunksize=chunksize, dtypes=DATAFRAME_DTYPES, parse_dates=PARSE_DATES
+        )
+
+    def iter_by_category(
+        self, category_id: str, chunksize: int = 10000
+    ) -> Iterator[pd.DataFrame]:
+        """Streams the data for a category in DataFrames of 'chunksize' rows."""
+        return super().iter_by_category(
+            category_id=category_id,
+            chunksize=chunksize,
+            dtypes=DATAFRAME_DTYPES,
+            parse_dates=PARSE_DATES,
+        )
+
     def get_ids(self, category_id: str) -> list:
         """Returns the list of app ids for the category
 
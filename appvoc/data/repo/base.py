@@ -22,11 +22,12 @@ import os
 from datetime import datetime
 import logging
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Iterator, Union
 
 from dotenv import load_dotenv
 import pandas as pd
 
+from appvoc.data.repo.predicate import Predicate, compile_select
 from appvoc.infrastructure.database.base import Database
 from appvoc.infrastructure.file.io import IOService
 from appvoc.infrastructure.file.config import FileConfig
@@ -160,6 +161,82 @@ class Repo(ABC):
             query=query, params=params, dtypes=dtypes, parse_dates=parse_dates
         )
 
+    def find(
+        self,
+        columns: list = None,
+        filters: list[Predicate] = None,
+        dtypes: dict = None,
+        parse_dates: dict = None,
+    ) -> pd.DataFrame:
+        """Returns the selected columns of the rows matching all filters.
+
+        Filters compile to a parameterized WHERE clause, so rows are selected, and columns
+        projected, by the database. Data types and date parsing are applied to the selected
+        columns only.
+
+        Args:
+            columns (list): Columns to return. Returns all columns if None.
+            filters (list[Predicate]): Eq, Range and In predicates the rows must satisfy.
+            dtypes (dict): Dictionary mapping of column to data types
+            parse_dates (dict): Dictionary of columns and keyword arguments for datetime parsing.
+        """
+        query, params = compile_select(
+            tablename=self._name, columns=columns, filters=filters
+        )
+        if columns:
+            dtypes = {k: v for k, v in (dtypes or {}).items() if k in columns} or None
+            parse_dates = {
+                k: v for k, v in (parse_dates or {}).items() if k in columns
+            } or None
+        return self._database.query(
+            query=query, params=params, dtypes=dtypes, parse_dates=parse_dates
+        )
+
+    def iter_all(
+        self, chunksize: int = 10000, dtypes: dict = None, parse_dates: dict = None
+    ) -> Iterator[pd.DataFrame]:
+        """Streams all data in the repository in DataFrames of 'chunksize' rows.
+
+        Args:
+            chunksize (int): Number of rows per DataFrame.
+            dtypes (dict): Dictionary mapping of column to data types
+            parse_dates (dict): Dictionary of columns and keyword arguments for datetime parsing.
+        """
+        query = f"SELECT * FROM {self._name};"
+        return self._database.iter_query(
+            query=query, dtypes=dtypes, parse_dates=parse_dates, chunksize=chunksize
+        )
+
+    def iter_by_category(
+        self,
+        category_id: Union[str, int],
+        chunksize: int = 10000,
+        dtypes: dict = None,
+        parse_dates: dict = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Streams the data for a category in DataFrames of 'chunksize' rows.
+
+        Args:
+            category_id (Union[str,int]): The mobile app category. Rows without a category
+                are streamed if None.
+            chunksize (int): Number of rows per DataFrame.
+            dtypes (dict): Dictionary mapping of column to data types
+            parse_dates (dict): Dictionary of columns and keyword arguments for datetime parsing.
+        """
+        if category_id is None:
+            query = f"SELECT * FROM {self._name} WHERE category_id IS NULL;"
+            params = {}
+        else:
+            query = f"SELECT * FROM {self._name} WHERE category_id = :category_id;"
+            params = {"category_id": category_id}
+        return self._database.iter_query(
+            query=query,
+            params=params,
+            dtypes=dtypes,
+            parse_dates=parse_dates,
+            chunksize=chunksize,
+        )
+
     def exists(self, id: Union[str, int]) -> bool:  # noqa
         """Assesses the existence of an entity in the database.
 
@@ -179,13 +256,13 @@ class Repo(ABC):
         Returns number of rows matching criteria
         """
         if id is not None:
-            query = f"SELECT * FROM {self._name} WHERE id = :id;"
+            query = f"SELECT COUNT(*) FROM {self._name} WHERE id = :id;"
             params = {"id": id}
         else:
-            query = f"SELECT * FROM {self._name};"
+            query = f"SELECT COUNT(*) FROM {self._name};"
             params = {}
 
-        return self._database.query(query=query, params=params).shape[0]
+        return self._database.execute(query=query, params=params).scalar()
 
     def delete(self, id: Union[str, int]) -> int:  # noqa
         """Deletes the entity designated by the id.
@@ -233,14 +310,20 @@ class Repo(ABC):
         )
         counts
 
-    def dedup(self, keep: str = "last", subset: str = "id") -> None:
-        """Removes duplicates by id"""
-        df = self.getall()
-        n1 = df.shape[0]
-        df = df.drop_duplicates(subset=subset, keep=keep)
-        n2 = df.shape[0]
+    def dedup(
+        self, keep: str = "last", subset: Union[str, list] = "id", order_by: str = None
+    ) -> None:
+        """Removes duplicates by id, within the database.
+
+        Args:
+            keep (str): Which duplicate to retain, 'first' or 'last'. Default = 'last'
+            subset (Union[str, list]): Column or columns identifying duplicates. Default = 'id'
+            order_by (str): Column ordering the duplicates. Defaults to the extraction time.
+        """
+        n1, n2 = self._database.dedup(
+            tablename=self._name, subset=subset, keep=keep, order_by=order_by
+        )
         r = n1 - n2
-        self.replace(data=df)
         self.save()
         msg = f"Repository with {n1} observations dropped {r} duplicates leaving {n2} observations"
         self._logger.info(msg)
@@ -255,14 +338,23 @@ class Repo(ABC):
         format: str = "pkl",
         by_category: bool = False,
         with_datetime: bool = True,
+        chunksize: int = 10000,
     ) -> str:
         """Archives the data
+
+        Data are streamed from the database. Text formats (csv, tsv) are written chunk by chunk
+        in bounded memory. Other formats hold one file's data, i.e. a category when
+        'by_category' is True, in memory at a time.
+
         Args:
             directory (str): The base directory into which the archive is created.
                 Optional. Defaults to the archive directory in an environment
                 variable.
+            format (str): File format and extension. Default = 'pkl'
+            by_category (bool): Whether to write a file per category. Default = False
+            with_datetime (bool): Whether to append a timestamp to the file name. Default = True
+            chunksize (int): Number of rows read from the database at a time.
         """
-        df = self.getall()
         if directory is None:
             basedir = self._config.datasets
             directory = os.path.join(basedir, self._name)
@@ -275,17 +367,53 @@ class Repo(ABC):
         os.makedirs(directory, exist_ok=True)
         if by_category:
             filepath = []
-            for category, data in df.groupby(by="category"):
+            # One file per category id. Rows without a category id are written to an
+            # 'uncategorized' file, and ids without a category name are named by id.
+            query = (
+                f"SELECT category_id, MAX(category) AS category FROM {self._name} "
+                "GROUP BY category_id;"
+            )
+            categories = self._database.query(query=query)
+            for category_id, category in categories.itertuples(index=False, name=None):
+                if pd.isnull(category_id):
+                    category_id, category = None, "uncategorized"
+                elif pd.isnull(category):
+                    category = str(category_id)
                 filename = name + "_" + category + "." + format
                 fp = os.path.join(directory, filename)
                 filepath.append(fp)
-                IOService.write(filepath=fp, data=data)
+                chunks = self.iter_by_category(
+                    category_id=category_id, chunksize=chunksize
+                )
+                self._write_chunks(filepath=fp, chunks=chunks)
         else:
             filename = name + "." + format
             filepath = os.path.join(directory, filename)
-            IOService.write(filepath=filepath, data=df)
+            self._write_chunks(
+                filepath=filepath, chunks=self.iter_all(chunksize=chunksize)
+            )
         return filepath
 
+    def _write_chunks(self, filepath: str, chunks: Iterator[pd.DataFrame]) -> None:
+        """Writes a stream of DataFrames to a single file.
+
+        Args:
+            filepath (str): Path to the file. Its extension designates the format.
+            chunks (Iterator[pd.DataFrame]): The data to write.
+        """
+        if os.path.splitext(filepath)[1] in (".csv", ".tsv"):
+            for i, chunk in enumerate(chunks):
+                IOService.write(
+                    filepath=filepath,
+                    data=chunk,
+                    mode="w" if i == 0 else "a",
+                    header=i == 0,
+                )
+        else:
+            chunks = list(chunks)
+            data = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+            IOService.write(filepath=filepath, data=data)
+
     def _parse_datetime(
         self, data: pd.DataFrame, dtcols: Union[str, list[str]]
     ) -> pd.DataFrame:
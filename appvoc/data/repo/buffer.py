@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/data/repo/buffer.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 06:02:45 pm                                              #
+# Modified   : Saturday October 17th 2026 06:02:45 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Write Buffer Module"""
+from __future__ import annotations
+import time
+
+import pandas as pd
+
+from appvoc.infrastructure.database.base import DEFAULT_BUFFER_OPTIONS
+
+
+# ------------------------------------------------------------------------------------------------ #
+class WriteBuffer:
+    """Accumulates rows bound for one repository until a flush threshold is reached.
+
+    Args:
+        rows (int): Number of buffered rows at which the buffer is due. Default = 10000
+        bytes (int): In-memory size of the buffered rows, in bytes, at which the buffer
+            is due. Default = 16777216
+        seconds (float): Age of the oldest buffered rows, in seconds, at which the buffer
+            is due. Default = 30
+    """
+
+    def __init__(
+        self,
+        rows: int = DEFAULT_BUFFER_OPTIONS["rows"],
+        bytes: int = DEFAULT_BUFFER_OPTIONS["bytes"],
+        seconds: float = DEFAULT_BUFFER_OPTIONS["seconds"],
+    ) -> None:
+        self._max_rows = rows
+        self._max_bytes = bytes
+        self._max_seconds = seconds
+        self._frames = []
+        self._rows = 0
+        self._bytes = 0
+        self._since = None
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    @property
+    def age(self) -> float:
+        """Returns seconds since the oldest buffered rows were added, or zero if empty."""
+        return time.monotonic() - self._since if self._since is not None else 0.0
+
+    @property
+    def due(self) -> bool:
+        """Returns True if any of the row, byte or time thresholds has been reached."""
+        if self._rows == 0:
+            return False
+        return (
+            self._rows >= self._max_rows
+            or self._bytes >= self._max_bytes
+            or self.age >= self._max_seconds
+        )
+
+    def add(self, data: pd.DataFrame) -> None:
+        """Adds the rows of a DataFrame to the buffer.
+
+        Args:
+            data (pd.DataFrame): Rows to be written.
+        """
+        if len(data) == 0:
+            return
+        if self._since is None:
+            self._since = time.monotonic()
+        self._frames.append(data)
+        self._rows += len(data)
+        self._bytes += int(data.memory_usage(index=False, deep=True).sum())
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Returns the buffered rows in a single DataFrame, leaving them in the buffer."""
+        if len(self._frames) > 1:
+            self._frames = [pd.concat(self._frames, ignore_index=True)]
+        return self._frames[0] if self._frames else pd.DataFrame()
+
+    def clear(self) -> None:
+        """Empties the buffer, once its rows have been written."""
+        self._frames = []
+        self._rows = 0
+        self._bytes = 0
+        self._since = None
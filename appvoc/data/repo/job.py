@@ -17,7 +17,11 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import logging
+import os
+import socket
+from datetime import datetime
 from typing import Union
+from uuid import uuid4
 
 import numpy as np
 import pandas as pd
@@ -27,6 +31,7 @@ from appvoc.data.acquisition.base import Job
 from appvoc.data.acquisition.rating.job import RatingJobRun
 from appvoc.data.acquisition.review.job import ReviewJobRun
 from appvoc.data.repo.base import Repo
+from appvoc.data.repo.predicate import Eq
 from appvoc.infrastructure.database.base import Database
 from appvoc.infrastructure.file.config import FileConfig
 
@@ -39,9 +44,11 @@ JOB_DATAFRAME_DTYPES = {
     "category_id": "category",
     "category": "category",
     "complete": bool,
+    "leased_by": "string",
 }
 JOB_PARSE_DATES = {
     "completed": {"errors": "coerce", "format": "%Y-%m-%d %H:%M:%S", "exact": False},
+    "lease_expires": {"errors": "coerce"},
 }
 
 JOB_DATABASE_DTYPES = {
@@ -51,6 +58,8 @@ JOB_DATABASE_DTYPES = {
     "category": VARCHAR(64),
     "complete": TINYINT,
     "completed": VARCHAR(64),
+    "leased_by": VARCHAR(128),
+    "lease_expires": DATETIME,
 }
 
 
@@ -87,10 +96,16 @@ class JobRepo(Repo):
     def load(self, data: pd.DataFrame) -> None:
         """Adds the dataframe rows to the designated table.
 
+        Jobs read from files predate leasing, so the lease columns are added, unleased, if
+        missing.
+
         Args:
             data (pd.DataFrame): DataFrame containing rows to add to the table.
         """
         data = self._parse_datetime(data=data, dtcols="completed")
+        missing = [c for c in ("leased_by", "lease_expires") if c not in data.columns]
+        if len(missing) > 0:
+            data = data.assign(**{column: None for column in missing})
 
         self._database.insert(
             data=data,
@@ -117,17 +132,100 @@ class JobRepo(Repo):
         return Job.from_df(df=df)
 
     def next(self, controller: str) -> Job:
-        """Returns a randomly selected job not yet completed"""
+        """Claims and returns a job for the controller not yet completed
+
+        Args:
+            controller (str): Name of the controller whose jobs are served.
+        """
+        return self.claim(controller=controller)
+
+    def claim(self, controller: str, worker: str = None, lease: int = 600) -> Job:
+        """Atomically leases an incomplete job for the controller to the worker.
+
+        A job is available if it is incomplete, and unleased or its lease has expired. The
+        conditional UPDATE locks the row it claims, so concurrent workers, in other processes
+        or on other hosts, never claim the same job. Lease expiry is computed on the database
+        clock, so workers need not agree on the time.
 
-        df = self.getall()
-        jobs = df.loc[
-            (df["complete"] == False) & (df["controller"] == controller)
-        ]  # noqa
-        if len(jobs) == 0:
+        Args:
+            controller (str): Name of the controller whose jobs are served.
+            worker (str): Identifies the worker claiming the job. Defaults to host:pid.
+            lease (int): Duration of the lease in seconds. Default = 600
+
+        Returns: The claimed Job, or None if no jobs are available.
+        """
+        worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+        # Unique per claim, so the claimed row can be read back unambiguously.
+        token = f"{worker}/{uuid4().hex}"
+        query = f"""UPDATE {self._name}
+            SET leased_by = :token, lease_expires = NOW() + INTERVAL :lease SECOND
+            WHERE controller = :controller AND complete = 0
+            AND (lease_expires IS NULL OR lease_expires < NOW())
+            LIMIT 1;"""
+        params = {"token": token, "lease": lease, "controller": controller}
+        claimed = self._database.update(query=query, params=params)
+        self.save()
+        if claimed == 0:
             return None
-        else:
-            job = jobs.sample(n=1)
-            return Job.from_df(df=job)
+
+        df = self.find(
+            filters=[Eq("leased_by", token)],
+            dtypes=JOB_DATAFRAME_DTYPES,
+            parse_dates=JOB_PARSE_DATES,
+        )
+        job = Job.from_df(df=df)
+        msg = f"Job {job.id} leased to {worker} for {lease} seconds."
+        self._logger.debug(msg)
+        return job
+
+    def renew(self, job: Job, lease: int = 600) -> bool:
+        """Extends the lease on a job held by the worker.
+
+        Args:
+            job (Job): A job returned by claim.
+            lease (int): Duration of the lease from now, in seconds. Default = 600
+
+        Returns: True if the lease was renewed; False if it is no longer held by the worker.
+        """
+        query = f"""UPDATE {self._name}
+            SET lease_expires = NOW() + INTERVAL :lease SECOND
+            WHERE id = :id AND leased_by = :token AND complete = 0;"""
+        params = {"lease": lease, "id": job.id, "token": job.leased_by}
+        renewed = self._database.update(query=query, params=params)
+        self.save()
+        return renewed == 1
+
+    def complete(self, job: Job, completed: datetime) -> bool:
+        """Marks a job complete, provided its lease is still held by the worker.
+
+        Args:
+            job (Job): A job returned by claim.
+            completed (datetime): Time at which the job was completed.
+
+        Returns: True if the lease was held and the job completed.
+        """
+        query = f"""UPDATE {self._name} SET complete = 1, completed = :completed,
+            leased_by = NULL, lease_expires = NULL
+            WHERE id = :id AND leased_by = :token AND complete = 0;"""
+        params = {"completed": completed, "id": job.id, "token": job.leased_by}
+        ended = self._database.update(query=query, params=params)
+        self.save()
+        return ended == 1
+
+    def release(self, job: Job) -> bool:
+        """Releases the lease on a job held by the worker, making it available to others.
+
+        Args:
+            job (Job): A job returned by claim.
+
+        Returns: True if the lease was held and released.
+        """
+        query = f"""UPDATE {self._name} SET leased_by = NULL, lease_expires = NULL
+            WHERE id = :id AND leased_by = :token;"""
+        params = {"id": job.id, "token": job.leased_by}
+        released = self._database.update(query=query, params=params)
+        self.save()
+        return released == 1
 
     def getall(
         self, dtypes: dict = JOB_DATAFRAME_DTYPES, parse_dates: dict = JOB_PARSE_DATES
@@ -135,12 +233,35 @@ class JobRepo(Repo):
         """Returns all data in the repository."""
         return super().getall(dtypes=dtypes, parse_dates=parse_dates)
 
+    def progress(self, controller: str) -> dict:
+        """Returns the number of jobs for the controller that are complete, leased and pending.
+
+        Args:
+            controller (str): Name of the controller whose jobs are counted.
+        """
+        query = f"""SELECT COUNT(*) AS jobs,
+            COALESCE(SUM(complete = 1), 0) AS complete,
+            COALESCE(SUM(complete = 0 AND lease_expires >= NOW()), 0) AS leased
+            FROM {self._name} WHERE controller = :controller;"""
+        params = {"controller": controller}
+        row = self._database.execute(query=query, params=params).one()
+        jobs, complete, leased = (int(value) for value in row)
+        return {
+            "jobs": jobs,
+            "complete": complete,
+            "leased": leased,
+            "pending": jobs - complete - leased,
+        }
+
     def update(self, job: Job) -> None:
         """Updates a job in the database"""
-        query = f"UPDATE {self._name} SET complete = :complete, completed = :completed WHERE id = :id;"
+        query = f"""UPDATE {self._name} SET complete = :complete, completed = :completed,
+            leased_by = :leased_by, lease_expires = :lease_expires WHERE id = :id;"""
         params = {
             "complete": job.complete,
             "completed": job.completed,
+            "leased_by": job.leased_by,
+            "lease_expires": job.lease_expires,
             "id": job.id,
         }
         self._database.update(query=query, params=params)
@@ -148,18 +269,16 @@ class JobRepo(Repo):
     def replace(self, data: pd.DataFrame) -> None:
         """Replaces the data in a repository with that of the data parameter.
 
+        The table is emptied and appended to, rather than recreated from the frame, so the
+        lease columns, primary key and indexes of the migrated table are retained.
+
         Args:
             data (pd.DataFrame): DataFrame containing rows to add to the table.
         """
-        data = self._parse_datetime(data=data, dtcols="completed")
-
-        self._database.insert(
-            data=data,
-            tablename=self._name,
-            dtype=JOB_DATABASE_DTYPES,
-            if_exists="replace",
-        )
-        msg = f"Added {data.shape[0]} rows to the {self._name} repository."
+        if self._database.inspect().has_table(self._name):
+            self._database.delete(query=f"DELETE FROM {self._name};", params={})
+        self.load(data=data)
+        msg = f"Replaced {self._name} repository data with {data.shape[0]} rows."
         self._logger.debug(msg)
 
     @property
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/data/repo/predicate.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 03:32:50 pm                                              #
+# Modified   : Saturday October 17th 2026 03:32:50 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Query Predicate Module"""
+from __future__ import annotations
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+# ------------------------------------------------------------------------------------------------ #
+IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+INCLUSIVE = ("both", "neither", "left", "right")
+
+
+# ------------------------------------------------------------------------------------------------ #
+def quote(column: str) -> str:
+    """Returns the column name quoted as an SQL identifier.
+
+    Column names are interpolated into the statement, so only plain identifiers are accepted.
+
+    Args:
+        column (str): The column name.
+    """
+    if not isinstance(column, str) or not IDENTIFIER.match(column):
+        raise ValueError(f"Column {column} is not a valid column name.")
+    return f"`{column}`"
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Predicate(ABC):
+    """Base class for filters that compile to a parameterized SQL condition."""
+
+    @abstractmethod
+    def compile(self, name: str) -> tuple[str, dict]:
+        """Returns the SQL condition and its parameters.
+
+        Args:
+            name (str): Prefix for the parameter names, unique within the statement.
+        """
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass(frozen=True)
+class Eq(Predicate):
+    """Column equals value. A None value matches NULL."""
+
+    column: str
+    value: Any
+
+    def compile(self, name: str) -> tuple[str, dict]:
+        if self.value is None:
+            return f"{quote(self.column)} IS NULL", {}
+        return f"{quote(self.column)} = :{name}", {name: self.value}
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass(frozen=True)
+class Range(Predicate):
+    """Column lies between lower and upper. A None bound is unbounded.
+
+    Args:
+        column (str): The column name.
+        lower (Any): Lower bound. Optional.
+        upper (Any): Upper bound. Optional.
+        inclusive (str): Bounds to include, as in pandas Series.between: 'both', 'neither',
+            'left' or 'right'. Default = 'both'
+    """
+
+    column: str
+    lower: Any = None
+    upper: Any = None
+    inclusive: str = "both"
+
+    def __post_init__(self) -> None:
+        if self.inclusive not in INCLUSIVE:
+            raise ValueError(
+                f"Inclusive {self.inclusive} is invalid. Valid values are {INCLUSIVE}."
+            )
+        if self.lower is None and self.upper is None:
+            raise ValueError(f"Range on {self.column} requires a lower or upper bound.")
+
+    def compile(self, name: str) -> tuple[str, dict]:
+        column = quote(self.column)
+        conditions = []
+        params = {}
+        if self.lower is not None:
+            op = ">=" if self.inclusive in ("both", "left") else ">"
+            conditions.append(f"{column} {op} :{name}_lower")
+            params[f"{name}_lower"] = self.lower
+        if self.upper is not None:
+            op = "<=" if self.inclusive in ("both", "right") else "<"
+            conditions.append(f"{column} {op} :{name}_upper")
+            params[f"{name}_upper"] = self.upper
+        return " AND ".join(conditions), params
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass(frozen=True)
+class In(Predicate):
+    """Column is one of the values. An empty list matches no rows."""
+
+    column: str
+    values: tuple
+
+    def compile(self, name: str) -> tuple[str, dict]:
+        values = list(self.values)
+        if len(values) == 0:
+            return "1 = 0", {}
+        params = {f"{name}_{i}": value for i, value in enumerate(values)}
+        placeholders = ", ".join([f":{param}" for param in params])
+        return f"{quote(self.column)} IN ({placeholders})", params
+
+
+# ------------------------------------------------------------------------------------------------ #
+def compile_select(
+    tablename: str, columns: list = None, filters: list = None
+) -> tuple[str, dict]:
+    """Returns a SELECT statement projecting the columns and matching all filters.
+
+    Args:
+        tablename (str): The name of the table in the database.
+        columns (list): Columns to select. Selects all columns if None.
+        filters (list): Predicates the rows must satisfy. Optional.
+    """
+    projection = ", ".join([quote(column) for column in columns]) if columns else "*"
+    query = f"SELECT {projection} FROM {quote(tablename)}"
+    params = {}
+    conditions = []
+    for i, predicate in enumerate(filters or []):
+        condition, predicate_params = predicate.compile(name=f"p{i}")
+        conditions.append(condition)
+        params.update(predicate_params)
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return query + ";", params
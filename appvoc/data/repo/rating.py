@@ -17,6 +17,7 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import logging
+from typing import Iterator
 
 import pandas as pd
 import numpy as np
@@ -89,12 +90,12 @@ class RatingRepo(Repo):
     def load(self, data: pd.DataFrame) -> None:
         """Adds the dataframe rows to the designated table.
 
+        Rows are upserted by id, so reloading an entity replaces rather than duplicates it.
+
         Args:
             data (pd.DataFrame): DataFrame containing rows to add to the table.
         """
-        self._database.insert(
-            data=data, tablename=self._name, dtype=DATABASE_DTYPES, if_exists="append"
-        )
+        self._database.upsert(data=data, tablename=self._name, dtype=DATABASE_DTYPES)
         msg = f"Added {data.shape[0]} rows to the {self._name} repository."
         self._logger.debug(msg)
 
@@ -122,6 +123,33 @@ class RatingRepo(Repo):
 
         return super().getall(dtypes=DATAFRAME_DTYPES)
 
+    def find(self, columns: list = None, filters: list = None) -> pd.DataFrame:
+        """Returns the selected columns of the rows matching all filters.
+
+        Args:
+            columns (list): Columns to return. Returns all columns if None.
+            filters (list): Eq, Range and In predicates the rows must satisfy.
+        """
+        return super().find(
+            columns=columns,
+            filters=filters,
+            dtypes=DATAFRAME_DTYPES,
+        )
+
+    def iter_all(self, chunksize: int = 10000) -> Iterator[pd.DataFrame]:
+        """Streams all data in the repository in DataFrames of 'chunksize' rows."""
+        return super().iter_all(chunksize=chunksize, dtypes=DATAFRAME_DTYPES)
+
+    def iter_by_category(
+        self, category_id: str, chunksize: int = 10000
+    ) -> Iterator[pd.DataFrame]:
+        """Streams the data for a category in DataFrames of 'chunksize' rows."""
+        return super().iter_by_category(
+            category_id=category_id,
+            chunksize=chunksize,
+            dtypes=DATAFRAME_DTYPES,
+        )
+
     def get_dataset(self) -> RatingDataset:
         df = self.getall()
         return RatingDataset(df=df)
@@ -141,11 +169,15 @@ class RatingRepo(Repo):
     @property
     def summary(self) -> pd.DataFrame:
         """Summarizes the app data by category"""
-        df = self.getall()
-        summary = df["category"].value_counts().reset_index()
-        df2 = df.groupby(by="category")["id"].nunique().to_frame()
-        df3 = df.groupby(by="category")["rating"].mean().to_frame()
-        summary = summary.join(df2, on="category")
-        summary = summary.join(df3, on="category")
-        summary.columns = ["Category", "Reviews", "Apps", "Average Rating"]
-        return summary
+        query = f"""SELECT category AS Category,
+            COUNT(*) AS Reviews,
+            COUNT(DISTINCT id) AS Apps,
+            AVG(rating) AS `Average Rating`
+            FROM {self._name}
+            WHERE category IS NOT NULL
+            GROUP BY category
+            ORDER BY Reviews DESC;"""
+        return self._database.query(
+            query=query,
+            dtypes={"Reviews": "int64", "Apps": "int64", "Average Rating": "float64"},
+        )
@@ -23,6 +23,7 @@ import pandas as pd
 from sqlalchemy.dialects.mysql import INTEGER, VARCHAR
 
 from appvoc.data.repo.base import Repo
+from appvoc.data.repo.predicate import Eq
 from appvoc.domain.review.request import ReviewRequest
 from appvoc.infrastructure.database.base import Database
 from appvoc.infrastructure.file.config import FileConfig
@@ -100,6 +101,39 @@ class ReviewRequestRepo(Repo):
 
         return super().getall(dtypes=DATAFRAME_DTYPES)
 
+    def get_requests(self, category_id: str) -> dict[str, ReviewRequest]:
+        """Returns the requests for a category in a dictionary keyed by app id.
+
+        Args:
+            category_id (str): The four character AppVoC category identifier.
+        """
+        df = self.find(
+            filters=[Eq("category_id", category_id)], dtypes=DATAFRAME_DTYPES
+        )
+        return {row["id"]: ReviewRequest.from_series(row) for _, row in df.iterrows()}
+
+    def upsert_requests(self, requests: list[ReviewRequest]) -> int:
+        """Writes the requests in a single bulk upsert, inserting new and updating existing.
+
+        Args:
+            requests (list[ReviewRequest]): The requests to write.
+
+        Returns: Number of requests written.
+        """
+        if len(requests) == 0:
+            return 0
+        data = pd.DataFrame(
+            {
+                "id": [request.id for request in requests],
+                "category_id": [request.category_id for request in requests],
+                "last_index": [request.last_index for request in requests],
+            }
+        )
+        self._database.upsert(data=data, tablename=self._name, dtype=DATABASE_DTYPES)
+        msg = f"Upserted {data.shape[0]} rows to the {self._name} repository."
+        self._logger.debug(msg)
+        return data.shape[0]
+
     def update(self, request: ReviewRequest) -> None:
         """Updates a request in the repository
 
@@ -146,5 +180,10 @@ class ReviewRequestRepo(Repo):
     @property
     def summary(self) -> pd.DataFrame:
         """Summarizes the requests by category"""
-        df = self.getall()
-        return df.groupby(["category_id"])["id"].nunique().to_frame()
+        query = f"""SELECT category_id, COUNT(DISTINCT id) AS id
+            FROM {self._name}
+            WHERE category_id IS NOT NULL
+            GROUP BY category_id
+            ORDER BY category_id;"""
+        df = self._database.query(query=query, dtypes={"id": "int64"})
+        return df.set_index("category_id")
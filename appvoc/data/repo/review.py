@@ -17,6 +17,7 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import logging
+from typing import Iterator
 
 import pandas as pd
 import numpy as np
@@ -93,12 +94,12 @@ class ReviewRepo(Repo):
     def load(self, data: pd.DataFrame) -> None:
         """Adds the dataframe rows to the designated table.
 
+        Rows are upserted by id, so reloading an entity replaces rather than duplicates it.
+
         Args:
             data (pd.DataFrame): DataFrame containing rows to add to the table.
         """
-        self._database.insert(
-            data=data, tablename=self._name, dtype=DATABASE_DTYPES, if_exists="append"
-        )
+        self._database.upsert(data=data, tablename=self._name, dtype=DATABASE_DTYPES)
         msg = f"Added {data.shape[0]} rows to the {self._name} repository."
         self._logger.debug(msg)
 
@@ -124,6 +125,37 @@ class ReviewRepo(Repo):
 
         return super().getall(dtypes=DATAFRAME_DTYPES, parse_dates=PARSE_DATES)
 
+    def find(self, columns: list = None, filters: list = None) -> pd.DataFrame:
+        """Returns the selected columns of the rows matching all filters.
+
+        Args:
+            columns (list): Columns to return. Returns all columns if None.
+            filters (list): Eq, Range and In predicates the rows must satisfy.
+        """
+        return super().find(
+            columns=columns,
+            filters=filters,
+            dtypes=DATAFRAME_DTYPES,
+            parse_dates=PARSE_DATES,
+        )
+
+    def iter_all(self, chunksize: int = 10000) -> Iterator[pd.DataFrame]:
+        """Streams all data in the repository in DataFrames of 'chunksize' rows."""
+        return super().iter_all(
+            chunksize=chunksize, dtypes=DATAFRAME_DTYPES, parse_dates=PARSE_DATES
+        )
+
+    def iter_by_category(
+        self, category_id: str, chunksize: int = 10000
+    ) -> Iterator[pd.DataFrame]:
+        """Streams the data for a category in DataFrames of 'chunksize' rows."""
+        return super().iter_by_category(
+            category_id=category_id,
+            chunksize=chunksize,
+            dtypes=DATAFRAME_DTYPES,
+            parse_dates=PARSE_DATES,
+        )
+
     def replace(self, data: pd.DataFrame) -> None:
         """Replaces the data in a repository with that of the data parameter.
 
@@ -143,16 +175,21 @@ class ReviewRepo(Repo):
     @property
     def summary(self) -> pd.DataFrame:
         """Summarizes the app data by category"""
-        df = self.getall()
-        df2 = df.groupby(["category"])["id"].nunique().to_frame()
-        df3 = df.groupby(["category"])["app_id"].nunique().to_frame()
-        summary = df2.join(df3, on="category").reset_index()
-        summary.columns = ["Category", "Reviews", "Apps"]
-        return summary
+        query = f"""SELECT category AS Category,
+            COUNT(DISTINCT id) AS Reviews,
+            COUNT(DISTINCT app_id) AS Apps
+            FROM {self._name}
+            WHERE category IS NOT NULL
+            GROUP BY category
+            ORDER BY category;"""
+        return self._database.query(
+            query=query, dtypes={"Reviews": "int64", "Apps": "int64"}
+        )
 
 
 # ------------------------------------------------------------------------------------------------ #
 class ReviewDatasetRepo:
     """Encapsulates a Hugging Face dataset containing training, validation, and test review data. """
     directory = "data/prod/datasets/reviews/books"
-    def __init__(self, directory: str = None)
\ No newline at end of file
+    def __init__(self, directory: str = None):
+        self._directory = directory or self.directory
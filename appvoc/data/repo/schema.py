@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/data/repo/schema.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 02:41:17 pm                                              #
+# Modified   : Saturday October 17th 2026 02:41:17 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Database Schema Module"""
+from __future__ import annotations
+import logging
+from dataclasses import dataclass, field
+
+import pandas as pd
+import sqlalchemy
+from sqlalchemy.types import Text, to_instance
+
+from appvoc.data.repo.appdata import DATABASE_DTYPES as APP_DATABASE_DTYPES
+from appvoc.data.repo.job import (
+    JOB_DATABASE_DTYPES,
+    RATING_JOBRUN_DATABASE_DTYPES,
+    REVIEW_JOBRUN_DATABASE_DTYPES,
+)
+from appvoc.data.repo.rating import DATABASE_DTYPES as RATING_DATABASE_DTYPES
+from appvoc.data.repo.request import DATABASE_DTYPES as REQUEST_DATABASE_DTYPES
+from appvoc.data.repo.review import DATABASE_DTYPES as REVIEW_DATABASE_DTYPES
+from appvoc.infrastructure.database.base import Database
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass(frozen=True)
+class Index:
+    """Secondary index on one or more columns of a table."""
+
+    columns: tuple
+    unique: bool = False
+
+    def name(self, tablename: str) -> str:
+        return f"ix_{tablename}_{'_'.join(self.columns)}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass(frozen=True)
+class TableSchema:
+    """Declared columns, primary key and secondary indexes of a table."""
+
+    name: str
+    columns: dict
+    primary_key: str = "id"
+    indexes: tuple = field(default_factory=tuple)
+
+    def to_table(self) -> sqlalchemy.Table:
+        """Returns the SQLAlchemy table definition, including the key and indexes."""
+        metadata = sqlalchemy.MetaData()
+        columns = [
+            sqlalchemy.Column(name, dtype, primary_key=name == self.primary_key)
+            for name, dtype in self.columns.items()
+        ]
+        indexes = [
+            sqlalchemy.Index(index.name(self.name), *index.columns, unique=index.unique)
+            for index in self.indexes
+        ]
+        return sqlalchemy.Table(self.name, metadata, *columns, *indexes)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      APPVOC SCHEMA                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Indexes cover the columns used in the WHERE and GROUP BY clauses of the repositories: category
+# summaries, review lookups by app, unfinished jobs by controller and job runs by job.
+SCHEMA = (
+    TableSchema(
+        name="review",
+        columns=REVIEW_DATABASE_DTYPES,
+        indexes=(Index(("category_id",)), Index(("app_id",))),
+    ),
+    TableSchema(
+        name="rating",
+        columns=RATING_DATABASE_DTYPES,
+        indexes=(Index(("category_id",)),),
+    ),
+    TableSchema(
+        name="app",
+        columns=APP_DATABASE_DTYPES,
+        indexes=(Index(("category_id",)),),
+    ),
+    TableSchema(
+        name="job",
+        columns=JOB_DATABASE_DTYPES,
+        indexes=(Index(("controller", "complete")),),
+    ),
+    TableSchema(
+        name="review_request",
+        columns=REQUEST_DATABASE_DTYPES,
+        indexes=(Index(("category_id",)),),
+    ),
+    TableSchema(
+        name="rating_jobrun",
+        columns=RATING_JOBRUN_DATABASE_DTYPES,
+        indexes=(Index(("jobid",)),),
+    ),
+    TableSchema(
+        name="review_jobrun",
+        columns=REVIEW_JOBRUN_DATABASE_DTYPES,
+        indexes=(Index(("jobid",)),),
+    ),
+)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class SchemaManager:
+    """Creates the AppVoC tables and brings existing tables up to the declared schema.
+
+    Tables written by pandas carry neither keys nor indexes, so every lookup by category,
+    app or job scans the full table. Migration is idempotent: missing tables are created
+    with their keys and indexes; existing tables gain missing columns, the primary key
+    and any missing secondary indexes. Nothing is dropped.
+
+    Args:
+        database (Database): The database in which the tables reside.
+        tables (tuple): Table schemas to manage. Defaults to the AppVoC schema.
+    """
+
+    def __init__(self, database: Database, tables: tuple = SCHEMA) -> None:
+        self._database = database
+        self._tables = tables
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+
+    def migrate(self) -> None:
+        """Creates missing tables and adds missing columns, keys and indexes."""
+        for schema in self._tables:
+            inspector = self._database.inspect()
+            if not inspector.has_table(schema.name):
+                msg = f"Creating table {schema.name}."
+                self._logger.info(msg)
+                self._database.create_table(schema.to_table())
+            else:
+                self._migrate_table(schema=schema, inspector=inspector)
+        self._database.commit()
+
+    def report(self) -> pd.DataFrame:
+        """Returns the declared indexes of each table and whether each exists in the database."""
+        rows = []
+        inspector = self._database.inspect()
+        for schema in self._tables:
+            exists = inspector.has_table(schema.name)
+            present = self._indexed_columns(schema.name, inspector) if exists else set()
+            primary = self._primary_key(schema.name, inspector) if exists else []
+            rows.append(
+                {
+                    "Table": schema.name,
+                    "Index": "PRIMARY",
+                    "Columns": schema.primary_key,
+                    "Present": primary == [schema.primary_key],
+                }
+            )
+            for index in schema.indexes:
+                rows.append(
+                    {
+                        "Table": schema.name,
+                        "Index": index.name(schema.name),
+                        "Columns": ", ".join(index.columns),
+                        "Present": tuple(index.columns) in present,
+                    }
+                )
+        report = pd.DataFrame(rows)
+        missing = report.loc[~report["Present"]]
+        for _, row in missing.iterrows():
+            msg = f"Table {row['Table']} is missing index {row['Index']} on {row['Columns']}."
+            self._logger.warning(msg)
+        return report
+
+    # -------------------------------------------------------------------------------------------- #
+    def _migrate_table(
+        self, schema: TableSchema, inspector: sqlalchemy.engine.Inspector
+    ) -> None:
+        """Brings an existing table up to its declared schema."""
+        dialect = inspector.dialect
+        existing = {
+            column["name"]: column["type"]
+            for column in inspector.get_columns(schema.name)
+        }
+        keys = {schema.primary_key}.union(*[index.columns for index in schema.indexes])
+
+        for name, dtype in schema.columns.items():
+            ddl = f"`{name}` {to_instance(dtype).compile(dialect=dialect)}"
+            if name not in existing:
+                msg = f"Adding column {name} to table {schema.name}."
+                self._logger.info(msg)
+                self._database.execute(
+                    query=f"ALTER TABLE `{schema.name}` ADD COLUMN {ddl};"
+                )
+            elif name in keys and isinstance(existing[name], Text):
+                # TEXT columns cannot be indexed without a prefix length.
+                msg = f"Converting column {name} of table {schema.name} to an indexable type."
+                self._logger.info(msg)
+                self._database.execute(
+                    query=f"ALTER TABLE `{schema.name}` MODIFY COLUMN {ddl};"
+                )
+
+        if not self._primary_key(schema.name, inspector):
+            self._database.add_primary_key(
+                tablename=schema.name, key=schema.primary_key
+            )
+
+        present = self._indexed_columns(schema.name, self._database.inspect())
+        for index in schema.indexes:
+            if tuple(index.columns) not in present:
+                msg = (
+                    f"Creating index {index.name(schema.name)} on table {schema.name}."
+                )
+                self._logger.info(msg)
+                unique = "UNIQUE " if index.unique else ""
+                columns = ", ".join([f"`{column}`" for column in index.columns])
+                self._database.execute(
+                    query=f"CREATE {unique}INDEX `{index.name(schema.name)}` ON `{schema.name}` ({columns});"
+                )
+
+    def _primary_key(
+        self, tablename: str, inspector: sqlalchemy.engine.Inspector
+    ) -> list:
+        return inspector.get_pk_constraint(tablename)["constrained_columns"]
+
+    def _indexed_columns(
+        self, tablename: str, inspector: sqlalchemy.engine.Inspector
+    ) -> set:
+        """Returns the column tuples covered by the secondary indexes on the table."""
+        return {
+            tuple(index["column_names"]) for index in inspector.get_indexes(tablename)
+        }
+
+
+# ------------------------------------------------------------------------------------------------ #
+def init_schema(database: Database) -> SchemaManager:
+    """Migrates the AppVoC schema and returns the manager. Used as a container resource."""
+    schema = SchemaManager(database=database)
+    schema.migrate()
+    return schema
@@ -16,9 +16,16 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+from __future__ import annotations
 import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+import pandas as pd
 
 from appvoc.data.repo.base import Repo
+from appvoc.data.repo.buffer import WriteBuffer
 from appvoc.infrastructure.database.base import Database
 
 
@@ -28,6 +35,14 @@ from appvoc.infrastructure.database.base import Database
 class UoW:
     """Unit of Work class encapsulating the repositories used in project objects.
 
+    Repositories are constructed on first access and cached for the life of the unit of work.
+
+    Rows added through the buffer method are written behind: they accumulate per repository
+    and are written in one bulk load and one commit when the row, byte or time thresholds in
+    the database buffer options are reached, or when flush is called. Updates deferred
+    through the defer method are written in the same commit, so that progress recorded with
+    them never runs ahead of the buffered rows.
+
     Args:
         database (Database): A Database instance from the dependency injector container.
         content (Repo): The content repository
@@ -56,6 +71,10 @@ class UoW:
         self._rating_jobrun_repo = rating_jobrun_repo
         self._review_jobrun_repo = review_jobrun_repo
         self._review_request_repo = review_request_repo
+        self._repos = {}
+        self._buffers = {}
+        self._deferred = {}
+        self._lock = threading.RLock()
 
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
@@ -65,35 +84,140 @@ class UoW:
 
     @property
     def app_repo(self) -> Repo:
-        return self._app_repo(database=self._database)
+        return self._get_repo(name="app_repo")
 
     @property
     def review_repo(self) -> Repo:
-        return self._review_repo(database=self._database)
+        return self._get_repo(name="review_repo")
 
     @property
     def rating_repo(self) -> Repo:
-        return self._rating_repo(database=self._database)
+        return self._get_repo(name="rating_repo")
 
     @property
     def app_project_repo(self) -> Repo:
-        return self._app_project_repo(database=self._database)
+        return self._get_repo(name="app_project_repo")
 
     @property
     def job_repo(self) -> Repo:
-        return self._job_repo(database=self._database)
+        return self._get_repo(name="job_repo")
 
     @property
     def rating_jobrun_repo(self) -> Repo:
-        return self._rating_jobrun_repo(database=self._database)
+        return self._get_repo(name="rating_jobrun_repo")
 
     @property
     def review_jobrun_repo(self) -> Repo:
-        return self._review_jobrun_repo(database=self._database)
+        return self._get_repo(name="review_jobrun_repo")
 
     @property
     def review_request_repo(self) -> Repo:
-        return self._review_request_repo(database=self._database)
+        return self._get_repo(name="review_request_repo")
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of buffered rows not yet written."""
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def buffer(self, repo: str, data: pd.DataFrame) -> None:
+        """Adds rows to the write buffer of a repository, flushing it if a threshold is reached.
+
+        Args:
+            repo (str): Name of the repository property, i.e. 'review_repo'.
+            data (pd.DataFrame): Rows to be loaded into the repository.
+        """
+        if not isinstance(getattr(type(self), repo, None), property):
+            msg = f"Repository {repo} is not a repository of the unit of work."
+            self._logger.exception(msg)
+            raise ValueError(msg)
+        with self._lock:
+            if repo not in self._buffers:
+                self._buffers[repo] = WriteBuffer(**self._database.buffer_options)
+            self._buffers[repo].add(data)
+            self.flush_due()
+
+    def flush_due(self) -> int:
+        """Flushes the buffers that have reached a threshold, including the time threshold of
+        repositories that have received no rows since.
+
+        Returns: Number of rows written.
+        """
+        with self._lock:
+            due = [name for name, buffer in self._buffers.items() if buffer.due]
+            return sum(self.flush(repo=name) for name in due)
+
+    def defer(self, repo: str, key: str, **kwargs) -> None:
+        """Defers a repository update until the next flush.
+
+        The update replaces any deferred for the same repository and key, so only the latest
+        is written.
+
+        Args:
+            repo (str): Name of the repository property, i.e. 'review_jobrun_repo'.
+            key (str): Identifies the entity updated, i.e. the job run id.
+            **kwargs: Keyword arguments for the repository's update method.
+        """
+        if not isinstance(getattr(type(self), repo, None), property):
+            msg = f"Repository {repo} is not a repository of the unit of work."
+            self._logger.exception(msg)
+            raise ValueError(msg)
+        with self._lock:
+            self._deferred[(repo, key)] = kwargs
+
+    def flush(self, repo: str = None) -> int:
+        """Writes buffered rows in one bulk load per repository and deferred updates, and
+        commits once.
+
+        Rows and updates are removed from the buffer only once committed. If the write
+        fails, they are retained for the next flush.
+
+        Args:
+            repo (str): Name of the repository property to flush. Flushes all if None.
+
+        Returns: Number of rows written.
+        """
+        with self._lock:
+            names = [repo] if repo is not None else list(self._buffers.keys())
+            buffers = {
+                name: self._buffers[name]
+                for name in names
+                if name in self._buffers and len(self._buffers[name]) > 0
+            }
+            if len(buffers) == 0 and len(self._deferred) == 0:
+                return 0
+            rows = 0
+            try:
+                for name, buffer in buffers.items():
+                    data = buffer.data
+                    getattr(self, name).load(data=data)
+                    rows += len(data)
+                for (name, _), kwargs in self._deferred.items():
+                    getattr(self, name).update(**kwargs)
+                self._database.commit()
+            except Exception as e:
+                msg = f"{type(e)} exception occurred flushing the write buffer. Rolling back.\n{e}"
+                self._logger.exception(msg)
+                self._database.rollback()
+                raise
+            for buffer in buffers.values():
+                buffer.clear()
+            self._deferred = {}
+            msg = f"Flushed {rows} buffered rows from {list(buffers.keys())}."
+            self._logger.debug(msg)
+            return rows
+
+    def _get_repo(self, name: str) -> Repo:
+        """Returns the repository, constructing it on first access.
+
+        Repositories hold no connection state of their own; the database binds a connection
+        to each thread. A single instance per repository is therefore shared by all callers.
+        """
+        repo = self._repos.get(name)
+        if repo is None:
+            repo = self._repos.setdefault(
+                name, getattr(self, f"_{name}")(database=self._database)
+            )
+        return repo
 
     def connect(self) -> None:
         """Connects the database"""
@@ -103,6 +227,22 @@ class UoW:
         """Begin a transaction"""
         self._database.begin()
 
+    @contextmanager
+    def transaction(self) -> Iterator[UoW]:
+        """Runs the enclosed operations as one transaction on the calling thread's connection.
+
+        Commits if the block completes and rolls back if it raises. Each thread has its own
+        connection, so transactions in concurrent threads are independent.
+        """
+        self._database.begin()
+        try:
+            yield self
+        except Exception:
+            self._database.rollback()
+            raise
+        else:
+            self._database.commit()
+
     def save(self) -> None:
         """Saves changes to the underlying sqlite context"""
         self._database.commit()
@@ -112,5 +252,6 @@ class UoW:
         self._database.rollback()
 
     def close(self) -> None:
-        """Closes the sqlite connection."""
+        """Flushes buffered rows and closes the sqlite connection."""
+        self.flush()
         self._database.close()
@@ -24,6 +24,7 @@ import pandas as pd
 import requests
 
 from appvoc.data.acquisition.base import Response
+from appvoc.infrastructure.web.decode import decode
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -37,7 +38,7 @@ class AppDataResponse(Response):
     def add_response(self, response: requests.Response, page: int) -> None:
         """Adds result content to the instance"""
         records_list = []
-        records = response.json()["results"]
+        records = decode(response)["results"]
         for record in records:
             self.records += 1
             app = {}
@@ -20,6 +20,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import pandas as pd
+
 from appvoc.domain.request import Request
 
 
@@ -38,3 +40,11 @@ class ReviewRequest(Request):
             category_id=request["category_id"],
             last_index=request["last_index"],
         )
+
+    @classmethod
+    def from_series(cls, request: pd.Series) -> ReviewRequest:
+        return cls(
+            id=request["id"],
+            category_id=request["category_id"],
+            last_index=int(request["last_index"]),
+        )
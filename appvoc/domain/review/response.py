@@ -27,6 +27,7 @@ import requests
 
 from appvoc.domain.app.app import App
 from appvoc.domain.response import Response
+from appvoc.infrastructure.web.decode import decode
 from appvoc.infrastructure.web.utils import getsize
 
 
@@ -57,7 +58,7 @@ class ReviewResponse(Response):
 
         self.size += getsize(response=response)
 
-        for data in response.json()["userReviewList"]:
+        for data in decode(response)["userReviewList"]:
             review = self._parse_review(data=data)
             if review is not None:
                 self.content.append(review)
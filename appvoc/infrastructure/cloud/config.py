@@ -16,12 +16,10 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import os
 from dotenv import load_dotenv
 import logging
 
 from appvoc.config import Config
-from appvoc.infrastructure.file.io import IOService
 
 # ------------------------------------------------------------------------------------------------ #
 load_dotenv()
@@ -29,10 +27,10 @@ load_dotenv()
 
 
 class CloudConfig(Config):
+    _section = "cloud"
+
     def __init__(self) -> None:
         super().__init__()
-        self._config_file = os.getenv("PERSISTENCE_CONFIG")
-        self._config = IOService.read(self._config_file)["cloud"]
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
     @property
@@ -20,25 +20,51 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 import logging
+import re
+import threading
+from typing import Iterator, Union
 
+import numpy as np
 import sqlalchemy
 from sqlalchemy.exc import SQLAlchemyError
 import pandas as pd
 
 # ------------------------------------------------------------------------------------------------ #
 DBNAMES = ["appvoc", "googleplay"]
+# ------------------------------------------------------------------------------------------------ #
+#   Bulk load methods supported by Database.insert:
+#       to_sql:         pandas to_sql, one INSERT per row batch.
+#       multi:          pandas to_sql, multi-row VALUES statements of 'chunksize' rows.
+#       executemany:    DBAPI executemany of 'chunksize' rows, which pymysql rewrites into
+#                       multi-row INSERT statements.
+#       infile:         LOAD DATA LOCAL INFILE from a temporary file. Database specific.
+LOAD_METHODS = ["to_sql", "multi", "executemany", "infile"]
+DEFAULT_LOAD_OPTIONS = {"method": "to_sql", "chunksize": None}
+# Thresholds at which rows buffered for writing are flushed: rows, bytes and seconds.
+DEFAULT_BUFFER_OPTIONS = {"rows": 10000, "bytes": 16777216, "seconds": 30}
+# Statements after which the cache of existing tables is invalidated.
+DDL_PATTERN = re.compile(r"\b(DROP|RENAME|ALTER|TRUNCATE)\s+TABLE\b", re.IGNORECASE)
 
 
 # ------------------------------------------------------------------------------------------------ #
 class Database(ABC):
-    """Abstract base class for databases."""
+    """Abstract base class for databases.
+
+    The engine, and its connection pool, is shared by all threads. Each thread checks out
+    its own connection from the pool on first use, so repositories may be used from worker
+    threads, and transactions begun in a thread are bound to that thread's connection.
+    """
 
     def __init__(self) -> None:
         self._name = None
         self._engine = None
-        self._connection = None
-        self._transaction = None
-        self._is_connected = False
+        self._isolation_level = None
+        # Connection and transaction of the current thread.
+        self._local = threading.local()
+        # Tables known to exist, and tables known to have a primary key. Spares schema
+        # inspection on each insert.
+        self._tables = set()
+        self._keyed = set()
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
     @property
@@ -48,8 +74,39 @@ class Database(ABC):
 
     @property
     def is_connected(self) -> bool:
-        """If connected, returns True; otherwise..."""
-        return self._is_connected
+        """Returns True if the current thread holds an open connection."""
+        connection = getattr(self._local, "connection", None)
+        return connection is not None and not connection.closed
+
+    @property
+    def _connection(self) -> sqlalchemy.Connection:
+        """Returns the connection of the current thread, checking one out if necessary."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or connection.closed:
+            if self._engine is None:
+                raise sqlalchemy.exc.UnboundExecutionError("Database is not connected.")
+            connection = self._checkout()
+            self._local.connection = connection
+        return connection
+
+    @_connection.setter
+    def _connection(self, connection: sqlalchemy.Connection) -> None:
+        self._local.connection = connection
+
+    @property
+    def _transaction(self) -> sqlalchemy.RootTransaction:
+        return getattr(self._local, "transaction", None)
+
+    @_transaction.setter
+    def _transaction(self, transaction: sqlalchemy.RootTransaction) -> None:
+        self._local.transaction = transaction
+
+    def _checkout(self) -> sqlalchemy.Connection:
+        """Checks a connection out of the engine's pool, with the database isolation level."""
+        connection = self._engine.connect()
+        if self._isolation_level is not None:
+            connection.execution_options(isolation_level=self._isolation_level)
+        return connection
 
     def __enter__(self) -> Database:
         """Enters a transaction block allowing multiple database operations to be performed as a unit."""
@@ -86,13 +143,13 @@ class Database(ABC):
         """Begins a transaction block."""
         try:
             self._transaction = self._connection.begin()
-        except AttributeError:
+        except sqlalchemy.exc.UnboundExecutionError:
             self.connect()
             self._transaction = self._connection.begin()
         except sqlalchemy.exc.InvalidRequestError:  # pragma: no cover
             self.close()
             self.connect()
-            self._connection.begin()
+            self._transaction = self._connection.begin()
 
     def in_transaction(self) -> bool:
         """Queries the autocommit mode and returns True if the connection is in transaction."""
@@ -121,38 +178,78 @@ class Database(ABC):
             raise
 
     def close(self) -> None:
-        """Closes the database connection."""
+        """Closes the current thread's connection, returning it to the pool."""
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        self._local.transaction = None
+        if connection is None:
+            return
         try:
-            self._connection.close()
-            self._is_connected = False
+            connection.close()
         except SQLAlchemyError as e:  # pragma: no cover
-            self._is_connected = False
             msg = f"Database connection close failed.\nException type: {type[e]}\n{e}"
             self._logger.exception(msg)
             raise
 
     def dispose(self) -> None:
-        """Disposes the connection and releases resources."""
+        """Closes the current thread's connection and disposes the engine and its pool."""
         try:
+            self.close()
             self._engine.dispose()
-            self._is_connected = False
+            self._engine = None
         except SQLAlchemyError as e:  # pragma: no cover
             msg = f"Database connection close failed.\nException type: {type[e]}\n{e}"
             self._logger.exception(msg)
             raise
 
+    def inspect(self) -> sqlalchemy.engine.Inspector:
+        """Returns an inspector reflecting the current schema of the database."""
+        return sqlalchemy.inspect(self._connection)
+
+    def create_table(self, table: sqlalchemy.Table) -> None:
+        """Creates the table, with its keys and indexes, if it does not already exist.
+
+        Args:
+            table (sqlalchemy.Table): The table definition.
+        """
+        table.create(bind=self._connection, checkfirst=True)
+        self._tables.add(table.name)
+
+    @abstractmethod
+    def add_primary_key(self, tablename: str, key: str) -> None:
+        """Adds a primary key on the key column to a table without one.
+
+        Args:
+            tablename (str): The name of the table in the database.
+            key (str): The primary key column.
+        """
+
+    def load_options(self, tablename: str) -> dict:
+        """Returns the bulk load method and chunksize used when inserting into a table.
+
+        Args:
+            tablename (str): The name of the table in the database.
+        """
+        return DEFAULT_LOAD_OPTIONS.copy()
+
+    @property
+    def buffer_options(self) -> dict:
+        """Returns the row, byte and time thresholds at which buffered writes are flushed."""
+        return DEFAULT_BUFFER_OPTIONS.copy()
+
     def insert(
         self,
         data: pd.DataFrame,
         tablename: str,
         dtype: dict = None,
         if_exists: str = "append",
+        method: str = None,
+        chunksize: int = None,
     ) -> int:
         """Inserts data in pandas DataFrame format into the designated table.
 
-        Note: This method uses pandas to_sql method. If not in transaction, inserts are
-        autocommitted and rollback has no effect. Transaction behavior is extant
-        after a begin() or through the use of the context manager.
+        Note: If not in transaction, inserts are autocommitted and rollback has no effect.
+        Transaction behavior is extant after a begin() or through the use of the context manager.
 
         Args:
             data (pd.DataFrame): DataFrame containing the data to add to the designated table.
@@ -161,22 +258,100 @@ class Database(ABC):
             dtype (dict): Dictionary of data types for columns.
             if_exists (str): Action to take if table already exists. Valid values
                 are ['append', 'replace', 'fail']. Default = 'append'
+            method (str): Bulk load method. One of LOAD_METHODS. Defaults to the method
+                configured for the table.
+            chunksize (int): Number of rows per statement or batch. Defaults to the chunksize
+                configured for the table.
 
         Returns: Number of rows inserted.
         """
+        options = self.load_options(tablename=tablename)
+        method = method or options["method"]
+        chunksize = chunksize or options["chunksize"]
+        if method not in LOAD_METHODS:
+            msg = f"Load method {method} is invalid. Valid values are {LOAD_METHODS}."
+            self._logger.exception(msg)
+            raise ValueError(msg)
+
+        if if_exists == "replace":
+            self._keyed.discard(tablename)
+
         try:
-            return data.to_sql(
-                tablename,
-                con=self._connection,
-                if_exists=if_exists,
-                dtype=dtype,
-                index=False,
+            if method in ("to_sql", "multi"):
+                rows = data.to_sql(
+                    tablename,
+                    con=self._connection,
+                    if_exists=if_exists,
+                    dtype=dtype,
+                    index=False,
+                    chunksize=chunksize,
+                    method="multi" if method == "multi" else None,
+                )
+                self._tables.add(tablename)
+                return data.shape[0] if rows is None else rows
+
+            self._prepare_table(
+                data=data, tablename=tablename, dtype=dtype, if_exists=if_exists
             )
+            if data.shape[0] == 0:
+                return 0
+            if method == "executemany":
+                return self._insert_executemany(
+                    data=data, tablename=tablename, chunksize=chunksize
+                )
+            return self._insert_infile(data=data, tablename=tablename)
+
         except SQLAlchemyError as e:  # pragma: no cover
             msg = f"Exception occurred during database insert.\nException type:{type[SQLAlchemyError]}\n{e}"
             self._logger.exception(msg)
             raise
 
+    @abstractmethod
+    def upsert(
+        self,
+        data: pd.DataFrame,
+        tablename: str,
+        key: str = "id",
+        dtype: dict = None,
+        method: str = None,
+        chunksize: int = None,
+    ) -> int:
+        """Inserts rows, updating existing rows having the same key.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing the data to add to the designated table.
+            tablename (str): The name of the table in the database. If the table does not
+                exist, it will be created.
+            key (str): The primary key column. Default = 'id'
+            dtype (dict): Dictionary of data types for columns.
+            method (str): Bulk load method. One of LOAD_METHODS. Defaults to the method
+                configured for the table.
+            chunksize (int): Number of rows per batch. Defaults to the chunksize configured
+                for the table.
+
+        Returns: Number of rows written.
+        """
+
+    @abstractmethod
+    def dedup(
+        self,
+        tablename: str,
+        subset: Union[str, list] = "id",
+        keep: str = "last",
+        order_by: str = None,
+    ) -> tuple:
+        """Removes rows duplicating the values of the subset columns, within the database.
+
+        Args:
+            tablename (str): The name of the table in the database.
+            subset (Union[str, list]): Column or columns identifying duplicates. Default = 'id'
+            keep (str): Which duplicate to retain, 'first' or 'last'. Default = 'last'
+            order_by (str): Column ordering the rows of each duplicate group, e.g. the time
+                each row was written.
+
+        Returns: Tuple containing the number of rows before and after deduplication.
+        """
+
     def update(self, query: str, params: dict = None) -> int:
         """Updates row(s) matching the query.
 
@@ -226,6 +401,49 @@ class Database(ABC):
             parse_dates=parse_dates,
         )
 
+    def iter_query(
+        self,
+        query: str,
+        params: dict = (),
+        dtypes: dict = None,
+        parse_dates: dict = None,
+        chunksize: int = 10000,
+    ) -> Iterator[pd.DataFrame]:
+        """Streams the result set of a query as a sequence of DataFrames.
+
+        Rows are fetched through a server-side cursor on a dedicated connection, so memory is
+        bounded by the chunk size, and the connection used for writes remains free while
+        iterating.
+
+        Args:
+            query (str): The SQL command
+            params (dict): Parameters for the SQL command
+            dtypes (dict): Dictionary mapping of column to data types
+            parse_dates (dict): Dictionary of columns and keyword arguments for datetime parsing.
+            chunksize (int): Number of rows per DataFrame. Default = 10000
+
+        Returns: Iterator of Pandas DataFrames
+
+        """
+        options = {"stream_results": True, "max_row_buffer": chunksize}
+        if self.is_connected:
+            # Reads observe the same isolation level as the primary connection.
+            isolation_level = self._connection.get_execution_options().get(
+                "isolation_level"
+            )
+            if isolation_level is not None:
+                options["isolation_level"] = isolation_level
+
+        with self._engine.connect().execution_options(**options) as connection:
+            yield from pd.read_sql(
+                sql=sqlalchemy.text(query),
+                con=connection,
+                params=params,
+                dtype=dtypes,
+                parse_dates=parse_dates,
+                chunksize=chunksize,
+            )
+
     def exists(self, query: str, params: dict = None) -> bool:
         """Returns True if a row matching the query and parameters exists. Returns False otherwise.
         Args:
@@ -247,6 +465,74 @@ class Database(ABC):
         Returns (int): Number of rows updated or deleted.
 
         """
+        if DDL_PATTERN.search(query):
+            self._tables.clear()
+            self._keyed.clear()
         return self._connection.execute(
             statement=sqlalchemy.text(query), parameters=params
         )
+
+    def _prepare_table(
+        self, data: pd.DataFrame, tablename: str, dtype: dict, if_exists: str
+    ) -> None:
+        """Creates or replaces the table ahead of a bulk insert, per the 'if_exists' parameter.
+
+        Existence is checked once per table and cached, so that repeated appends do not
+        inspect the schema.
+        """
+        if if_exists == "append" and tablename in self._tables:
+            return
+        if if_exists == "append" and sqlalchemy.inspect(self._connection).has_table(
+            tablename
+        ):
+            self._tables.add(tablename)
+            return
+        # Creates the table from the frame schema, replacing it or failing per 'if_exists'.
+        data.head(0).to_sql(
+            tablename,
+            con=self._connection,
+            if_exists=if_exists,
+            dtype=dtype,
+            index=False,
+        )
+        self._tables.add(tablename)
+
+    def _insert_executemany(
+        self, data: pd.DataFrame, tablename: str, chunksize: int = None
+    ) -> int:
+        """Inserts the rows in batches of 'chunksize' via the DBAPI executemany."""
+        preparer = self._connection.dialect.identifier_preparer
+        placeholder = "?" if self._connection.dialect.paramstyle == "qmark" else "%s"
+        columns = ", ".join([preparer.quote(column) for column in data.columns])
+        values = ", ".join([placeholder] * data.shape[1])
+        statement = (
+            f"INSERT INTO {preparer.quote(tablename)} ({columns}) VALUES ({values})"
+        )
+
+        chunksize = chunksize or data.shape[0]
+        rows = 0
+        for start in range(0, data.shape[0], chunksize):
+            records = self._to_records(data=data.iloc[start : start + chunksize])
+            self._connection.exec_driver_sql(statement, records)
+            rows += len(records)
+        return rows
+
+    @abstractmethod
+    def _insert_infile(self, data: pd.DataFrame, tablename: str) -> int:
+        """Bulk loads the rows from a temporary file, using the database's native loader."""
+
+    @staticmethod
+    def _to_records(data: pd.DataFrame) -> list:
+        """Converts a DataFrame to a list of row tuples of native Python values.
+
+        Missing values of any dtype become None, and datetimes become datetime objects.
+        """
+        columns = []
+        for _, column in data.items():
+            if pd.api.types.is_datetime64_any_dtype(column):
+                values = np.array(column.dt.to_pydatetime(), dtype=object)
+            else:
+                values = column.to_numpy(dtype=object, copy=True)
+            values[column.isna().to_numpy()] = None
+            columns.append(values)
+        return list(zip(*columns))
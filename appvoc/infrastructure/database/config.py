@@ -21,7 +21,7 @@ from dotenv import load_dotenv
 import logging
 
 from appvoc.config import Config
-from appvoc.infrastructure.file.io import IOService
+from appvoc.infrastructure.database.base import DEFAULT_BUFFER_OPTIONS
 
 # ------------------------------------------------------------------------------------------------ #
 load_dotenv()
@@ -29,10 +29,10 @@ load_dotenv()
 
 
 class DatabaseConfig(Config):
+    _section = "database"
+
     def __init__(self) -> None:
         super().__init__()
-        self._config_file = os.getenv("PERSISTENCE_CONFIG")
-        self._config = IOService.read(self._config_file)["database"]
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
     @property
@@ -55,6 +55,44 @@ class DatabaseConfig(Config):
     def startup(self) -> str:
         return os.getenv("MYSQL_STARTUP_SCRIPT")
 
+    @property
+    def local_infile(self) -> bool:
+        """Returns True if any table is configured to load via LOAD DATA LOCAL INFILE."""
+        load = self._config.get("load", {})
+        return any(options.get("method") == "infile" for options in load.values())
+
+    @property
+    def pool(self) -> dict:
+        """Returns the connection pool options, falling back to defaults for those not set."""
+        pool = {
+            "size": 5,
+            "max_overflow": 10,
+            "timeout": 30,
+            "recycle": 3600,
+            "pre_ping": True,
+        }
+        pool.update(self._config.get("pool", {}))
+        return pool
+
+    @property
+    def buffer(self) -> dict:
+        """Returns the write buffer flush thresholds, falling back to defaults for those not set."""
+        buffer = DEFAULT_BUFFER_OPTIONS.copy()
+        buffer.update(self._config.get("buffer", {}))
+        return buffer
+
+    def load_options(self, tablename: str) -> dict:
+        """Returns the bulk load options for a table, falling back to the configured default.
+
+        Args:
+            tablename (str): The name of the table in the database.
+        """
+        load = self._config.get("load", {})
+        options = {"method": "to_sql", "chunksize": None}
+        options.update(load.get("default", {}))
+        options.update(load.get(tablename, {}))
+        return options
+
     def get_config(self, key: str) -> str:
         """Returns the configuration for the given key
 
@@ -142,6 +142,8 @@ class CSVIO(IO):  # pragma: no cover
         index: bool = False,
         index_label: bool = None,
         encoding: str = "utf-8",
+        mode: str = "w",
+        header: bool = True,
         **kwargs,
     ) -> None:
         data.to_csv(
@@ -151,6 +153,8 @@ class CSVIO(IO):  # pragma: no cover
             index_label=index_label,
             encoding=encoding,
             escapechar="\\",
+            mode=mode,
+            header=header,
         )
 
 
@@ -191,6 +195,8 @@ class TSVIO(IO):  # pragma: no cover
         index: bool = False,
         index_label: bool = None,
         encoding: str = "utf-8",
+        mode: str = "w",
+        header: bool = True,
         **kwargs,
     ) -> None:
         data.to_csv(
@@ -200,6 +206,8 @@ class TSVIO(IO):  # pragma: no cover
             index_label=index_label,
             encoding=encoding,
             escapechar="\\",
+            mode=mode,
+            header=header,
         )
 
 
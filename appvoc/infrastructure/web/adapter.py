@@ -16,6 +16,9 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+from __future__ import annotations
+import threading
+
 from requests.adapters import HTTPAdapter
 
 
@@ -28,8 +31,48 @@ class TimeoutHTTPAdapter(HTTPAdapter):
         del kwargs["timeout"]
 
         super().__init__(*args, **kwargs)
+        # Connection pools handed out by the adapter, from which statistics are collected.
+        self._pools = set()
+        self._pools_lock = threading.Lock()
 
     def send(self, request, **kwargs):
         if kwargs["timeout"] is None:
             kwargs["timeout"] = self._timeout
         return super().send(request, **kwargs)
+
+    def get_connection_with_tls_context(self, *args, **kwargs):
+        """Returns the connection pool for a request, recording it for the statistics."""
+        return self._record(super().get_connection_with_tls_context(*args, **kwargs))
+
+    def get_connection(self, *args, **kwargs):
+        """Returns the connection pool for a request under requests before 2.32.2."""
+        return self._record(super().get_connection(*args, **kwargs))
+
+    def copy(self) -> TimeoutHTTPAdapter:
+        """Returns a new adapter, with its own connection pools, configured as this one."""
+        return TimeoutHTTPAdapter(
+            timeout=self._timeout,
+            max_retries=self.max_retries,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+        )
+
+    def _record(self, pool):
+        """Adds a pool handed out by the adapter to those the statistics are collected from."""
+        with self._pools_lock:
+            self._pools.add(pool)
+        return pool
+
+    @property
+    def connections(self) -> dict:
+        """Returns the number of requests and new connections across the adapter's pools.
+
+        Pools are held per host, and per host within each proxy endpoint. Requests not
+        requiring a new connection reused a pooled one.
+        """
+        with self._pools_lock:
+            pools = list(self._pools)
+        requests = sum(pool.num_requests for pool in pools)
+        connections = sum(pool.num_connections for pool in pools)
+        return {"requests": requests, "connections": connections}
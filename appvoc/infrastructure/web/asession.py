@@ -16,20 +16,23 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import os
+from __future__ import annotations
+
 import logging
 from dotenv import load_dotenv
 
 import asyncio
 
-# import httpx
-
-import aiohttp
-
-
-from appvoc.infrastructure.web.base import PROXY_SERVERS
+from appvoc.infrastructure.web.decode import load_payload
 from appvoc.infrastructure.web.headers import BrowserHeader
+from appvoc.infrastructure.web.limiter import AIMDLimiter
+from appvoc.infrastructure.web.proxy import Proxy, ProxyPool
 from appvoc.infrastructure.web.throttle import AThrottle
+from appvoc.infrastructure.web.transport import (
+    TRANSPORTS,
+    AiohttpTransport,
+    Transport,
+)
 
 load_dotenv()
 
@@ -38,8 +41,33 @@ load_dotenv()
 class ASessionHandler:
     """Asyncronous Session Handler
 
+    The handler owns a single transport for its lifetime, so that DNS lookups, TCP and TLS
+    connections are reused across batches. The transport is opened on first use, or explicitly
+    via 'open' or the async context manager, and released by 'close'. Throttling, retries and
+    header rotation are applied by the handler, whichever transport executes the requests.
+
+    The number of requests in flight is governed by an adaptive limiter, also held for the
+    handler's lifetime, which raises the limit while requests succeed and lowers it on
+    overload responses, timeouts and latency inflation. Each attempt is routed through a proxy
+    selected from the proxy pool, to which its outcome is reported.
+
     Args:
+        throttle (AThrottle): Throttle controlling the request rate.
+        headers (BrowserHeader): Iterator of rotating browser headers.
+        max_concurrency (int): Upper bound on the number of concurrent requests.
         retries (int): Number of sessions to retry if timeout retry maximum has been reached.
+        timeout (int): Total timeout per request in seconds.
+        proxies (ProxyPool): Pool of proxy endpoints. If None, a pool of the default proxy
+            servers is created.
+        limit (int): Total number of simultaneous connections held by the connector.
+        limit_per_host (int): Number of simultaneous connections to the same endpoint. Zero
+            means no per host limit.
+        ttl_dns_cache (int): Seconds for which resolved DNS entries are cached.
+        keepalive_timeout (float): Seconds an idle connection is kept alive for reuse.
+        transport (str): 'http1' for aiohttp, or 'http2' to multiplex requests over shared
+            HTTP/2 connections using httpx. Default = 'http1'
+        limiter (AIMDLimiter): Adaptive concurrency limiter. If None, a limiter bounded by
+            max_concurrency is created.
 
     """
 
@@ -50,14 +78,19 @@ class ASessionHandler:
         max_concurrency: int = 10,
         retries: int = 3,
         timeout: int = 30,
-        proxies: list = PROXY_SERVERS,
+        proxies: ProxyPool = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: int = 300,
+        keepalive_timeout: float = 30,
+        transport: str = "http1",
+        limiter: AIMDLimiter = None,
     ) -> None:
         self._throttle = throttle
-        self._proxies = proxies
+        self._proxies = proxies or ProxyPool()
         self._retries = retries
-        self._timeout = aiohttp.ClientTimeout(total=timeout)
         self._headers = iter(headers)
-        self._max_concurrency = max_concurrency
+        self._limiter = limiter or AIMDLimiter(max_limit=max_concurrency)
 
         self._proxy = None  # The proxy used for the current request
         self._header = None  # The header used for the current request.
@@ -65,75 +98,132 @@ class ASessionHandler:
         self._responses = None
 
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self._transport = self._create_transport(
+            transport=transport,
+            timeout=timeout,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=ttl_dns_cache,
+            keepalive_timeout=keepalive_timeout,
+        )
 
     @property
     async def responses(self) -> list:
         """Returns the responses"""
         return self._responses
 
+    @property
+    def is_open(self) -> bool:
+        """Returns True if the transport is open."""
+        return self._transport.is_open
+
+    @property
+    def transport(self) -> Transport:
+        return self._transport
+
+    @property
+    def concurrency(self) -> int:
+        """Returns the current adaptive concurrency limit."""
+        return self._limiter.limit
+
+    @property
+    def limiter(self) -> AIMDLimiter:
+        return self._limiter
+
+    async def __aenter__(self) -> ASessionHandler:
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def open(self) -> Transport:
+        """Returns the transport, opening it in the running event loop if necessary."""
+        await self._transport.open()
+        return self._transport
+
+    async def close(self) -> None:
+        """Closes the transport and its connections."""
+        await self._transport.close()
+
     async def get(self, urls: list, headers: dict = None) -> list:
         """Entry point returns results from asynchronous http requests
 
         Args:
             urls (list): List of urls for http requests
+            headers (dict): A dictionary containing header parameters.If None provided, standard rotating headers will be used.
         """
 
-        headers = headers or next(self._header)
-
-        conn = aiohttp.TCPConnector()
+        headers = headers or next(self._headers)
 
-        concurrency = asyncio.Semaphore(self._max_concurrency)
+        client = await self.open()
 
-        async with aiohttp.ClientSession(
-            headers=headers,
-            connector=conn,
-            trust_env=True,
-            raise_for_status=True,
-            timeout=self._timeout,
-        ) as client:
-            tasks = [self._make_request(client, url, concurrency) for url in urls]
-            self._responses = await asyncio.gather(*tasks)
+        tasks = [self._make_request(client, url, headers) for url in urls]
+        self._responses = await asyncio.gather(*tasks)
         return self._responses
 
     async def _make_request(
         self,
-        client: aiohttp.ClientSession,
+        client: Transport,
         url: str,
-        concurrency: asyncio.Semaphore,
+        headers: dict = None,
     ):
         """Executes the http request and returns a Response object.
 
+        Each attempt is paced by the throttle, routed through a proxy from the pool, and holds
+        a slot of the concurrency limiter while in flight. Its latency or failure is reported to both, failures to the pool only
+        if attributable to the proxy.
+
         Args:
-            client (httpx.AsyncClient): The http client executing the http request.
+            client (Transport): The transport executing the http request.
             url (str): The base url for the http request
-            concurrency (asyncio.Semaphore): Controls number of concurrent requests.
-            headers (dict): A dictionary containing header parameters.If None provided, standard rotating headers will be used.
+            headers (dict): A dictionary containing header parameters.
         """
 
-        proxy = self._get_proxy()
-
         retries = 0
 
-        async with concurrency:
-            while retries < self._retries:
-                try:
-                    self._throttle.start()
-                    async with client.get(url, proxy=proxy, ssl=False) as response:
-                        self._throttle.stop()
-                        self._throttle.delay()
-                        return await response.json()
-
-                except Exception as e:
-                    retries += 1
-                    msg = f"Exception type {type(e)} occurred.\n{e}\nExecuting retry # {retries}."
-                    self._logger.exception(msg)
-            msg = "Exhausted retries. Returning to calling environment."
+        while retries < self._retries:
+            await self._throttle.adelay()
+            proxy = await self._proxies.aget()
+            try:
+                # The slot is held only while the request is in flight, not while pacing
+                # or waiting for a proxy.
+                async with self._limiter.slot():
+                    start = self._throttle.start()
+                    response = await client.get(
+                        url, headers=headers, proxy=self._get_proxy(proxy)
+                    )
+                    latency = self._throttle.stop(start)
+                content = load_payload(response)
+                self._limiter.succeed(latency=latency)
+                self._proxies.succeed(proxy=proxy, latency=latency)
+                return content
+
+            except Exception as e:
+                self._limiter.fail(overloaded=client.overloaded(e))
+                if client.proxy_failed(e):
+                    self._proxies.fail(proxy=proxy)
+                retries += 1
+                msg = f"Exception type {type(e)} occurred.\n{e}\nExecuting retry # {retries}."
+                self._logger.exception(msg)
+        msg = "Exhausted retries. Returning to calling environment."
+        self._logger.exception(msg)
+
+    def _create_transport(self, transport: str, **kwargs) -> Transport:
+        """Constructs the transport designated in the configuration."""
+        if transport not in TRANSPORTS:
+            msg = f"Transport {transport} is invalid. Valid values are {list(TRANSPORTS)}."
             self._logger.exception(msg)
-
-    def _get_proxy(self) -> dict:
-        dns = os.getenv("WEBSHARE_DNS")
-        username = os.getenv("WEBSHARE_USER")
-        pwd = os.getenv("WEBSHARE_PWD")
-        port = os.getenv("WEBSHARE_PORT")
-        proxy = f"http://{username}:{pwd}@{dns}:{port}"
-        return proxy
+            raise ValueError(msg)
+        if TRANSPORTS[transport] is AiohttpTransport:
+            return AiohttpTransport(**kwargs)
+        # Connector options specific to aiohttp do not apply to other transports.
+        return TRANSPORTS[transport](
+            timeout=kwargs["timeout"],
+            limit=kwargs["limit"],
+            keepalive_timeout=kwargs["keepalive_timeout"],
+        )
+
+    def _get_proxy(self, proxy: Proxy = None) -> str:
+        """Returns the URL of a proxy endpoint, or None to send the request directly."""
+        return proxy.url if proxy is not None else None
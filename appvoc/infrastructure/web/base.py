@@ -19,7 +19,12 @@
 """Web Infrastructure Base Module"""
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 import logging
+import time
+from typing import Iterator
+
+from appvoc.infrastructure.web.buffer import RingBuffer
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -37,11 +42,54 @@ class Header(ABC):
 
 # ------------------------------------------------------------------------------------------------ #
 class Throttle(ABC):
-    """Base class for HTTP request rate limiters"""
+    """Base class for HTTP request rate limiters
+
+    Latency is timed per request, either with the 'measure' context manager, or by passing the
+    token returned by 'start' to 'stop'. The most recent latencies are kept in a fixed-size
+    buffer from which latency percentiles are reported.
 
-    def __init__(self) -> None:
+    Args:
+        latency_buffer_size (int): Number of most recent request latencies retained.
+    """
+
+    def __init__(self, latency_buffer_size: int = 1000) -> None:
+        self._latency_buffer = RingBuffer(capacity=latency_buffer_size)
+        self._latency = None
+        self._start = None
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
+    @property
+    def percentiles(self) -> dict:
+        """Returns the 50th, 95th and 99th percentiles of the buffered request latencies."""
+        if len(self._latency_buffer) == 0:
+            return {"p50": None, "p95": None, "p99": None}
+        p50, p95, p99 = self._latency_buffer.quantile([0.50, 0.95, 0.99])
+        return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
+    def start(self) -> float:
+        """Marks the start of a request and returns its start time as the request token."""
+        self._start = time.perf_counter()
+        return self._start
+
+    def stop(self, start: float = None) -> float:
+        """Records and returns the latency of a request.
+
+        Args:
+            start (float): The token returned by 'start' for this request. Required when
+                requests overlap. Defaults to the most recent start time.
+        """
+        start = self._start if start is None else start
+        self._latency = time.perf_counter() - start
+        self._latency_buffer.append(self._latency)
+        return self._latency
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Times the enclosed request. Latency is recorded only if the block completes."""
+        start = self.start()
+        yield
+        self.stop(start)
+
     @abstractmethod
     def delay(self, *args, **kwargs) -> int:
         """Returns a delay time in milliseconds"""
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/infrastructure/web/buffer.py                                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 10:12:08 am                                              #
+# Modified   : Saturday October 17th 2026 10:12:08 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Ring Buffer Module"""
+from __future__ import annotations
+from typing import Iterator, Union
+
+import numpy as np
+
+
+# ------------------------------------------------------------------------------------------------ #
+class RingBuffer:
+    """Fixed-capacity buffer of floats with constant-time running statistics.
+
+    Values are written into a preallocated NumPy array, overwriting the oldest value once the
+    buffer is full. Mean and variance of the values in the buffer are maintained incrementally
+    with Welford's algorithm, extended to remove the evicted value. To bound floating point
+    drift, the statistics are recomputed from the array each time the buffer wraps around,
+    which keeps the amortized cost per append constant.
+
+    Args:
+        capacity (int): Maximum number of values held.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError(f"Capacity must be a positive integer, not {capacity}.")
+        self._capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.float64)
+        self._head = 0  # Index at which the next value is written
+        self._size = 0
+        self._mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the mean
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values.tolist())
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def full(self) -> bool:
+        return self._size == self._capacity
+
+    @property
+    def values(self) -> np.ndarray:
+        """Returns a copy of the values in the order in which they were appended."""
+        if not self.full:
+            return self._data[: self._size].copy()
+        return np.concatenate((self._data[self._head :], self._data[: self._head]))
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._size > 0 else np.nan
+
+    @property
+    def var(self) -> float:
+        """Returns the population variance of the values in the buffer."""
+        return max(self._m2, 0.0) / self._size if self._size > 0 else np.nan
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.var))
+
+    @property
+    def sum(self) -> float:
+        return self._mean * self._size
+
+    @property
+    def min(self) -> float:
+        return float(np.min(self._view)) if self._size > 0 else np.nan
+
+    @property
+    def max(self) -> float:
+        return float(np.max(self._view)) if self._size > 0 else np.nan
+
+    @property
+    def _view(self) -> np.ndarray:
+        """Returns the populated portion of the array, without copying and in storage order."""
+        return self._data[: self._size]
+
+    def append(self, value: float) -> None:
+        """Adds a value, evicting the oldest value if the buffer is full."""
+        value = float(value)
+        if self.full:
+            evicted = self._data[self._head]
+            prior_mean = self._mean
+            self._mean += (value - evicted) / self._size
+            self._m2 += (value - evicted) * (value - self._mean + evicted - prior_mean)
+        else:
+            self._size += 1
+            delta = value - self._mean
+            self._mean += delta / self._size
+            self._m2 += delta * (value - self._mean)
+
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self._capacity
+        if self._head == 0:
+            self._reseed()
+
+    def quantile(self, q: Union[float, list]) -> Union[float, np.ndarray]:
+        """Returns the q-th quantile(s) of the values in the buffer.
+
+        Args:
+            q (Union[float, list]): Quantile or sequence of quantiles in [0, 1].
+        """
+        if self._size == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        return np.quantile(self._view, q)
+
+    def count_above(self, threshold: float) -> int:
+        """Returns the number of values in the buffer that exceed the threshold."""
+        return int(np.count_nonzero(self._view > threshold))
+
+    def clear(self) -> None:
+        """Empties the buffer."""
+        self._head = 0
+        self._size = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _reseed(self) -> None:
+        """Recomputes the running statistics exactly from the buffer contents."""
+        view = self._view
+        self._mean = float(np.mean(view))
+        self._m2 = float(np.sum((view - self._mean) ** 2))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/infrastructure/web/decode.py                                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 07:12:26 pm                                              #
+# Modified   : Saturday October 17th 2026 07:12:26 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""JSON Decoding Module
+
+Response bodies are decoded once, and the decoded body shared by validators, response parsers
+and byte accounting. orjson is used when installed; otherwise the standard library decoder.
+"""
+from __future__ import annotations
+import json
+from typing import Any, Union
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# ------------------------------------------------------------------------------------------------ #
+DECODED = "_decoded"  # Attribute in which the decoded body is cached on a requests.Response
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Payload(dict):
+    """Decoded JSON object that retains the size in bytes of the body from which it was decoded.
+
+    Returned by the asynchronous session handler, whose responses are decoded before they
+    are released to the connection pool.
+    """
+
+    nbytes: int = 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+def loads(content: Union[bytes, str]) -> Any:
+    """Decodes a JSON document.
+
+    Args:
+        content (Union[bytes, str]): The JSON document.
+
+    Raises: json.JSONDecodeError, a ValueError, if the content is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def load_payload(content: bytes) -> Any:
+    """Decodes a response body, returning JSON objects as a Payload carrying the body size.
+
+    Args:
+        content (bytes): The response body.
+    """
+    decoded = loads(content)
+    if isinstance(decoded, dict):
+        decoded = Payload(decoded)
+        decoded.nbytes = len(content)
+    return decoded
+
+
+def decode(response: Union[requests.Response, dict]) -> Any:
+    """Returns the decoded body of a response, decoding it on first access only.
+
+    Bodies already decoded, such as those returned by the asynchronous session handler, are
+    returned as is.
+
+    Args:
+        response (Union[requests.Response, dict]): HTTP Response or decoded body.
+
+    Raises: json.JSONDecodeError, a ValueError, if the body is not valid JSON.
+    """
+    if not isinstance(response, requests.Response):
+        return response
+    decoded = getattr(response, DECODED, None)
+    if decoded is None:
+        decoded = loads(response.content)
+        setattr(response, DECODED, decoded)
+    return decoded
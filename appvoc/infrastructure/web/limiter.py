@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/infrastructure/web/limiter.py                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 09:02:44 pm                                              #
+# Modified   : Saturday October 17th 2026 09:02:44 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Adaptive Concurrency Limiter Module"""
+from __future__ import annotations
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from appvoc.infrastructure.web.buffer import RingBuffer
+
+
+# ------------------------------------------------------------------------------------------------ #
+class AIMDLimiter:
+    """Adaptive concurrency limit using additive-increase / multiplicative-decrease.
+
+    Each successful request raises the limit by increase / limit, so that the limit grows by
+    'increase' per round of 'limit' completed requests. The limit is multiplied by the
+    decrease factor when the server signals overload, through 429/5xx status codes or
+    timeouts, or when latency inflates: the mean of the most recent latencies exceeds the
+    tolerance times the baseline, the 10th percentile of the longer latency history. At
+    most one decrease is applied per round, so the requests in flight when congestion sets
+    in do not compound the reduction.
+
+    The limiter is held for the life of the session handler, so the limit learned in one
+    batch carries over to the next. It is bound to the event loop in which it is first used,
+    and its in-flight count is reset if used from a new event loop.
+
+    Args:
+        initial (int): The starting limit. Default = 10
+        min_limit (int): The lowest limit. Default = 1
+        max_limit (int): The highest limit. Default = 100
+        increase (float): Additive increase in the limit per round of requests. Default = 1
+        decrease (float): Factor by which the limit is multiplied on overload. Default = 0.5
+        latency_tolerance (float): Ratio of recent to baseline latency regarded as
+            inflation. Default = 2
+        window (int): Number of most recent latencies compared with the baseline. Default = 25
+        latency_buffer_size (int): Number of latencies from which the baseline is computed.
+            Default = 1000
+        verbose (int): Number of completed requests between reports to the log. Default = 100
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase: float = 1,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2,
+        window: int = 25,
+        latency_buffer_size: int = 1000,
+        verbose: int = 100,
+    ) -> None:
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        if not 1 <= min_limit <= max_limit:
+            msg = f"Limits must satisfy 1 <= min_limit <= max_limit. Received {min_limit} and {max_limit}."
+            self._logger.exception(msg)
+            raise ValueError(msg)
+        if not 0 < decrease < 1:
+            msg = f"Decrease must be a factor between 0 and 1, not {decrease}."
+            self._logger.exception(msg)
+            raise ValueError(msg)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._increase = increase
+        self._decrease = decrease
+        self._latency_tolerance = latency_tolerance
+        self._verbose = verbose
+
+        self._recent = RingBuffer(capacity=window)
+        self._latencies = RingBuffer(capacity=max(latency_buffer_size, window))
+
+        self._inflight = 0
+        self._completed = 0
+        self._round = 0  # Requests completed since the last decrease
+        self._increases = 0
+        self._decreases = 0
+
+        self._loop = None  # Event loop to which the condition is bound
+        self._condition = None
+
+    @property
+    def limit(self) -> int:
+        """Returns the current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    @property
+    def baseline(self) -> float:
+        """Returns the baseline latency, or None until enough latencies are recorded."""
+        if len(self._latencies) < self._recent.capacity:
+            return None
+        return float(self._latencies.quantile(0.10))
+
+    @property
+    def metrics(self) -> dict:
+        """Returns the current limit and the statistics from which it was derived."""
+        recent = float(self._recent.mean) if len(self._recent) > 0 else None
+        return {
+            "limit": self.limit,
+            "inflight": self._inflight,
+            "completed": self._completed,
+            "increases": self._increases,
+            "decreases": self._decreases,
+            "baseline_latency": self.baseline,
+            "recent_latency": recent,
+        }
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Holds one of the limited slots for the duration of the enclosed request."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    async def acquire(self) -> None:
+        """Waits until fewer requests than the limit are in flight, then takes a slot."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._inflight < self.limit)
+            self._inflight += 1
+
+    async def release(self) -> None:
+        """Returns a slot, waking as many waiters as the limit now admits."""
+        condition = self._get_condition()
+        async with condition:
+            self._inflight = max(self._inflight - 1, 0)
+            condition.notify(max(self.limit - self._inflight, 0))
+
+    def succeed(self, latency: float) -> None:
+        """Records a successful request, increasing the limit unless latency has inflated.
+
+        Args:
+            latency (float): Seconds between the request and its response.
+        """
+        self._record()
+        self._recent.append(latency)
+        self._latencies.append(latency)
+        if self._inflated():
+            self._backoff(reason="latency inflation")
+        elif self._limit < self._max_limit:
+            self._limit = min(
+                self._limit + self._increase / self._limit, self._max_limit
+            )
+            self._increases += 1
+
+    def fail(self, overloaded: bool) -> None:
+        """Records a failed request, decreasing the limit if the server is overloaded.
+
+        Failures that do not signal overload, such as a missing resource, leave the limit
+        unchanged.
+
+        Args:
+            overloaded (bool): Whether the failure was a timeout or an overload status code.
+        """
+        self._record()
+        if overloaded:
+            self._backoff(reason="overload response")
+
+    def _record(self) -> None:
+        self._completed += 1
+        self._round += 1
+        if self._completed % self._verbose == 0:
+            self._monitor()
+
+    def _inflated(self) -> bool:
+        """Returns True if the recent mean latency exceeds the tolerated baseline multiple."""
+        baseline = self.baseline
+        if baseline is None or not self._recent.full:
+            return False
+        return self._recent.mean > self._latency_tolerance * baseline
+
+    def _backoff(self, reason: str) -> None:
+        """Decreases the limit, once per round of requests."""
+        if self._round < self.limit:
+            return
+        prior = self.limit
+        self._limit = max(self._limit * self._decrease, self._min_limit)
+        self._round = 0
+        self._decreases += 1
+        # Inflation must be observed afresh at the new limit.
+        self._recent.clear()
+        msg = f"Decreased concurrency limit from {prior} to {self.limit} on {reason}."
+        self._logger.debug(msg)
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Returns the condition for the running event loop, creating it if necessary."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._inflight = 0
+        return self._condition
+
+    def _monitor(self) -> None:
+        width = 24
+        msg = f"{self.__class__.__name__}:\n"
+        for name, value in self.metrics.items():
+            label = f"{name.replace('_', ' ').title()}:"
+            msg += f"\t{label.rjust(width, ' ')} | {value}\n"
+        self._logger.debug(msg)
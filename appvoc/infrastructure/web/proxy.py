@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/infrastructure/web/proxy.py                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 09:31:37 pm                                              #
+# Modified   : Saturday October 17th 2026 09:31:37 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Proxy Pool Module
+
+Requests are spread across the proxy endpoints of a pool, each with its own egress address. An
+endpoint is selected per request by its measured latency and error rate, and the rate of
+requests through each endpoint is bounded by a token bucket. Endpoints that fail repeatedly are
+ejected from the pool and re-admitted on probation once their ejection period has elapsed.
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from typing import Union
+
+from dotenv import load_dotenv
+
+from appvoc.infrastructure.web.base import PROXY_SERVERS
+
+# ------------------------------------------------------------------------------------------------ #
+load_dotenv()
+# Environment variables configuring the single rotating Webshare endpoint used before the pool.
+WEBSHARE = ("WEBSHARE_DNS", "WEBSHARE_PORT", "WEBSHARE_USER", "WEBSHARE_PWD")
+# Status codes charged to the proxy endpoint: proxy authentication required, and too many
+# requests from its egress address.
+PROXY_STATUS = (407, 429)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class TokenBucket:
+    """Token bucket bounding the request rate through a proxy endpoint.
+
+    Tokens accrue at 'rate' per second up to 'burst'. A reservation takes a token immediately,
+    allowing the balance to go negative, and returns the seconds until the reserved token
+    would have accrued, so concurrent callers are spaced at the configured rate.
+
+    Args:
+        rate (float): Tokens added per second.
+        burst (int): Maximum number of tokens held.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def wait(self) -> float:
+        """Returns the seconds until a token is available, without reserving it."""
+        return max(1 - self.tokens, 0) / self._rate
+
+    def reserve(self) -> float:
+        """Takes a token and returns the seconds to wait before using it."""
+        wait = self.wait()
+        self._tokens -= 1
+        return wait
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._updated) * self._rate, self._burst
+        )
+        self._updated = now
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Proxy:
+    """Proxy endpoint with its rate limit and health statistics.
+
+    Args:
+        endpoint (str): Host and port of the proxy server.
+        url (str): Proxy URL, including the scheme and any credentials.
+        bucket (TokenBucket): Token bucket bounding the request rate through the endpoint.
+        alpha (float): Smoothing factor of the latency and error rate moving averages.
+    """
+
+    def __init__(
+        self, endpoint: str, url: str, bucket: TokenBucket, alpha: float
+    ) -> None:
+        self._endpoint = endpoint
+        self._url = url
+        self._bucket = bucket
+        self._alpha = alpha
+
+        self._latency = None  # Exponentially weighted moving average of latency
+        self._error_rate = 0.0  # Exponentially weighted moving average of failures
+        self._requests = 0
+        self._successes = 0
+        self._failures = 0
+        self._consecutive_failures = 0
+        self._consecutive_successes = 0
+        self._strikes = 0  # Ejections since the endpoint last proved healthy
+        self._ejections = 0
+        self._ejected_until = None
+        self._started = None
+
+    @property
+    def endpoint(self) -> str:
+        return self._endpoint
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def bucket(self) -> TokenBucket:
+        return self._bucket
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    @property
+    def error_rate(self) -> float:
+        return self._error_rate
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._consecutive_failures
+
+    @property
+    def consecutive_successes(self) -> int:
+        return self._consecutive_successes
+
+    @property
+    def strikes(self) -> int:
+        return self._strikes
+
+    @property
+    def ejected_until(self) -> Union[float, None]:
+        return self._ejected_until
+
+    @property
+    def score(self) -> float:
+        """Returns the expected cost of a request through the endpoint. Lower is better.
+
+        Latency is inflated by the error rate, as failed requests are retried. Endpoints
+        without measured latency score zero, so that they are tried.
+        """
+        if self._latency is None:
+            return 0.0
+        return self._latency / max(1 - self._error_rate, 0.05)
+
+    @property
+    def metrics(self) -> dict:
+        """Returns the request counts, health and throughput of the endpoint."""
+        elapsed = time.monotonic() - self._started if self._started else 0
+        return {
+            "requests": self._requests,
+            "successes": self._successes,
+            "failures": self._failures,
+            "error_rate": round(self._error_rate, 4),
+            "latency": round(self._latency, 4) if self._latency is not None else None,
+            "throughput": round(self._successes / elapsed, 4) if elapsed > 0 else 0,
+            "ejections": self._ejections,
+            "admitted": self.admitted(),
+        }
+
+    def admitted(self, now: float = None) -> bool:
+        """Returns True unless the endpoint is serving an ejection period."""
+        now = time.monotonic() if now is None else now
+        return self._ejected_until is None or now >= self._ejected_until
+
+    def start(self) -> None:
+        """Records a request sent through the endpoint."""
+        self._started = self._started or time.monotonic()
+        self._requests += 1
+
+    def succeed(self, latency: float) -> None:
+        """Records a successful request and its latency."""
+        self._successes += 1
+        self._consecutive_failures = 0
+        self._consecutive_successes += 1
+        self._error_rate *= 1 - self._alpha
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += self._alpha * (latency - self._latency)
+
+    def fail(self) -> None:
+        """Records a failed request."""
+        self._failures += 1
+        self._consecutive_failures += 1
+        self._consecutive_successes = 0
+        self._error_rate += self._alpha * (1 - self._error_rate)
+
+    def eject(self, seconds: float) -> None:
+        """Removes the endpoint from selection for the given number of seconds."""
+        self._strikes += 1
+        self._ejections += 1
+        self._ejected_until = time.monotonic() + seconds
+
+    def readmit(self, error_rate: float) -> None:
+        """Returns the endpoint to selection on probation, with the given error rate."""
+        self._ejected_until = None
+        self._consecutive_failures = 0
+        self._error_rate = error_rate
+
+    def clear_strikes(self) -> None:
+        self._strikes = 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ProxyPool:
+    """Selects a proxy endpoint per request by health, within per-endpoint rate limits.
+
+    For each request, two admitted endpoints are sampled at random and the one with the lower
+    score, its smoothed latency inflated by its error rate, is chosen; endpoints with a token
+    available are preferred. Sampling two spreads load across egress addresses, while steering
+    it away from slow or failing endpoints. A token is reserved from the chosen endpoint's
+    bucket and the caller waits, if necessary, until the token accrues.
+
+    An endpoint is ejected after 'failure_threshold' consecutive failures, or once its error
+    rate exceeds 'max_error_rate' after 'min_requests' requests. The ejection period doubles
+    with each ejection that follows re-admission without a run of successes, up to
+    'max_ejection_period'. If every endpoint is ejected, the one whose period ends soonest is
+    re-admitted early, so that requests are never refused.
+
+    Proxy credentials are read once, from the PROXY_USER and PROXY_PWD environment variables,
+    unless provided. If neither is set and no endpoints are given, the single rotating
+    endpoint configured by WEBSHARE_DNS, WEBSHARE_PORT, WEBSHARE_USER and WEBSHARE_PWD is
+    used, as before the pool was introduced. A warning is logged if endpoints have no
+    credentials, as the proxy servers will refuse their requests.
+
+    Args:
+        endpoints (list): Host and port of each proxy server, or a proxy URL. Default is
+            PROXY_SERVERS, unless the Webshare environment variables apply.
+        username (str): Proxy username. Optional.
+        password (str): Proxy password. Optional.
+        rate (float): Requests per second allowed through each endpoint. Default = 2
+        burst (int): Requests an idle endpoint may send at once. Default = 5
+        failure_threshold (int): Consecutive failures at which an endpoint is ejected.
+            Default = 3
+        max_error_rate (float): Smoothed error rate at which an endpoint is ejected.
+            Default = 0.5
+        min_requests (int): Requests through an endpoint before its error rate is
+            considered. Default = 20
+        ejection_period (float): Seconds for which an endpoint is first ejected. Default = 30
+        max_ejection_period (float): Longest ejection, in seconds. Default = 600
+        alpha (float): Smoothing factor of the latency and error rate moving averages.
+            Default = 0.2
+        verbose (int): Number of requests between reports to the log. Default = 100
+    """
+
+    def __init__(
+        self,
+        endpoints: list = None,
+        username: str = None,
+        password: str = None,
+        rate: float = 2,
+        burst: int = 5,
+        failure_threshold: int = 3,
+        max_error_rate: float = 0.5,
+        min_requests: int = 20,
+        ejection_period: float = 30,
+        max_ejection_period: float = 600,
+        alpha: float = 0.2,
+        verbose: int = 100,
+    ) -> None:
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self._username = username if username is not None else os.getenv("PROXY_USER")
+        self._password = password if password is not None else os.getenv("PROXY_PWD")
+        if endpoints is None:
+            endpoints = self._default_endpoints()
+        self._failure_threshold = failure_threshold
+        self._max_error_rate = max_error_rate
+        self._min_requests = min_requests
+        self._ejection_period = ejection_period
+        self._max_ejection_period = max_ejection_period
+        self._verbose = verbose
+
+        self._proxies = [
+            Proxy(
+                endpoint=endpoint,
+                url=self._format_url(endpoint),
+                bucket=TokenBucket(rate=rate, burst=burst),
+                alpha=alpha,
+            )
+            for endpoint in endpoints
+        ]
+        self._counter = 0
+        self._lock = threading.Lock()
+        self._check_credentials()
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    @property
+    def proxies(self) -> list:
+        return self._proxies
+
+    @property
+    def metrics(self) -> dict:
+        """Returns the metrics of each endpoint, keyed by endpoint."""
+        return {proxy.endpoint: proxy.metrics for proxy in self._proxies}
+
+    def get(self) -> Union[Proxy, None]:
+        """Returns a proxy, sleeping until its rate limit admits the request.
+
+        Returns None if the pool has no endpoints, in which case requests are sent directly.
+        """
+        proxy, wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return proxy
+
+    async def aget(self) -> Union[Proxy, None]:
+        """Returns a proxy, awaiting its rate limit without blocking the event loop.
+
+        Returns None if the pool has no endpoints, in which case requests are sent directly.
+        """
+        proxy, wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return proxy
+
+    def succeed(self, proxy: Proxy, latency: float) -> None:
+        """Records a successful request through a proxy.
+
+        Args:
+            proxy (Proxy): The proxy returned by 'get' or 'aget'.
+            latency (float): Seconds between the request and its response.
+        """
+        if proxy is None:
+            return
+        with self._lock:
+            proxy.succeed(latency=latency)
+            if proxy.consecutive_successes >= self._failure_threshold:
+                proxy.clear_strikes()
+
+    def fail(self, proxy: Proxy) -> None:
+        """Records a failed request through a proxy, ejecting the proxy if unhealthy.
+
+        Only failures attributable to the proxy, such as connection errors, timeouts, proxy
+        authentication errors and rate limiting of its egress address, are to be recorded.
+        Errors returned by the target server say nothing about the proxy's health.
+
+        Args:
+            proxy (Proxy): The proxy returned by 'get' or 'aget'.
+        """
+        if proxy is None:
+            return
+        with self._lock:
+            proxy.fail()
+            if proxy.admitted() and self._unhealthy(proxy):
+                self._eject(proxy)
+
+    def _reserve(self) -> tuple:
+        """Selects a proxy and reserves a token, returning the proxy and the wait in seconds."""
+        if not self._proxies:
+            return None, 0
+        with self._lock:
+            proxy = self._select()
+            wait = proxy.bucket.reserve()
+            proxy.start()
+            self._counter += 1
+            if self._counter % self._verbose == 0:
+                self._monitor()
+        return proxy, wait
+
+    def _select(self) -> Proxy:
+        """Returns the better of two admitted proxies sampled at random."""
+        candidates = self._admitted()
+        if len(candidates) > 1:
+            candidates = random.sample(candidates, 2)
+        return min(candidates, key=lambda proxy: (proxy.bucket.wait() > 0, proxy.score))
+
+    def _admitted(self) -> list:
+        """Returns the admitted proxies, re-admitting those whose ejection has elapsed."""
+        now = time.monotonic()
+        admitted = []
+        for proxy in self._proxies:
+            if proxy.ejected_until is not None and proxy.admitted(now):
+                self._readmit(proxy)
+            if proxy.admitted(now):
+                admitted.append(proxy)
+        if not admitted:
+            proxy = min(self._proxies, key=lambda proxy: proxy.ejected_until)
+            msg = f"All proxies are ejected. Re-admitting {proxy.endpoint} early."
+            self._logger.warning(msg)
+            self._readmit(proxy)
+            admitted.append(proxy)
+        return admitted
+
+    def _unhealthy(self, proxy: Proxy) -> bool:
+        if proxy.consecutive_failures >= self._failure_threshold:
+            return True
+        return (
+            proxy.requests >= self._min_requests
+            and proxy.error_rate >= self._max_error_rate
+        )
+
+    def _eject(self, proxy: Proxy) -> None:
+        seconds = min(
+            self._ejection_period * 2**proxy.strikes, self._max_ejection_period
+        )
+        proxy.eject(seconds=seconds)
+        msg = f"Ejected proxy {proxy.endpoint} for {seconds} seconds. Error rate: {round(proxy.error_rate, 2)}."
+        self._logger.debug(msg)
+
+    def _readmit(self, proxy: Proxy) -> None:
+        # On probation, a failure or two more will eject the proxy again.
+        proxy.readmit(error_rate=self._max_error_rate / 2)
+        msg = f"Re-admitted proxy {proxy.endpoint}."
+        self._logger.debug(msg)
+
+    def _default_endpoints(self) -> list:
+        """Returns PROXY_SERVERS, or the Webshare endpoint if only it is configured."""
+        if self._username or self._password:
+            return PROXY_SERVERS
+        webshare = [os.getenv(name) for name in WEBSHARE]
+        if not all(webshare):
+            return PROXY_SERVERS
+        dns, port, self._username, self._password = webshare
+        msg = "PROXY_USER and PROXY_PWD are not set. Using the Webshare proxy endpoint."
+        self._logger.info(msg)
+        return [f"{dns}:{port}"]
+
+    def _check_credentials(self) -> None:
+        """Warns if requests will be sent to proxy endpoints without credentials."""
+        missing = [proxy.endpoint for proxy in self._proxies if "@" not in proxy.url]
+        if missing:
+            msg = (
+                f"No proxy credentials are configured for {len(missing)} endpoint(s), "
+                f"including {missing[0]}. Set PROXY_USER and PROXY_PWD, or the proxy "
+                "servers will refuse requests and every endpoint will be ejected."
+            )
+            self._logger.warning(msg)
+
+    def _format_url(self, endpoint: str) -> str:
+        """Returns the proxy URL for an endpoint, with credentials if configured."""
+        if "://" in endpoint:
+            return endpoint
+        if self._username and self._password:
+            return f"http://{self._username}:{self._password}@{endpoint}"
+        return f"http://{endpoint}"
+
+    def _monitor(self) -> None:
+        width = 40
+        msg = f"{self.__class__.__name__}:\n"
+        for endpoint, metrics in self.metrics.items():
+            msg += f"\t{endpoint.rjust(width, ' ')} | {metrics}\n"
+        self._logger.debug(msg)
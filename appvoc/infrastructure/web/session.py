@@ -16,15 +16,16 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import os
 import logging
 from dotenv import load_dotenv
 
 import requests
+from urllib3.exceptions import ResponseError
 
 from appvoc.infrastructure.web.throttle import LatencyThrottle
 from appvoc.infrastructure.web.adapter import TimeoutHTTPAdapter
 from appvoc.infrastructure.web.headers import BrowserHeader
+from appvoc.infrastructure.web.proxy import PROXY_STATUS, Proxy, ProxyPool
 
 
 load_dotenv()
@@ -34,10 +35,21 @@ load_dotenv()
 class SessionHandler:
     """Encapsulates an HTTP Session with retry capability.
 
+    In persistent mode, a long-lived session is held for each proxy endpoint, so that TCP/TLS
+    connections are kept alive and reused from the session's bounded connection pool. Each
+    session mounts its own copy of the adapter, so sessions do not share pools.
+
+    Each request is routed through a proxy selected from the proxy pool, to which the outcome
+    of the request is reported.
+
     Args:
         timeout (TimeoutHTTPAdapter): An HTTP Adapter for managing timeouts and retries at request level.
         retries (int): Number of sessions to retry if timeout retry maximum has been reached.
         delay (tuple): The lower and upper bound on time between requests.
+        persistent (bool): Whether sessions are reused across requests. If False, a new session
+            is created for each request. Default is True.
+        proxies (ProxyPool): Pool of proxy endpoints. If None, a pool of the default proxy
+            servers is created.
     """
 
     def __init__(
@@ -46,20 +58,48 @@ class SessionHandler:
         throttle: LatencyThrottle,
         headers: BrowserHeader,
         session_retries: int = 3,
+        persistent: bool = True,
+        proxies: ProxyPool = None,
     ) -> None:
         self._timeout = timeout
         self._throttle = throttle
         self._headers = iter(headers)
 
         self._session_retries = session_retries
+        self._persistent = persistent
+        self._proxies = proxies or ProxyPool()
 
+        self._endpoint = None  # The proxy endpoint selected for the current request
         self._proxy = None  # The proxy used for the current request
         self._header = None  # The header used for the current request.
 
         self._session = None
+        self._sessions = {}  # Long-lived sessions keyed by proxy endpoint
 
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
+    @property
+    def stats(self) -> dict:
+        """Returns connection reuse statistics for the pools of the long-lived sessions."""
+        adapters = [session.get_adapter("https://") for session in self._sessions.values()]
+        requests = sum(adapter.connections["requests"] for adapter in adapters)
+        new = sum(adapter.connections["connections"] for adapter in adapters)
+        reused = max(requests - new, 0)
+        return {
+            "sessions": len(self._sessions),
+            "requests": requests,
+            "new_connections": new,
+            "reused_connections": reused,
+            "reuse_rate": round(reused / requests, 4) if requests > 0 else 0,
+        }
+
+    def close(self) -> None:
+        """Closes all sessions and releases their pooled connections."""
+        for session in self._sessions.values():
+            session.close()
+        self._sessions = {}
+        self._session = None
+
     def get(self, url: str, header: dict = None, params: dict = None):  # noqa: C901
         """Executes the http request and returns a Response object.
 
@@ -76,14 +116,17 @@ class SessionHandler:
             self._setup(header=header)
 
             try:
-                self._throttle.start()
+                start = self._throttle.start()
                 response = self._session.get(
                     url=url, headers=self._header, params=params, proxies=self._proxy
                 )
-                self._throttle.stop()
+                latency = self._throttle.stop(start)
+                self._proxies.succeed(proxy=self._endpoint, latency=latency)
                 self._throttle.delay()
 
             except Exception as e:  # pragma: no cover
+                if self._proxy_failed(e):
+                    self._proxies.fail(proxy=self._endpoint)
                 session_retry += 1
                 msg = f"A {type(e)} exception occurred. \n{e}\nRetrying with retry #{session_retry}."
                 self._logger.exception(msg)
@@ -97,22 +140,52 @@ class SessionHandler:
     def _setup(self, header: dict = None) -> None:
         """Conducts pre-request initializations"""
 
-        self._proxy = self._get_proxy()  # From rotating proxies
+        self._endpoint = self._proxies.get()  # From the proxy pool
+        self._proxy = self._get_proxy(self._endpoint)
         self._header = header or next(self._headers)  # From rotating headers
 
-        # Construct session object
-        self._session = requests.Session()
-        self._session.mount("https://", self._timeout)
-        self._session.mount("http://", self._timeout)
+        self._session = self._get_session()
 
-    def _get_proxy(self) -> dict:
-        """Returns proxy servers"""
-        username = os.getenv("WEBSHARE_USER")
-        password = os.getenv("WEBSHARE_PWD")
-        dns = os.getenv("WEBSHARE_DNS")
-        port = os.getenv("WEBSHARE_PORT")
+    def _get_session(self) -> requests.Session:
+        """Returns the long-lived session for the current proxy, creating it if necessary."""
+        if not self._persistent:
+            return self._create_session()
 
-        return {
-            "http": f"http://{username}:{password}@{dns}:{port}/",
-            "https": f"http://{username}:{password}@{dns}:{port}/",
-        }
+        key = self._proxy["https"] if self._proxy else None
+        if key not in self._sessions:
+            self._sessions[key] = self._create_session()
+        return self._sessions[key]
+
+    def _proxy_failed(self, exception: Exception) -> bool:
+        """Returns True if the exception is attributable to the proxy.
+
+        Connection errors, including proxy errors, and timeouts count against the proxy, as
+        do retries exhausted on proxy authentication or rate limiting status codes. Errors
+        returned by the target server do not.
+        """
+        if isinstance(
+            exception,
+            (requests.exceptions.ConnectionError, requests.exceptions.Timeout),
+        ):
+            return True
+        if isinstance(exception, requests.exceptions.RetryError):
+            reason = str(getattr(exception.args[0], "reason", exception))
+            return any(
+                ResponseError.SPECIFIC_ERROR.format(status_code=status) in reason
+                for status in PROXY_STATUS
+            )
+        return False
+
+    def _get_proxy(self, endpoint: Proxy = None) -> dict:
+        """Returns the requests proxies mapping for a proxy endpoint."""
+        if endpoint is None:
+            return None
+        return {"http": endpoint.url, "https": endpoint.url}
+
+    def _create_session(self) -> requests.Session:
+        """Constructs a session object with its own copy of the timeout adapter mounted."""
+        session = requests.Session()
+        adapter = self._timeout.copy()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
@@ -17,15 +17,16 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Autothrottle Module"""
+import asyncio
+import time
 from time import sleep
-from datetime import datetime
 import logging
 from typing import Union
 
 from scipy.stats import expon
-import numpy as np
 
 from appvoc.infrastructure.web.base import Throttle
+from appvoc.infrastructure.web.buffer import RingBuffer
 
 # ------------------------------------------------------------------------------------------------ #
 
@@ -42,6 +43,8 @@ class LatencyThrottle(Throttle):
             Default = 2.
         verbose (int): Degree of verbosity in terms of the number of requests between
             progress reports to the log.
+        latency_buffer_size (int): Number of most recent request latencies retained for
+            percentile reporting. Default = 1000
 
     """
 
@@ -51,8 +54,9 @@ class LatencyThrottle(Throttle):
         min_delay: int = 1000,
         max_delay: int = 10000,
         verbose: int = 50,
+        latency_buffer_size: int = 1000,
     ) -> None:
-        super().__init__()
+        super().__init__(latency_buffer_size=latency_buffer_size)
         self._start_delay = start_delay
         self._min_delay = min_delay
         self._max_delay = max_delay
@@ -60,20 +64,20 @@ class LatencyThrottle(Throttle):
 
         self._prior_delay = start_delay
         self._counter = 0
-        self._latency = None
-        self._latencies = []
-        self._wait = []
+        # Latencies and delays since the last progress report.
+        self._latencies = RingBuffer(capacity=verbose)
+        self._wait = RingBuffer(capacity=verbose)
 
-        self._start = None
-        self._end = None
+    def stop(self, start: float = None) -> float:
+        """Records and returns the latency of a request.
 
-    def start(self) -> None:
-        self._start = datetime.now()
-
-    def stop(self) -> None:
-        self._end = datetime.now()
-        self._latency = (self._end - self._start).total_seconds()
-        self._latencies.append(self._latency)
+        Args:
+            start (float): The token returned by 'start' for this request. Defaults to the
+                most recent start time.
+        """
+        latency = super().stop(start)
+        self._latencies.append(latency)
+        return latency
 
     def delay(self) -> Union[float, None]:
         """Computes and optionally executes a delay, related to request latency and status code.
@@ -111,23 +115,27 @@ class LatencyThrottle(Throttle):
         self._counter += 1
 
         if self._counter % self._verbose == 0:
-            min_latency = round(np.min(self._latencies), 2)
-            max_latency = round(np.max(self._latencies), 2)
-            ave_latency = round(np.mean(self._latencies), 2)
-            std_latency = round(np.std(self._latencies), 2)
-            ttl_latency = round(np.sum(self._latencies), 2)
-            min_delay = round(np.min(self._wait), 2)
-            max_delay = round(np.max(self._wait), 2)
-            ave_delay = round(np.mean(self._wait), 2)
-            std_delay = round(np.std(self._wait), 2)
-            ttl_delay = round(np.sum(self._wait), 2)
+            min_latency = round(self._latencies.min, 2)
+            max_latency = round(self._latencies.max, 2)
+            ave_latency = round(self._latencies.mean, 2)
+            std_latency = round(self._latencies.std, 2)
+            ttl_latency = round(self._latencies.sum, 2)
+            min_delay = round(self._wait.min, 2)
+            max_delay = round(self._wait.max, 2)
+            ave_delay = round(self._wait.mean, 2)
+            std_delay = round(self._wait.std, 2)
+            ttl_delay = round(self._wait.sum, 2)
+            percentiles = {k: round(v, 2) for k, v in self.percentiles.items()}
 
             width = 32
             msg = f"\n\t{'Min Latency'.rjust(width, ' ')} | {min_latency}\n"
             msg += f"\n\t{'Max Latency'.rjust(width, ' ')} | {max_latency}\n"
             msg += f"\n\t{'Ave Latency'.rjust(width, ' ')} | {ave_latency}\n"
             msg += f"\t{'Std Latency'.rjust(width, ' ')} | {std_latency}\n"
-            msg += f"\t{'Total Latency'.rjust(width, ' ')} | {ttl_latency}\n\n"
+            msg += f"\t{'Total Latency'.rjust(width, ' ')} | {ttl_latency}\n"
+            msg += f"\t{'P50 Latency'.rjust(width, ' ')} | {percentiles['p50']}\n"
+            msg += f"\t{'P95 Latency'.rjust(width, ' ')} | {percentiles['p95']}\n"
+            msg += f"\t{'P99 Latency'.rjust(width, ' ')} | {percentiles['p99']}\n\n"
             msg += f"\t{'Min Delay'.rjust(width, ' ')} | {min_delay}\n"
             msg += f"\t{'Max Delay'.rjust(width, ' ')} | {max_delay}\n"
             msg += f"\t{'Ave Delay'.rjust(width, ' ')} | {ave_delay}\n"
@@ -136,8 +144,8 @@ class LatencyThrottle(Throttle):
             self._logger.debug(msg)
 
             self._counter = 0
-            self._latencies = []
-            self._wait = []
+            self._latencies.clear()
+            self._wait.clear()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -146,6 +154,11 @@ class LatencyThrottle(Throttle):
 class AThrottle(Throttle):
     """Async Throttle based upon the target website latency.
 
+    Delays are awaited with 'adelay', which never blocks the event loop. Each delay is
+    scheduled on a timeline shared by all callers, so that request starts are paced globally
+    at the configured rate regardless of the number of concurrent requests. Latency is
+    measured per request: 'start' returns the start time, which is passed back to 'stop'.
+
     Args:
         burnin_period (int): The number of requests in the burn-in period. Default is 50
         burnin_reset (int): The number of requests between each burnin period.
@@ -155,6 +168,8 @@ class AThrottle(Throttle):
         threshold (float): The number of standard deviations above mean latency that would trigger a cooldown.
         tolerance (float): The proportion of the rolling window above threshold that is allowed before cooldown.
         rate (float): The number of requests per second after burn-in. Default is 1.
+        latency_buffer_size (int): Number of most recent request latencies retained for
+            percentile reporting. Default is 1000.
 
     """
 
@@ -170,8 +185,9 @@ class AThrottle(Throttle):
         tolerance: float = 0.8,
         rate: int = 1,
         verbose: int = 50,
+        latency_buffer_size: int = 1000,
     ) -> None:
-        super().__init__()
+        super().__init__(latency_buffer_size=latency_buffer_size)
         self._burnin_period = burnin_period
         self._burnin_reset = burnin_reset
         self._burnin_rate = burnin_rate
@@ -186,44 +202,79 @@ class AThrottle(Throttle):
         self._counter = 0
         self._cooldown_counter = 0
 
-        self._start = None
-        self._end = None
-        self._latency = None
-
         self._burnin_latency_mean = 0
         self._burnin_latency_std = 0
         self._burnin_latency_threshold = 0
-        self._burnin_latency = []
-        self._latencies = []
-        self._delays = []
+        self._burnin_latency = RingBuffer(capacity=burnin_period)
+        # Latencies and delays since the last progress report.
+        self._latencies = RingBuffer(capacity=verbose)
+        self._delays = RingBuffer(capacity=verbose)
 
-        self._latency_window = np.zeros(self._rolling_window_size)
+        self._latency_window = RingBuffer(capacity=rolling_window_size)
+        self._next_slot = 0  # Monotonic time at which the next request may start
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
-    def start(self) -> None:
-        self._start = datetime.now()
+    def stop(self, start: float = None) -> float:
+        """Records and returns the latency of a request.
 
-    def stop(self) -> None:
-        self._end = datetime.now()
-        self._latency = (self._end - self._start).total_seconds()
+        The latency feeds the burn-in statistics or the rolling window consulted by the
+        cooldown logic.
+
+        Args:
+            start (float): The token returned by 'start' for this request. Required when
+                requests overlap. Defaults to the most recent start time.
+        """
+        super().stop(start)
         self._latencies.append(self._latency)
 
+        if self._burning_in():
+            self._burnin()
+        else:
+            self._update_running_window(self._latency)
+        return self._latency
+
     def delay(self) -> Union[float, None]:
+        """Computes the delay for the next request and sleeps for its duration.
+
+        This blocks the calling thread. Use 'adelay' from within an event loop.
+        """
+        delay = self._next_delay()
+        sleep(delay)
+        self._monitor()
+        return delay
+
+    async def adelay(self) -> float:
+        """Awaits the delay for the next request without blocking the event loop.
+
+        Each call reserves the next slot on a shared timeline, spaced from the prior slot by
+        the computed delay, and waits until that slot arrives. Concurrent callers are thereby
+        released one at a time at the throttled rate.
+
+        Returns the number of seconds waited.
+        """
+        delay = self._next_delay()
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + delay
+        self._monitor()
+        wait = slot - now
+        await asyncio.sleep(wait)
+        return wait
+
+    def _next_delay(self) -> float:
         """Computes the delay for the next request."""
 
         if self._starting_epoch():
             self._reset_epoch()
 
         if self._burning_in():
-            self._burnin()
             delay = self._burnin_delay()
         else:
             delay = self._compute_delay()
 
         self._counter += 1
         self._delays.append(delay)
-        sleep(delay)
-        self._monitor()
+        return delay
 
     def _starting_epoch(self) -> bool:
         """If first request after burn-in, return True, otherwise return False"""
@@ -236,7 +287,7 @@ class AThrottle(Throttle):
         self._burnin_latency_mean = 0
         self._burnin_latency_std = 0
         self._burnin_latency_threshold = 0
-        self._burnin_latency = []
+        self._burnin_latency.clear()
 
     def _burning_in(self) -> bool:
         """Returns True if within a burn-in period, returns False otherwise."""
@@ -255,9 +306,9 @@ class AThrottle(Throttle):
             self._logger.debug(msg)
 
         self._burnin_latency.append(self._latency)
-        if len(self._burnin_latency) == self._burnin_period:
-            self._burnin_latency_mean = np.mean(self._burnin_latency)
-            self._burnin_latency_std = np.std(self._burnin_latency)
+        if self._burnin_latency.full:
+            self._burnin_latency_mean = self._burnin_latency.mean
+            self._burnin_latency_std = self._burnin_latency.std
             self._burnin_latency_threshold = (
                 self._burnin_latency_mean
                 + self._burnin_threshold_factor * self._burnin_latency_std
@@ -269,7 +320,6 @@ class AThrottle(Throttle):
 
     def _compute_delay(self) -> int:
         """Returns the number of seconds to delay"""
-        self._update_running_window(self._latency)
         delay = expon.rvs(scale=1 / self._rate, size=1)[0]
         if self._running_hot():
             delay = self._cooldown(delay)
@@ -281,13 +331,12 @@ class AThrottle(Throttle):
         Args:
             latency (float): Time between last request and response
         """
-        idx = self._counter % self._burnin_period
-        self._latency_window[idx] = latency
+        self._latency_window.append(latency)
 
     def _running_hot(self) -> bool:
         """Returns True if tolerance of window_size is above threshold, and returns False otherwise."""
         return (
-            np.sum(np.where(self._latency_window > self._burnin_latency_threshold))
+            self._latency_window.count_above(self._burnin_latency_threshold)
             > self._tolerance * self._rolling_window_size
         )
 
@@ -306,18 +355,19 @@ class AThrottle(Throttle):
         return delay
 
     def _monitor(self) -> None:
-        if self._counter % self._verbose == 0:
-            min_latency = np.min(self._latencies)
-            mean_latency = np.mean(self._latencies)
-            std_latency = np.std(self._latencies)
-            max_latency = np.max(self._latencies)
-            min_delay = np.min(self._delays)
-            mean_delay = np.mean(self._delays)
-            std_delay = np.std(self._delays)
-            max_delay = np.max(self._delays)
-
-            self._latencies = []
-            self._delays = []
+        if self._counter % self._verbose == 0 and len(self._latencies) > 0 and len(self._delays) > 0:
+            min_latency = self._latencies.min
+            mean_latency = self._latencies.mean
+            std_latency = self._latencies.std
+            max_latency = self._latencies.max
+            min_delay = self._delays.min
+            mean_delay = self._delays.mean
+            std_delay = self._delays.std
+            max_delay = self._delays.max
+            percentiles = self.percentiles
+
+            self._latencies.clear()
+            self._delays.clear()
 
             width = 24
             msg = f"{self.__class__.__name__}:\n:"
@@ -326,7 +376,10 @@ class AThrottle(Throttle):
             msg += f"\t{'Min Latency:'.rjust(width,' ')} | {min_latency}\n"
             msg += f"\t{'Mean Latency:'.rjust(width,' ')} | {mean_latency}\n"
             msg += f"\t{'Max Latency:'.rjust(width,' ')} | {max_latency}\n"
-            msg += f"\t{'Std Latency:'.rjust(width,' ')} | {std_latency}\n\n"
+            msg += f"\t{'Std Latency:'.rjust(width,' ')} | {std_latency}\n"
+            msg += f"\t{'P50 Latency:'.rjust(width,' ')} | {percentiles['p50']}\n"
+            msg += f"\t{'P95 Latency:'.rjust(width,' ')} | {percentiles['p95']}\n"
+            msg += f"\t{'P99 Latency:'.rjust(width,' ')} | {percentiles['p99']}\n\n"
             msg += f"\t{'Min Delay:'.rjust(width,' ')} | {min_delay}\n"
             msg += f"\t{'Mean Delay:'.rjust(width,' ')} | {mean_delay}\n"
             msg += f"\t{'Max Delay:'.rjust(width,' ')} | {max_delay}\n"
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /appvoc/infrastructure/web/transport.py                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 08:36:05 pm                                              #
+# Modified   : Saturday October 17th 2026 08:36:05 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""HTTP Transport Module
+
+Transports execute the requests of the asynchronous session handler, which retains the
+throttle, retry and header rotation logic. The transport is selected in config/web.yml:
+
+    http1: aiohttp, one connection per concurrent request.
+    http2: httpx with h2, multiplexing concurrent requests over a few connections per host.
+           Requires the optional httpx and h2 packages.
+"""
+from __future__ import annotations
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+import aiohttp
+
+from appvoc.infrastructure.web.proxy import PROXY_STATUS
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover
+    h2 = None
+
+# ------------------------------------------------------------------------------------------------ #
+# Status codes with which a server signals that it is overloaded or rate limiting requests.
+OVERLOAD_STATUS = (429, 502, 503, 504)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Transport(ABC):
+    """Asynchronous HTTP client shared by the requests of an asynchronous session handler.
+
+    A transport is bound to the event loop in which it was opened, and is closed by its owner
+    in that loop, since connections can no longer be closed once the loop that owns them is
+    closed. If used from a new event loop, its clients are replaced, closing those left open.
+
+    Args:
+        timeout (int): Total timeout per request in seconds.
+        limit (int): Total number of simultaneous connections.
+        keepalive_timeout (float): Seconds an idle connection is kept alive for reuse.
+    """
+
+    def __init__(self, timeout: int, limit: int, keepalive_timeout: float) -> None:
+        self._timeout = timeout
+        self._limit = limit
+        self._keepalive_timeout = keepalive_timeout
+        self._loop = None  # Event loop to which the clients are bound
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+        """Returns True if the transport has open clients."""
+
+    @abstractmethod
+    async def open(self) -> None:
+        """Opens the transport in the running event loop, if not already open."""
+
+    @abstractmethod
+    async def get(self, url: str, headers: dict = None, proxy: str = None) -> bytes:
+        """Executes a GET request and returns the response body.
+
+        Args:
+            url (str): The url for the http request.
+            headers (dict): A dictionary containing header parameters.
+            proxy (str): URL of the proxy through which the request is sent.
+
+        Raises: An exception if the request fails or returns a non-2xx status.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Closes the transport's clients and their connections."""
+
+    def overloaded(self, exception: Exception) -> bool:
+        """Returns True if the exception raised by 'get' signals an overloaded server.
+
+        Args:
+            exception (Exception): The exception raised by the request.
+        """
+        return isinstance(exception, asyncio.TimeoutError)
+
+    def proxy_failed(self, exception: Exception) -> bool:
+        """Returns True if the exception raised by 'get' is attributable to the proxy.
+
+        Connection errors, timeouts, proxy authentication errors and rate limiting of the
+        proxy's egress address count against the proxy. Other errors returned by the target
+        server do not.
+
+        Args:
+            exception (Exception): The exception raised by the request.
+        """
+        return isinstance(exception, (asyncio.TimeoutError, ConnectionError))
+
+    def _loop_changed(self) -> bool:
+        """Returns True, recording the running loop, if the transport must be (re)opened."""
+        loop = asyncio.get_running_loop()
+        if self.is_open and self._loop is loop:
+            return False
+        if self.is_open and self._loop is not None:  # pragma: no cover
+            msg = "Event loop changed. Replacing the transport's clients."
+            self._logger.debug(msg)
+        self._loop = loop
+        return True
+
+    async def _close_stale(self, close: Callable[[], Awaitable[None]]) -> None:
+        """Closes clients left open by a prior event loop that did not shut them down.
+
+        Args:
+            close (Callable): Coroutine function closing the clients.
+        """
+        try:
+            await close()
+        except RuntimeError as e:  # pragma: no cover
+            # Connections bound to a closed loop are released when collected.
+            msg = f"Clients of a closed event loop could not be closed.\n{e}"
+            self._logger.debug(msg)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class AiohttpTransport(Transport):
+    """HTTP/1.1 transport over a single aiohttp ClientSession and TCPConnector.
+
+    Args:
+        timeout (int): Total timeout per request in seconds.
+        limit (int): Total number of simultaneous connections held by the connector.
+        keepalive_timeout (float): Seconds an idle connection is kept alive for reuse.
+        limit_per_host (int): Number of simultaneous connections to the same endpoint. Zero
+            means no per host limit.
+        ttl_dns_cache (int): Seconds for which resolved DNS entries are cached.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        limit: int = 100,
+        keepalive_timeout: float = 30,
+        limit_per_host: int = 0,
+        ttl_dns_cache: int = 300,
+    ) -> None:
+        super().__init__(
+            timeout=timeout, limit=limit, keepalive_timeout=keepalive_timeout
+        )
+        self._limit_per_host = limit_per_host
+        self._ttl_dns_cache = ttl_dns_cache
+        self._session = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    async def open(self) -> None:
+        stale = self._session
+        if not self._loop_changed():
+            return
+        if stale is not None and not stale.closed:
+            await self._close_stale(stale.close)
+        connector = aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            ttl_dns_cache=self._ttl_dns_cache,
+            keepalive_timeout=self._keepalive_timeout,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            trust_env=True,
+            raise_for_status=True,
+            timeout=aiohttp.ClientTimeout(total=self._timeout),
+        )
+
+    async def get(self, url: str, headers: dict = None, proxy: str = None) -> bytes:
+        await self.open()
+        async with self._session.get(
+            url, headers=headers, proxy=proxy, ssl=False
+        ) as response:
+            return await response.read()
+
+    async def close(self) -> None:
+        if self.is_open:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def overloaded(self, exception: Exception) -> bool:
+        if isinstance(exception, aiohttp.ClientResponseError):
+            return exception.status in OVERLOAD_STATUS
+        return super().overloaded(exception)
+
+    def proxy_failed(self, exception: Exception) -> bool:
+        if isinstance(exception, aiohttp.ClientHttpProxyError):
+            return True
+        if isinstance(exception, aiohttp.ClientResponseError):
+            return exception.status in PROXY_STATUS
+        if isinstance(exception, aiohttp.ClientConnectionError):
+            return True
+        return super().proxy_failed(exception)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class HTTP2Transport(Transport):
+    """HTTP/2 transport multiplexing concurrent requests over shared connections.
+
+    httpx binds a proxy to a client, so one client is held per proxy endpoint. Each client
+    multiplexes concurrent requests to a host as streams over its HTTP/2 connections, falling
+    back to HTTP/1.1 for servers that do not negotiate HTTP/2.
+
+    Args:
+        timeout (int): Total timeout per request in seconds.
+        limit (int): Maximum number of connections held by each client.
+        keepalive_timeout (float): Seconds an idle connection is kept alive for reuse.
+    """
+
+    def __init__(
+        self, timeout: int = 30, limit: int = 100, keepalive_timeout: float = 30
+    ) -> None:
+        super().__init__(
+            timeout=timeout, limit=limit, keepalive_timeout=keepalive_timeout
+        )
+        if httpx is None or h2 is None:
+            msg = "The http2 transport requires the httpx and h2 packages. Install httpx[http2]."
+            self._logger.exception(msg)
+            raise ImportError(msg)
+        self._clients = {}  # Clients keyed by proxy endpoint
+
+    @property
+    def is_open(self) -> bool:
+        return self._loop is not None
+
+    async def open(self) -> None:
+        stale = self._clients
+        if not self._loop_changed():
+            return
+        if len(stale) > 0:
+            await self._close_stale(lambda: self._aclose(clients=stale))
+        self._clients = {}
+
+    async def get(self, url: str, headers: dict = None, proxy: str = None) -> bytes:
+        await self.open()
+        response = await self._get_client(proxy=proxy).get(url, headers=headers)
+        response.raise_for_status()
+        return response.content
+
+    async def close(self) -> None:
+        await self._aclose(clients=self._clients)
+        self._clients = {}
+        self._loop = None
+
+    def overloaded(self, exception: Exception) -> bool:
+        if isinstance(exception, httpx.HTTPStatusError):
+            return exception.response.status_code in OVERLOAD_STATUS
+        if isinstance(exception, httpx.TimeoutException):
+            return True
+        return super().overloaded(exception)
+
+    def proxy_failed(self, exception: Exception) -> bool:
+        if isinstance(exception, httpx.HTTPStatusError):
+            return exception.response.status_code in PROXY_STATUS
+        if isinstance(exception, httpx.TransportError):
+            return True
+        return super().proxy_failed(exception)
+
+    @staticmethod
+    async def _aclose(clients: dict) -> None:
+        """Closes the clients, skipping those already closed."""
+        for client in list(clients.values()):
+            if not client.is_closed:
+                await client.aclose()
+
+    def _get_client(self, proxy: str = None) -> httpx.AsyncClient:
+        """Returns the client for the proxy endpoint, creating it if necessary."""
+        if proxy not in self._clients:
+            self._clients[proxy] = httpx.AsyncClient(
+                http2=True,
+                proxy=proxy,
+                verify=False,
+                trust_env=True,
+                timeout=httpx.Timeout(self._timeout),
+                limits=httpx.Limits(
+                    max_connections=self._limit,
+                    max_keepalive_connections=self._limit,
+                    keepalive_expiry=self._keepalive_timeout,
+                ),
+            )
+        return self._clients[proxy]
+
+
+# ------------------------------------------------------------------------------------------------ #
+TRANSPORTS = {"http1": AiohttpTransport, "http2": HTTP2Transport}
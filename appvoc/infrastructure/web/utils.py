@@ -17,21 +17,26 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import sys
+from typing import Union
+
 import requests
 
 
 # ------------------------------------------------------------------------------------------------ #
-def getsize(response: requests.Response) -> int:
+def getsize(response: Union[requests.Response, dict]) -> int:
     """Returns the size of an HTTP response object.
 
+    The size is taken from the content-length header or, if absent, the length of the body.
+    Bodies decoded by the asynchronous session handler carry the size of the body from
+    which they were decoded.
+
     Args:
-        response (requests.Response): An HTTP Response object.
+        response (Union[requests.Response, dict]): An HTTP Response object or decoded body.
 
     """
-    try:
-        size = int(response.headers["content-length"])
-    except KeyError:
-        size = sys.getsizeof(response.json())
-    except Exception:
-        size = sys.getsizeof(response)
-    return size
+    if isinstance(response, requests.Response):
+        try:
+            return int(response.headers["content-length"])
+        except (KeyError, ValueError):
+            return len(response.content)
+    return getattr(response, "nbytes", None) or sys.getsizeof(response)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoC Ratings & Reviews Analysis                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /scripts/benchmark/uow.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : https://github.com/variancexplained/appvoc                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 06:41:09 pm                                              #
+# Modified   : Saturday October 17th 2026 06:41:09 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Unit of Work Repository Access Benchmark
+
+Measures the per-page overhead of obtaining repositories from the unit of work in the review
+scraping loop. 'before' constructs each repository, and parses the persistence configuration,
+on every access, as the unit of work did before repositories and configurations were cached.
+'after' uses the cached repositories of a unit of work. No database connection is made.
+
+    python -m scripts.benchmark.uow --pages 1000
+
+"""
+from __future__ import annotations
+import argparse
+import os
+import time
+
+from dotenv import load_dotenv
+
+from appvoc.data.repo.appdata import AppDataRepo
+from appvoc.data.repo.job import JobRepo, RatingJobRunRepo, ReviewJobRunRepo
+from appvoc.data.repo.project import AppDataProjectRepo
+from appvoc.data.repo.rating import RatingRepo
+from appvoc.data.repo.request import ReviewRequestRepo
+from appvoc.data.repo.review import ReviewRepo
+from appvoc.data.repo.uow import UoW
+from appvoc.infrastructure.file.io import IOService
+
+# ------------------------------------------------------------------------------------------------ #
+load_dotenv()
+# ------------------------------------------------------------------------------------------------ #
+# Repositories accessed through the unit of work for each page in the review scraping loop.
+PAGE_ACCESSES = ("review_repo", "review_request_repo", "review_jobrun_repo", "job_repo")
+REPOS = {
+    "app_repo": AppDataRepo,
+    "review_repo": ReviewRepo,
+    "rating_repo": RatingRepo,
+    "app_project_repo": AppDataProjectRepo,
+    "job_repo": JobRepo,
+    "rating_jobrun_repo": RatingJobRunRepo,
+    "review_jobrun_repo": ReviewJobRunRepo,
+    "review_request_repo": ReviewRequestRepo,
+}
+
+
+# ------------------------------------------------------------------------------------------------ #
+def before(pages: int) -> float:
+    """Returns seconds per page when each access constructs a repository from a parsed file."""
+    start = time.perf_counter()
+    for _ in range(pages):
+        for name in PAGE_ACCESSES:
+            IOService.read(os.getenv("PERSISTENCE_CONFIG"))
+            REPOS[name](database=None)
+    return (time.perf_counter() - start) / pages
+
+
+def after(pages: int) -> float:
+    """Returns seconds per page when repositories are served from the unit of work cache."""
+    uow = UoW(database=None, **REPOS)
+    start = time.perf_counter()
+    for _ in range(pages):
+        for name in PAGE_ACCESSES:
+            getattr(uow, name)
+    return (time.perf_counter() - start) / pages
+
+
+# ------------------------------------------------------------------------------------------------ #
+def main(args: list = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-p", "--pages", type=int, default=1000, help="Pages to simulate."
+    )
+    parsed = parser.parse_args(args)
+    os.environ.setdefault("PERSISTENCE_CONFIG", "config/persistence.yml")
+
+    baseline = before(pages=parsed.pages)
+    cached = after(pages=parsed.pages)
+    print(f"Repository access overhead per page over {parsed.pages} pages:")
+    print(f"\tbefore: {baseline * 1e6:10.1f} us")
+    print(f"\tafter:  {cached * 1e6:10.1f} us")
+    print(f"\tspeedup: {baseline / cached:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
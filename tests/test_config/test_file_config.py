@@ -17,10 +17,12 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import inspect
+import os
 from datetime import datetime
 import pytest
 import logging
 
+from appvoc.config import ConfigCache
 from appvoc.infrastructure.file.config import FileConfig
 
 
@@ -100,3 +102,45 @@ class TestFileConfig:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_cache(self, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        assert FileConfig()._config is FileConfig()._config
+
+        filepath = str(tmp_path / "config.yml")
+        with open(filepath, "w") as f:
+            f.write("file:\n  archive: a\n")
+        config = ConfigCache.read(filepath)
+        assert config["file"]["archive"] == "a"
+        assert ConfigCache.read(filepath) is config
+
+        with open(filepath, "w") as f:
+            f.write("file:\n  archive: b\n")
+        mtime = os.stat(filepath).st_mtime_ns + 1000000000
+        os.utime(filepath, ns=(mtime, mtime))
+        assert ConfigCache.read(filepath)["file"]["archive"] == "b"
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.11                                                                             #
+# Filename   : /tests/test_data_acquisition/test_builder.py                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 08:14:37 pm                                              #
+# Modified   : Saturday October 17th 2026 08:14:37 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import pandas as pd
+
+from appvoc.data.acquisition.builder import ColumnarBuilder
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.builder
+class TestColumnarBuilder:  # pragma: no cover
+    # ============================================================================================ #
+    def test_to_frame(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        builder = ColumnarBuilder(
+            columns=("id", "category", "date"),
+            dtypes={"category": "category"},
+            dates=("date",),
+        )
+        builder.append(("1", "Business", "2023-06-30T08:40:33-07:00"))
+        builder.append(("2", "Business", "2023-07-01T10:00:00Z"))
+        builder.append(("3", "Health", "not a date"))
+        assert len(builder) == 3
+
+        df = builder.to_frame(constants={"app_id": "123", "app_name": None})
+        assert list(df.columns) == ["app_id", "app_name", "id", "category", "date"]
+        assert isinstance(df["app_id"].dtype, pd.CategoricalDtype)
+        assert (df["app_id"] == "123").all()
+        assert df["app_name"].isna().all()
+        assert isinstance(df["category"].dtype, pd.CategoricalDtype)
+        assert df["date"].iloc[0] == pd.Timestamp("2023-06-30 08:40:33")
+        assert pd.isna(df["date"].iloc[2])
+
+        assert len(builder) == 3
+        builder.clear()
+        assert len(builder) == 0
+        assert len(builder.to_frame()) == 0
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
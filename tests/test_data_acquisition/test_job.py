@@ -25,6 +25,7 @@ import pandas as pd
 from uuid import uuid4
 
 from appvoc.data.acquisition.base import Job
+from appvoc.data.acquisition.rating.director import RatingDirector
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -151,6 +152,133 @@ class TestJob:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    def test_claim_lease(self, job_repo, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        job1 = job_repo.claim(controller="RatingController", worker="worker1")
+        job2 = job_repo.claim(controller="RatingController", worker="worker2")
+        assert isinstance(job1, Job)
+        assert isinstance(job2, Job)
+        assert job1.id != job2.id
+        assert job1.leased_by.startswith("worker1/")
+        assert job_repo.renew(job=job1)
+        progress = job_repo.progress(controller="RatingController")
+        assert progress["leased"] == 2
+        assert sum(progress[k] for k in ("complete", "leased", "pending")) == progress["jobs"]
+        # A released job is available to other workers, and the lease cannot be renewed.
+        job_repo.release(job=job1)
+        assert not job_repo.renew(job=job1)
+        job_repo.release(job=job2)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_replace(self, job_df, job_repo, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Jobs read from file have no lease columns. Replacing retains the migrated table.
+        data = job_df.drop(columns=["leased_by", "lease_expires"], errors="ignore")
+        job_repo.replace(data=data)
+        job_repo.save()
+        df = job_repo.getall()
+        assert df.shape[0] == data.shape[0]
+        assert {"leased_by", "lease_expires"}.issubset(df.columns)
+        job = job_repo.claim(controller="RatingController", worker="worker1")
+        assert isinstance(job, Job)
+        job_repo.release(job=job)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_lost_lease(self, container, job_repo, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # With no lease, each heartbeat renews the lease.
+        director = RatingDirector(uow=container.data.uow(), lease=0)
+        jobrun = director.next()
+        assert director.heartbeat()
+        assert not director.lost
+        # The job is completed elsewhere, so the lease is lost.
+        job = job_repo.get(id=jobrun.jobid)
+        job.end(completed=datetime.now())
+        job_repo.update(job=job)
+        assert not director.heartbeat()
+        assert director.lost
+        assert not director.end_job(completed=datetime.now())
+        # Claiming the next job clears the lost lease, and a held job can be ended.
+        jobrun = director.next()
+        assert not director.lost
+        assert director.end_job(completed=datetime.now())
+        assert job_repo.get(id=jobrun.jobid).complete
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_next_update(self, job_df, job_repo, caplog):
         start = datetime.now()
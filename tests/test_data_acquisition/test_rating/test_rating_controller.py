@@ -173,3 +173,59 @@ class TestRatingCtrl:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.asyncio
+    async def test_ctrl_pipelined(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Reset jobs, job runs and ratings
+        df = IOService.read(FP_JOBS)
+        repo = container.data.job_repo()
+        repo.replace(data=df)
+        repo = container.data.rating_jobrun_repo()
+        repo.reset(force=True)
+        repo = container.data.rating_repo()
+        repo.delete_all()
+
+        ctrl = RatingController(
+            batchsize=5, verbose=1, failure_threshold=2, pipelined=True, queue_size=2
+        )
+        await ctrl.scrape()
+
+        repo = container.data.rating_repo()
+        df = repo.getall()
+        assert isinstance(df, pd.DataFrame)
+        assert df.shape[0] > 1
+
+        repo = container.data.rating_jobrun_repo()
+        df = repo.getall()
+        assert sum(df["complete"]) == df.shape[0]
+
+        repo = container.data.job_repo()
+        df = repo.getall()
+        assert sum(df["complete"]) == df.shape[0]
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -54,13 +54,13 @@ class TestRatingScraper:  # pragma: no cover
         df = repo.sample(10)
 
         async for result in RatingScraper(apps=df, batch_size=5):
-            assert isinstance(result.content, list)
+            assert len(result.content) == result.apps
             assert result.apps + result.errors == 5
             assert isinstance(result.size, int)
-            for data in result.content:
-                for key in KEYS:
-                    assert key in data
-                logger.debug(data)
+            data = result.get_result()
+            for key in KEYS:
+                assert key in data.columns
+            logger.debug(data)
 
             logger.debug(result.get_result())
             logger.debug(result)
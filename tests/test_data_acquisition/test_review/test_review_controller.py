@@ -193,3 +193,53 @@ class TestReviewCtrl:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.asyncio
+    async def test_ctrl_async(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Reset job to complete is False
+        repo = container.data.job_repo()
+        job = repo.get(id="review-6002")
+        job.complete = False
+        repo.update(job=job)
+
+        # Get current latest index
+        repo = container.data.review_request_repo()
+        request = repo.get(id="284815942")
+        idx = request.last_index
+
+        ctrl = ReviewController(max_pages=4, verbose=1, concurrency=2)
+        await ctrl.ascrape()
+
+        request = repo.get(id="284815942")
+        assert request.last_index > idx
+
+        repo = container.data.job_repo()
+        job = repo.get(id="review-6002")
+        assert job.complete == True  # noqa
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
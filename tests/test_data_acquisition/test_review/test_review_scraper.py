@@ -109,12 +109,11 @@ class TestReviewScraper:  # pragma: no cover
                     assert isinstance(result, ReviewResponse)
                     assert result.app == app
                     assert result.reviews > 0
-                    assert isinstance(result.content, list)
+                    assert isinstance(result.content, pd.DataFrame)
                     assert isinstance(result.get_result(), pd.DataFrame)
                     assert isinstance(result.index, int)
-                    for review in result.content:
-                        for key in KEYS:
-                            assert key in review
+                    assert list(result.get_result().columns) == KEYS
+                    assert len(result.get_result()) == result.reviews
 
         # ---------------------------------------------------------------------------------------- #
         end = datetime.now()
@@ -19,11 +19,13 @@
 import inspect
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pandas as pd
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.mysql import VARCHAR
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -138,6 +140,190 @@ class TestMySQLDatabase:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    @pytest.mark.parametrize("method", ["to_sql", "multi", "executemany"])
+    def test_insert_bulk(self, method, container, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.data.db()
+        with db as connection:
+            connection.execute(query="DROP TABLE IF EXISTS iris_bulk;")
+            rows = connection.insert(
+                data=dataframe, tablename="iris_bulk", method=method, chunksize=7
+            )
+            assert rows == dataframe.shape[0]
+            # Second append uses the cached table rather than inspecting the schema.
+            rows = connection.insert(
+                data=dataframe, tablename="iris_bulk", method=method, chunksize=7
+            )
+            assert rows == dataframe.shape[0]
+            df = connection.query(query="SELECT * FROM iris_bulk;")
+            assert df.shape == (2 * dataframe.shape[0], dataframe.shape[1])
+            connection.execute(query="DROP TABLE IF EXISTS iris_bulk;")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.parametrize("keep", ["first", "last"])
+    def test_dedup(self, keep, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        first = pd.DataFrame({"id": [str(i) for i in range(10)], "version": 1})
+        last = pd.DataFrame({"id": [str(i) for i in range(5)], "version": 2})
+        db = container.data.db()
+        with db as connection:
+            connection.execute(query="DROP TABLE IF EXISTS dedup;")
+            connection.insert(
+                data=first, tablename="dedup", dtype={"id": VARCHAR(8)}, method="to_sql"
+            )
+            connection.insert(data=last, tablename="dedup", method="to_sql")
+            before, after = connection.dedup(
+                tablename="dedup", subset="id", keep=keep, order_by="version"
+            )
+            assert before == 15
+            assert after == 10
+            df = connection.query(query="SELECT * FROM dedup WHERE id < '5';")
+            assert (df["version"] == (1 if keep == "first" else 2)).all()
+            connection.execute(query="DROP TABLE IF EXISTS dedup;")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.parametrize("method", ["to_sql", "executemany"])
+    def test_upsert(self, method, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        first = pd.DataFrame({"id": [str(i) for i in range(10)], "version": 1})
+        last = pd.DataFrame({"id": [str(i) for i in range(5)], "version": 2})
+        db = container.data.db()
+        with db as connection:
+            connection.execute(query="DROP TABLE IF EXISTS upsert;")
+            connection.upsert(
+                data=first, tablename="upsert", dtype={"id": VARCHAR(8)}, method=method
+            )
+            assert connection.upsert(data=last, tablename="upsert", method=method) == 5
+            df = connection.query(query="SELECT * FROM upsert;")
+            assert df.shape[0] == 10
+            assert (df.loc[df["id"] < "5", "version"] == 2).all()
+            with pytest.raises(ValueError):
+                connection.upsert(data=last, tablename="upsert", method="bulk")
+            connection.execute(query="DROP TABLE IF EXISTS upsert;")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_threads(self, container, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.data.db()
+        db.execute(query="DROP TABLE IF EXISTS iris_threads;")
+        db.insert(data=dataframe.head(0), tablename="iris_threads")
+        db.commit()
+
+        def write(chunk: pd.DataFrame) -> int:
+            # Each thread checks out its own connection and commits independently.
+            db.insert(data=chunk, tablename="iris_threads")
+            db.commit()
+            connection = id(db._connection)
+            db.close()
+            return connection
+
+        chunks = [dataframe.iloc[i::4] for i in range(4)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            connections = list(executor.map(write, chunks))
+        assert id(db._connection) not in connections
+
+        df = db.query(query="SELECT * FROM iris_threads;")
+        assert df.shape[0] == dataframe.shape[0]
+        db.execute(query="DROP TABLE IF EXISTS iris_threads;")
+        db.commit()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_properties(self, container, caplog):
         start = datetime.now()
@@ -16,12 +16,15 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+import asyncio
 import inspect
 from datetime import datetime
 import pytest
 import logging
 
+from appvoc.infrastructure.web.asession import ASessionHandler
 from appvoc.infrastructure.web.headers import STOREFRONT
+from appvoc.infrastructure.web.transport import TRANSPORTS, HTTP2Transport
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -66,3 +69,139 @@ class TestASession:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.asyncio
+    async def test_asession_lifetime(self, container, urls, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        async with container.web.asession() as session:
+            assert session.is_open
+            client = await session.open()
+            for _ in range(2):
+                responses = await session.get(urls, headers=STOREFRONT["headers"])
+                assert len(responses) == len(urls)
+                # The same client session serves every batch.
+                assert await session.open() is client
+        assert not session.is_open
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.asyncio
+    async def test_http2_transport(self, container, urls, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        handler = ASessionHandler(
+            throttle=container.web.athrottle(),
+            headers=container.web.browser_headers(),
+            transport="http2",
+        )
+        assert isinstance(handler.transport, HTTP2Transport)
+        async with handler as session:
+            responses = await session.get(urls, headers=STOREFRONT["headers"])
+            assert len(responses) == len(urls)
+            for response in responses:
+                assert isinstance(response, dict)
+                assert "adamId" in response
+        assert not handler.is_open
+
+        with pytest.raises(ValueError):
+            ASessionHandler(
+                throttle=container.web.athrottle(),
+                headers=container.web.browser_headers(),
+                transport="http3",
+            )
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.parametrize("transport", list(TRANSPORTS))
+    def test_transport_loop_change(self, transport, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Clients left open by a prior event loop are closed when replaced in a new loop.
+        client = TRANSPORTS[transport]()
+        opened = []
+
+        async def open(close: bool) -> None:
+            await client.open()
+            if transport == "http1":
+                opened.append(client._session)
+            else:
+                opened.append(client._get_client())
+            if close:
+                await client.close()
+
+        asyncio.run(open(close=False))
+        asyncio.run(open(close=True))
+        assert len(opened) == 2
+        assert opened[0] is not opened[1]
+        for session in opened:
+            assert session.closed if transport == "http1" else session.is_closed
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
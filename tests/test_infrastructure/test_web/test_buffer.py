@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.11                                                                             #
+# Filename   : /tests/test_infrastructure/test_web/test_buffer.py                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 10:40:12 am                                              #
+# Modified   : Saturday October 17th 2026 10:40:12 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import numpy as np
+
+from appvoc.infrastructure.web.buffer import RingBuffer
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.buffer
+class TestRingBuffer:  # pragma: no cover
+    # ============================================================================================ #
+    def test_statistics(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        buffer = RingBuffer(capacity=10)
+        assert len(buffer) == 0
+        assert np.isnan(buffer.mean)
+        values = np.random.default_rng(42).exponential(scale=0.5, size=95)
+        for i, value in enumerate(values, start=1):
+            buffer.append(value)
+            window = values[max(0, i - 10) : i]
+            assert len(buffer) == len(window)
+            assert np.allclose(buffer.values, window)
+            assert np.isclose(buffer.mean, np.mean(window))
+            assert np.isclose(buffer.std, np.std(window))
+            assert np.isclose(buffer.sum, np.sum(window))
+            assert buffer.min == np.min(window)
+            assert buffer.max == np.max(window)
+        assert buffer.full
+        assert np.allclose(
+            buffer.quantile([0.5, 0.95, 0.99]), np.quantile(values[-10:], [0.5, 0.95, 0.99])
+        )
+        assert buffer.count_above(0.5) == np.count_nonzero(values[-10:] > 0.5)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_wrap_and_clear(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        buffer = RingBuffer(capacity=3)
+        for value in (1, 2, 3, 4):
+            buffer.append(value)
+        assert list(buffer) == [2, 3, 4]
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.count_above(0) == 0
+        assert np.isnan(buffer.quantile(0.5))
+        buffer.append(5)
+        assert buffer.mean == 5
+        assert buffer.var == 0
+        with pytest.raises(ValueError):
+            RingBuffer(capacity=0)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
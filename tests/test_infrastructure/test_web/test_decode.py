@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.11                                                                             #
+# Filename   : /tests/test_infrastructure/test_web/test_decode.py                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 07:31:54 pm                                              #
+# Modified   : Saturday October 17th 2026 07:31:54 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import json
+from datetime import datetime
+import pytest
+import logging
+import requests
+
+from appvoc.infrastructure.web import decode as decoder
+from appvoc.infrastructure.web.decode import Payload, decode, load_payload
+from appvoc.infrastructure.web.utils import getsize
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+BODY = {"userReviewList": [{"userReviewId": "1", "rating": 5}]}
+
+
+def response(content: bytes, headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.mark.decode
+class TestDecode:  # pragma: no cover
+    # ============================================================================================ #
+    def test_decode_once(self, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        calls = []
+        loads = decoder.loads
+        monkeypatch.setattr(
+            decoder, "loads", lambda content: calls.append(1) or loads(content)
+        )
+        r = response(json.dumps(BODY).encode())
+        assert decode(r) == BODY
+        assert decode(r) is decode(r)
+        assert len(calls) == 1
+        assert decode(BODY) is BODY
+        with pytest.raises(ValueError):
+            decode(response(b"<html></html>"))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_getsize(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        content = json.dumps(BODY).encode()
+        assert getsize(response(content)) == len(content)
+        assert getsize(response(content, headers={"content-length": "12"})) == 12
+
+        payload = load_payload(content)
+        assert isinstance(payload, Payload)
+        assert payload == BODY
+        assert getsize(payload) == len(content)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
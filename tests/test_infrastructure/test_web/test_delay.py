@@ -16,14 +16,16 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+import asyncio
 import inspect
+import time
 from datetime import datetime
 import pytest
 import logging
 from time import sleep
 import numpy as np
 
-from appvoc.infrastructure.web.throttle import AThrottle
+from appvoc.infrastructure.web.throttle import AThrottle, LatencyThrottle
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -85,6 +87,110 @@ class TestDelay:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    @pytest.mark.asyncio
+    async def test_adelay(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        throttle = AThrottle(
+            burnin_period=5,
+            burnin_reset=20,
+            burnin_rate=20,
+            rolling_window_size=5,
+            rate=50,
+            verbose=5,
+        )
+
+        async def request():
+            wait = await throttle.adelay()
+            token = throttle.start()
+            await asyncio.sleep(np.random.rand() / 10)
+            return wait, throttle.stop(token)
+
+        begin = time.monotonic()
+        results = await asyncio.gather(*[request() for _ in range(40)])
+        elapsed = time.monotonic() - begin
+        waits = [wait for wait, _ in results]
+        latencies = [latency for _, latency in results]
+        # Starts are paced on a shared timeline at roughly 5 at 20/s then 35 at 50/s, ~0.95s.
+        assert elapsed >= max(waits) > 0
+        assert 0.3 < elapsed < 5
+        # Latencies are measured per request, and are not inflated by a blocked event loop.
+        assert all(latency < 0.2 for latency in latencies)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.asyncio
+    async def test_measure(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for throttle in (AThrottle(latency_buffer_size=10), LatencyThrottle(latency_buffer_size=10)):
+            assert throttle.percentiles["p50"] is None
+
+            async def request(latency: float):
+                with throttle.measure():
+                    await asyncio.sleep(latency)
+
+            # Overlapping requests each record their own latency.
+            await asyncio.gather(*[request(0.05 * (i % 4 + 1)) for i in range(12)])
+            assert len(throttle._latency_buffer) == 10
+            assert min(throttle._latency_buffer) >= 0.05
+            assert max(throttle._latency_buffer) < 0.25
+            percentiles = throttle.percentiles
+            assert percentiles["p50"] <= percentiles["p95"] <= percentiles["p99"]
+            logger.info(percentiles)
+
+            # Failed requests are not recorded.
+            with pytest.raises(ValueError):
+                with throttle.measure():
+                    raise ValueError
+            assert len(throttle._latency_buffer) == 10
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_something(self, caplog):
         start = datetime.now()
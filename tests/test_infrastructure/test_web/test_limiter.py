@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.11                                                                             #
+# Filename   : /tests/test_infrastructure/test_web/test_limiter.py                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 09:24:10 pm                                              #
+# Modified   : Saturday October 17th 2026 09:24:10 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import aiohttp
+
+from appvoc.infrastructure.web.limiter import AIMDLimiter
+from appvoc.infrastructure.web.transport import AiohttpTransport
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.limiter
+class TestAIMDLimiter:  # pragma: no cover
+    # ============================================================================================ #
+    def test_aimd(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        limiter = AIMDLimiter(initial=4, min_limit=1, max_limit=8, window=5)
+        # Additive increase of about one per round of 'limit' successes.
+        for _ in range(5):
+            limiter.succeed(latency=0.1)
+        assert limiter.limit == 5
+        for _ in range(100):
+            limiter.succeed(latency=0.1)
+        assert limiter.limit == 8
+        # Multiplicative decrease on overload, at most once per round.
+        limiter.fail(overloaded=True)
+        assert limiter.limit == 4
+        limiter.fail(overloaded=True)
+        assert limiter.limit == 4
+        # Failures that do not signal overload leave the limit unchanged.
+        for _ in range(10):
+            limiter.fail(overloaded=False)
+        assert limiter.limit == 4
+        limiter.fail(overloaded=True)
+        assert limiter.limit == 2
+        assert limiter.metrics["decreases"] == 2
+
+        with pytest.raises(ValueError):
+            AIMDLimiter(min_limit=10, max_limit=5)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_latency_inflation(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        limiter = AIMDLimiter(initial=20, max_limit=20, window=5, latency_tolerance=2)
+        for _ in range(40):
+            limiter.succeed(latency=0.1)
+        assert limiter.limit == 20
+        assert limiter.baseline == pytest.approx(0.1)
+        for _ in range(5):
+            limiter.succeed(latency=1.0)
+        assert limiter.limit == 10
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.asyncio
+    async def test_slots(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        limiter = AIMDLimiter(initial=3, max_limit=3)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.inflight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[request() for _ in range(20)])
+        assert peak == 3
+        assert limiter.inflight == 0
+
+        transport = AiohttpTransport()
+        error = aiohttp.ClientResponseError(None, (), status=429)
+        assert transport.overloaded(error)
+        error = aiohttp.ClientResponseError(None, (), status=404)
+        assert not transport.overloaded(error)
+        assert transport.overloaded(asyncio.TimeoutError())
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
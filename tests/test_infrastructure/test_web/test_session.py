@@ -78,3 +78,46 @@ class TestSession:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_connection_reuse(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        session = container.web.session()
+        for _ in range(3):
+            response = session.get(url=URL, params=PARAMS)
+            assert response.status_code == 200
+
+        stats = session.stats
+        logger.debug(stats)
+        assert stats["sessions"] == 1
+        assert stats["requests"] >= 3
+        assert stats["reused_connections"] > 0
+        assert stats["new_connections"] < stats["requests"]
+
+        session.close()
+        assert session.stats["sessions"] == 0
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
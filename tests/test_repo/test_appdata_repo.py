@@ -25,6 +25,7 @@ import pytest
 
 from appvoc.data.dataset.app import AppDataDataset
 from appvoc.data.repo.app import AppDataRepo
+from appvoc.data.repo.predicate import Eq, In, Range
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -265,6 +266,53 @@ class TestAppDataRepo:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    def test_find(self, app_repo, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = app_repo
+        columns = ["id", "name", "category_id", "category", "ratings"]
+        df = repo.find(columns=columns, filters=[Eq("category_id", CATEGORY_ID)])
+        assert df.shape == (3, 5)
+        assert list(df.columns) == columns
+        assert repo.find(columns=["id"]).shape[0] == repo.count()
+
+        df = repo.find(
+            columns=["id", "ratings"],
+            filters=[Range("ratings", lower=20, inclusive="neither")],
+        )
+        assert (df["ratings"] > 20).all()
+
+        ids = list(df["id"].values[:2])
+        df = repo.find(columns=["id"], filters=[In("id", ids)])
+        assert sorted(df["id"].values) == sorted(ids)
+        assert repo.find(columns=["id"], filters=[In("id", [])]).shape[0] == 0
+        logger.debug(df)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_getids(self, app_repo, caplog):
         start = datetime.now()
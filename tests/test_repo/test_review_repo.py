@@ -80,6 +80,47 @@ class TestReviewRepo:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    def test_load_idempotent(self, container, review, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        with container.data.db() as db:
+            repo = ReviewRepo(database=db)
+            # Reloading the same reviews upserts rather than appends.
+            repo.load(data=review)
+            repo.load(data=review)
+            assert repo.count() == 10
+            # Reloading a changed review updates it in place.
+            changed = review.head(1).copy()
+            changed["vote_count"] = 9999
+            repo.load(data=changed)
+            assert repo.count() == 10
+            assert repo.get(id=changed["id"].values[0]).vote_count == 9999
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_info(self, container, caplog):
         start = datetime.now()
@@ -188,6 +229,46 @@ class TestReviewRepo:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    def test_iter(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        with container.data.db() as db:
+            repo = ReviewRepo(database=db)
+            chunks = list(repo.iter_all(chunksize=3))
+            assert [chunk.shape[0] for chunk in chunks] == [3, 3, 3, 1]
+            df = pd.concat(chunks, ignore_index=True)
+            assert df.dtypes.equals(repo.getall().dtypes)
+
+            chunks = list(repo.iter_by_category(category_id=CATEGORY_ID, chunksize=3))
+            df = pd.concat(chunks, ignore_index=True)
+            assert df.shape[0] == repo.get_by_category(category_id=CATEGORY_ID).shape[0]
+            assert (df["category_id"].astype(str) == str(CATEGORY_ID)).all()
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_get_by_category(self, container, caplog):
         start = datetime.now()
@@ -373,6 +454,11 @@ class TestReviewRepo:  # pragma: no cover
             assert "Category" in summary.columns
             assert "Reviews" in summary.columns
             assert "Apps" in summary.columns
+            # Aggregates computed in the database match those computed in pandas.
+            df = repo.getall()
+            expected = df.groupby("category")["id"].nunique()
+            assert summary.set_index("Category")["Reviews"].to_dict() == expected.to_dict()
+            assert summary["Reviews"].sum() == repo.count()
 
         # ---------------------------------------------------------------------------------------- #
         end = datetime.now()
@@ -241,3 +241,42 @@ class TestReviewRequestRepo:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_get_requests_upsert(self, container, review_request, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = container.data.review_request_repo()
+        requests = repo.get_requests(category_id=review_request.category_id)
+        assert isinstance(requests, dict)
+        assert review_request.id in requests
+
+        request = requests[review_request.id]
+        request.last_index += 400
+        assert repo.upsert_requests(requests=[request]) == 1
+        assert repo.get(id=request.id).last_index == request.last_index
+        assert repo.upsert_requests(requests=[]) == 0
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -22,6 +22,7 @@ from datetime import datetime
 
 import pytest
 
+from appvoc.data.acquisition.review.job import ReviewJobRun
 from appvoc.data.repo.base import Repo
 from appvoc.infrastructure.database.base import Database
 
@@ -295,6 +296,91 @@ class TestUoW:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    def test_buffer(self, container, app, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        uow = container.data.uow()
+        count = uow.app_repo.count()
+        uow.buffer(repo="app_repo", data=app)
+        assert uow.pending == len(app)
+        assert uow.app_repo.count() == count
+        assert uow.flush() == len(app)
+        assert uow.pending == 0
+        assert uow.flush() == 0
+        with pytest.raises(ValueError):
+            uow.buffer(repo="database", data=app)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_defer(self, container, app, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        uow = container.data.uow()
+        jobrun = ReviewJobRun(jobid="defer", category_id=CATEGORY_ID)
+        jobrun.start()
+        uow.review_jobrun_repo.add(jobrun=jobrun)
+        uow.save()
+        jobrun.apps = 5
+        uow.defer(repo="review_jobrun_repo", key=jobrun.id, jobrun=jobrun)
+        # The deferred update is written with the buffered rows.
+        assert uow.review_jobrun_repo.get(id=jobrun.id).apps == 0
+        uow.buffer(repo="app_repo", data=app)
+        assert uow.flush() == len(app)
+        assert uow.review_jobrun_repo.get(id=jobrun.id).apps == 5
+        # Deferred updates are written when no rows are buffered.
+        jobrun.apps = 6
+        uow.defer(repo="review_jobrun_repo", key=jobrun.id, jobrun=jobrun)
+        assert uow.flush() == 0
+        assert uow.review_jobrun_repo.get(id=jobrun.id).apps == 6
+        with pytest.raises(ValueError):
+            uow.defer(repo="database", key=jobrun.id, jobrun=jobrun)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_count(self, container, caplog):
         start = datetime.now()